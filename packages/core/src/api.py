@@ -2,17 +2,94 @@
 
 from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 from pydantic import BaseModel, Field
 from typing import Optional, List, Literal
-import tempfile
-import subprocess
-from pathlib import Path
+from collections import OrderedDict
+import asyncio
 import base64
-import io
+import hashlib
+import json
+import random
 
-from generate import parse_range, generate_typst_file
+from generate import number_range, shuffle_numbers, flashcards_typst_inputs
+from typst_worker import TypstWorkerPool
 
-app = FastAPI(title="Soroban Flashcard Generator API")
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson serializes the large base64 PDF field much faster than stdlib json
+app = FastAPI(
+    title="Soroban Flashcard Generator API",
+    default_response_class=ORJSONResponse if orjson is not None else JSONResponse,
+)
+
+# Long-lived Typst workers shared by all requests
+typst_pool = TypstWorkerPool()
+
+# Upper bound on memory used by cached PDFs
+PDF_CACHE_MAX_BYTES = 100 * 1024 * 1024
+
+# Most jobs one /generate-batch request may queue on the worker pool
+MAX_BATCH_JOBS = 50
+
+class PdfCache:
+    """LRU cache of compiled PDFs, bounded by total size in bytes"""
+    
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._entries = OrderedDict()
+    
+    @staticmethod
+    def key(typst_inputs):
+        """Hash the Typst inputs, which fully determine the compiled PDF"""
+        payload = json.dumps(typst_inputs, sort_keys=True).encode('utf-8')
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+    
+    def get(self, key):
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+    
+    def put(self, key, value):
+        if len(value) > self.max_bytes or key in self._entries:
+            return
+        self._entries[key] = value
+        self.total_bytes += len(value)
+        while self.total_bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.total_bytes -= len(evicted)
+
+pdf_cache = PdfCache(PDF_CACHE_MAX_BYTES)
+
+async def compile_cached(typst_inputs):
+    """Compile flashcards, reusing the PDF bytes of an identical recent request
+    
+    Only raw bytes are cached, so each PDF counts against the budget once;
+    use compile_cached_base64 for JSON responses.
+    """
+    key = PdfCache.key(typst_inputs)
+    result = pdf_cache.get(key)
+    if result is None:
+        result = await typst_pool.compile(typst_inputs)
+        pdf_cache.put(key, result)
+    return result
+
+def encode_pdf(pdf_bytes):
+    """Base64-encode a PDF for a JSON response"""
+    return base64.b64encode(pdf_bytes).decode('ascii')
+
+async def compile_cached_base64(typst_inputs):
+    """Like compile_cached, but base64-encoded in a thread
+    
+    The encode is CPU-bound, so it runs off the event loop.
+    """
+    pdf_bytes = await compile_cached(typst_inputs)
+    return await asyncio.to_thread(encode_pdf, pdf_bytes)
 
 # Enable CORS for web apps
 app.add_middleware(
@@ -51,93 +128,131 @@ class FlashcardRequest(BaseModel):
     colored_numerals: bool = False
     scale_factor: float = Field(0.9, ge=0.1, le=1.0)
     format: Literal["pdf", "base64"] = Field("base64", description="Return format")
+    include_pdf: bool = Field(True, description="Include the base64 PDF; set false to fetch only count and numbers")
+
+@app.on_event("startup")
+async def start_typst_pool():
+    """Start the Typst workers before serving requests"""
+    typst_pool.start()
+
+@app.on_event("shutdown")
+async def stop_typst_pool():
+    """Stop the Typst workers"""
+    typst_pool.shutdown()
+
+class BatchRequest(BaseModel):
+    """Request model for generating several flashcard sets at once"""
+    jobs: List[FlashcardRequest] = Field(..., description="Flashcard sets to generate")
+
+def build_typst_inputs(request: FlashcardRequest):
+    """Return the numbers and Typst sys.inputs for a flashcard request"""
+    # Parse numbers; contiguous ranges stay a lazy range object until
+    # they are joined into the Typst inputs
+    numbers = number_range(request.range, request.step)
+    
+    if request.shuffle:
+        # Per-request generator so concurrent requests don't share seeds
+        rng = random.Random(request.seed)
+        numbers = shuffle_numbers(numbers, request.range, request.step, rng=rng)
+    
+    # Build config
+    config = {
+        'cards_per_page': request.cards_per_page,
+        'paper_size': request.paper_size,
+        'orientation': request.orientation,
+        'margins': request.margins,
+        'gutter': request.gutter,
+        'show_cut_marks': request.show_cut_marks,
+        'show_registration': request.show_registration,
+        'font_family': request.font_family,
+        'font_size': request.font_size,
+        'columns': request.columns,
+        'show_empty_columns': request.show_empty_columns,
+        'hide_inactive_beads': request.hide_inactive_beads,
+        'bead_shape': request.bead_shape,
+        'color_scheme': request.color_scheme,
+        'colored_numerals': request.colored_numerals,
+        'scale_factor': request.scale_factor,
+    }
+    
+    return numbers, flashcards_typst_inputs(numbers, config)
 
 @app.post("/generate")
 async def generate_flashcards(request: FlashcardRequest):
     """Generate flashcards and return as PDF bytes or base64"""
     
     try:
-        # Parse numbers
-        numbers = parse_range(request.range, request.step)
+        # Compile in a warm Typst worker, or reuse a cached identical PDF
+        numbers, typst_inputs = build_typst_inputs(request)
         
-        if request.shuffle:
-            import random
-            if request.seed is not None:
-                random.seed(request.seed)
-            random.shuffle(numbers)
-        
-        # Build config
-        config = {
-            'cards_per_page': request.cards_per_page,
-            'paper_size': request.paper_size,
-            'orientation': request.orientation,
-            'margins': request.margins,
-            'gutter': request.gutter,
-            'show_cut_marks': request.show_cut_marks,
-            'show_registration': request.show_registration,
-            'font_family': request.font_family,
-            'font_size': request.font_size,
-            'columns': request.columns,
-            'show_empty_columns': request.show_empty_columns,
-            'hide_inactive_beads': request.hide_inactive_beads,
-            'bead_shape': request.bead_shape,
-            'color_scheme': request.color_scheme,
-            'colored_numerals': request.colored_numerals,
-            'scale_factor': request.scale_factor,
-        }
-        
-        # Create temp files
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir_path = Path(tmpdir)
-            temp_typst = tmpdir_path / "flashcards.typ"
-            temp_pdf = tmpdir_path / "flashcards.pdf"
-            
-            # Generate Typst file
-            generate_typst_file(numbers, config, temp_typst)
-            
-            # Find project root and copy template
-            project_root = Path(__file__).parent.parent
-            templates_dir = project_root / "templates"
-            
-            # Copy templates to temp dir for imports to work
-            import shutil
-            temp_templates = tmpdir_path / "templates"
-            shutil.copytree(templates_dir, temp_templates)
-            
-            # Compile with Typst
-            result = subprocess.run(
-                ["typst", "compile", str(temp_typst), str(temp_pdf)],
-                capture_output=True,
-                text=True,
-                cwd=str(tmpdir_path)
-            )
-            
-            if result.returncode != 0:
-                raise HTTPException(status_code=500, detail=f"Typst compilation failed: {result.stderr}")
-            
-            # Read PDF
-            with open(temp_pdf, "rb") as f:
-                pdf_bytes = f.read()
-            
-            # Return based on format
-            if request.format == "pdf":
-                return Response(
-                    content=pdf_bytes,
-                    media_type="application/pdf",
-                    headers={
-                        "Content-Disposition": "attachment; filename=flashcards.pdf"
-                    }
-                )
-            else:  # base64
-                return {
-                    "pdf": base64.b64encode(pdf_bytes).decode('utf-8'),
-                    "count": len(numbers),
-                    "numbers": numbers[:100]  # Limit preview
+        # Return based on format
+        if request.format == "pdf":
+            pdf_bytes = await compile_cached(typst_inputs)
+            return Response(
+                content=pdf_bytes,
+                media_type="application/pdf",
+                headers={
+                    "Content-Disposition": "attachment; filename=flashcards.pdf"
                 }
+            )
+        else:  # base64
+            payload = {
+                "count": len(numbers),
+                "numbers": list(numbers[:100])  # Limit preview
+            }
+            # Metadata-only callers skip the compile and encode entirely
+            if request.include_pdf:
+                payload["pdf"] = await compile_cached_base64(typst_inputs)
+            return payload
                 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/generate-batch")
+async def generate_flashcards_batch(request: BatchRequest):
+    """Generate several flashcard sets in parallel across the Typst workers
+    
+    Each job is returned base64-encoded, in the order it was submitted.
+    Jobs with include_pdf set to false return only count and numbers.
+    At most MAX_BATCH_JOBS jobs are accepted per request.
+    """
+    
+    if len(request.jobs) > MAX_BATCH_JOBS:
+        raise HTTPException(
+            status_code=422,
+            detail=f"At most {MAX_BATCH_JOBS} jobs per batch, got {len(request.jobs)}"
+        )
+    
+    try:
+        jobs = [build_typst_inputs(job) for job in request.jobs]
+        results = [
+            {
+                "count": len(numbers),
+                "numbers": list(numbers[:100])  # Limit preview
+            }
+            for numbers, _ in jobs
+        ]
+        wanted = [
+            (result, PdfCache.key(typst_inputs), typst_inputs)
+            for job, result, (_, typst_inputs) in zip(request.jobs, results, jobs)
+            if job.include_pdf
+        ]
+        # Identical jobs are compiled and encoded once, then shared
+        unique = {}
+        for _, key, typst_inputs in wanted:
+            unique.setdefault(key, typst_inputs)
+        pdfs = await asyncio.gather(*[
+            compile_cached_base64(typst_inputs)
+            for typst_inputs in unique.values()
+        ])
+        encoded = dict(zip(unique, pdfs))
+        for result, key, _ in wanted:
+            result["pdf"] = encoded[key]
+        return {"results": results}
+    
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
@@ -150,6 +265,7 @@ async def root():
         "name": "Soroban Flashcard Generator API",
         "endpoints": {
             "/generate": "POST - Generate flashcards",
+            "/generate-batch": "POST - Generate several flashcard sets in parallel",
             "/health": "GET - Health check",
             "/docs": "GET - Interactive API documentation"
         }
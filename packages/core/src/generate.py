@@ -4,20 +4,159 @@ import argparse
 import json
 import yaml
 import random
+import re
 import subprocess
 import sys
 import os
 import tempfile
 import shutil
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
+
+# Monorepo root (packages/core/src is three levels below it)
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+TEMPLATES_DIR = PROJECT_ROOT / 'packages' / 'templates'
+FONTS_DIR = PROJECT_ROOT / 'fonts'
+# Checked once per process rather than on every compile
+HAS_FONTS = FONTS_DIR.is_dir()
+
+# Defaults for options merged from the command line and the config file.
+# Read-only so callers can't mutate the shared defaults.
+DEFAULT_CONFIG = MappingProxyType({
+    'cards_per_page': 6,
+    'paper_size': 'us-letter',
+    'orientation': 'portrait',
+    'gutter': '5mm',
+    'show_cut_marks': False,
+    'show_registration': False,
+    'font_family': 'DejaVu Sans',
+    'font_size': '48pt',
+    'show_empty_columns': False,
+    'hide_inactive_beads': False,
+    'bead_shape': 'diamond',
+    'color_scheme': 'monochrome',
+    'color_palette': 'default',
+    'colored_numerals': False,
+    'scale_factor': 0.9,
+    # PNG/SVG specific options
+    'transparent': False,
+    'card_width': '3.5in',
+    'card_height': '2.5in',
+    # Web-specific options
+    'renderer': 'typst',
+    'inline_css': True,
+    'shuffle': False,
+    'seed': None,
+})
+
+# Argparse dest for each config key where the two names differ. A
+# command-line value wins only when it differs from the argparse default.
+CONFIG_ARG_DESTS = MappingProxyType({
+    'show_cut_marks': 'cut_marks',
+    'show_registration': 'registration',
+})
+
+# Place-value color palettes, ones place first - all are colorblind-friendly
+# and tested with deuteranopia/protanopia/tritanopia. Mirrors the
+# color-palettes table in templates/flashcards.typ; the web numerals and
+# the fast SVG renderer both read this one copy.
+COLOR_PALETTES = {
+    # Default palette (current colors - moderately colorblind friendly)
+    'default': (
+        "#2E86AB",  # ones - blue
+        "#A23B72",  # tens - magenta
+        "#F18F01",  # hundreds - orange
+        "#6A994E",  # thousands - green
+        "#BC4B51",  # ten-thousands - red
+    ),
+    
+    # High contrast colorblind-safe palette
+    'colorblind': (
+        "#0173B2",  # ones - strong blue
+        "#DE8F05",  # tens - orange
+        "#CC78BC",  # hundreds - pink
+        "#029E73",  # thousands - teal green
+        "#D55E00",  # ten-thousands - vermillion
+    ),
+    
+    # Mnemonic palette using color associations for place values
+    'mnemonic': (
+        "#1f77b4",  # ones - BLUE (Blue = Basic/Beginning = ones)
+        "#ff7f0e",  # tens - ORANGE (Orange = Ten commandments = tens)
+        "#2ca02c",  # hundreds - GREEN (Green = Grass/Ground = hundreds)
+        "#d62728",  # thousands - RED (Red = Thousand suns/fire = thousands)
+        "#9467bd",  # ten-thousands - PURPLE (Purple = Prestigious/Premium = ten-thousands)
+    ),
+    
+    # High contrast monochromatic palette (different shades)
+    'grayscale': (
+        "#000000",  # ones - black
+        "#404040",  # tens - dark gray
+        "#808080",  # hundreds - medium gray
+        "#b0b0b0",  # thousands - light gray
+        "#d0d0d0",  # ten-thousands - very light gray
+    ),
+    
+    # Nature-inspired colorblind safe palette
+    'nature': (
+        "#4E79A7",  # ones - sky blue
+        "#F28E2C",  # tens - sunset orange
+        "#E15759",  # hundreds - coral red
+        "#76B7B2",  # thousands - seafoam green
+        "#59A14F",  # ten-thousands - forest green
+    ),
+}
+
+# libyaml's C loader when PyYAML was built with it, else the pure-Python one
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
 
 def load_config(config_path):
-    """Load configuration from JSON or YAML file."""
+    """Load configuration from JSON or YAML file.
+
+    Parsed YAML is cached in a JSON sidecar next to the config file
+    (``<config>.cache.json``), keyed on the YAML file's mtime and size, so
+    repeated runs only pay for a JSON load until the YAML changes.
+    """
+    if not (config_path.endswith('.yaml') or config_path.endswith('.yml')):
+        with open(config_path, 'r') as f:
+            return json.load(f)
+
+    # Size catches edits within one mtime tick on coarse-grained filesystems
+    stat = os.stat(config_path)
+    cache_path = config_path + '.cache.json'
+    try:
+        with open(cache_path, 'r') as f:
+            cached = json.load(f)
+        if cached.get('mtime_ns') == stat.st_mtime_ns and cached.get('size') == stat.st_size:
+            return cached['config']
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+
     with open(config_path, 'r') as f:
-        if config_path.endswith('.yaml') or config_path.endswith('.yml'):
-            return yaml.safe_load(f)
+        config = yaml.load(f, Loader=YAML_LOADER)
+
+    # Only cache configs that survive a JSON round trip unchanged; YAML
+    # dates or non-string keys would otherwise come back altered
+    try:
+        cacheable = json.loads(json.dumps(config)) == config
+    except (TypeError, ValueError):
+        cacheable = False
+
+    # Best effort: the config directory may be read-only
+    try:
+        if cacheable:
+            with open(cache_path, 'w') as f:
+                json.dump({'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'config': config}, f)
         else:
-            return json.load(f)
+            os.remove(cache_path)
+    except OSError:
+        pass
+    return config
+
+# One item of a range string: a number or 'start-end', followed by a comma
+# or the end of the string
+RANGE_ITEM_RE = re.compile(r'\s*(\d+)(?:\s*-\s*(\d+))?\s*(,|$)')
 
 def parse_range(range_str, step=1):
     """Parse a range string like '0-99' or a comma-separated list.
@@ -27,72 +166,127 @@ def parse_range(range_str, step=1):
         '0-10' with step=2 -> [0, 2, 4, 6, 8, 10]
         '0-20' with step=5 -> [0, 5, 10, 15, 20]
         '1,2,5,10' -> [1, 2, 5, 10] (step ignored for lists)
+    
+    Raises ValueError for anything else, including negative numbers.
     """
     numbers = []
-    if ',' in range_str:
-        # Comma-separated list (step is ignored)
-        for part in range_str.split(','):
-            part = part.strip()
-            if '-' in part:
-                start, end = map(int, part.split('-'))
-                numbers.extend(range(start, end + 1, step))
-            else:
-                numbers.append(int(part))
-    elif '-' in range_str:
-        # Range with optional step
-        start, end = map(int, range_str.split('-'))
-        numbers = list(range(start, end + 1, step))
-    else:
-        # Single number
-        numbers = [int(range_str)]
+    pos = 0
+    while True:
+        match = RANGE_ITEM_RE.match(range_str, pos)
+        if match is None:
+            raise ValueError(f"Invalid range: {range_str!r}")
+        start, end, separator = match.groups()
+        if end is None:
+            numbers.append(int(start))
+        else:
+            numbers.extend(range(int(start), int(end) + 1, step))
+        if not separator:
+            return numbers
+        pos = match.end()
+
+def single_range(range_str, step=1):
+    """Return a ``range`` when range_str is exactly one 'start-end' item.
+
+    Uses the same RANGE_ITEM_RE as parse_range, so both accept the same
+    strings. Returns None for lists, single numbers and anything invalid.
+    """
+    match = RANGE_ITEM_RE.fullmatch(range_str)
+    if match is None:
+        return None
+    start, end, separator = match.groups()
+    if end is None or separator:
+        return None
+    return range(int(start), int(end) + 1, step)
+
+def number_range(range_str, step=1):
+    """Like parse_range, but return a lazy ``range`` for a single 'a-b' range.
+
+    A ``range`` supports len(), slicing and iteration without holding one
+    int object per card, which matters for large ranges like '0-99999'.
+    Comma-separated lists and single numbers still return a list.
+    """
+    numbers = single_range(range_str, step)
+    if numbers is not None:
+        return numbers
+    return parse_range(range_str, step)
+
+def shuffle_numbers(numbers, range_str=None, step=1, rng=random):
+    """Return the numbers in random order.
+
+    When the numbers came from a single contiguous range like '0-99', sample
+    straight from the ``range`` object instead of shuffling the materialized
+    list. Comma-separated lists and explicit number lists fall back to
+    ``shuffle``. Pass a ``random.Random`` instance as ``rng`` to avoid
+    touching the global random state.
+    """
+    contiguous = single_range(range_str, step) if range_str else None
+    if contiguous is not None:
+        return rng.sample(contiguous, len(numbers))
+    rng.shuffle(numbers)
     return numbers
 
-def generate_single_card_typst(number, side, config, output_path, project_root):
-    """Generate Typst file for a single card"""
-    
-    # Use relative path to single-card.typ (we'll copy templates to temp dir)
-    typst_content = f'''
-#import "single-card.typ": generate-single-card
-
-#generate-single-card(
-  {number},
-  side: "{side}",
-  bead-shape: "{config.get('bead_shape', 'diamond')}",
-  color-scheme: "{config.get('color_scheme', 'monochrome')}",
-  color-palette: "{config.get('color_palette', 'default')}",
-  colored-numerals: {str(config.get('colored_numerals', False)).lower()},
-  hide-inactive-beads: {str(config.get('hide_inactive_beads', False)).lower()},
-  show-empty-columns: {str(config.get('show_empty_columns', False)).lower()},
-  columns: {config.get('columns', 'auto')},
-  transparent: {str(config.get('transparent', False)).lower()},
-  width: {config.get('card_width', '3.5in')},
-  height: {config.get('card_height', '2.5in')},
-  font-size: {config.get('font_size', '48pt')},
-  font-family: "{config.get('font_family', 'DejaVu Sans')}",
-  scale-factor: {config.get('scale_factor', 1.0)}
-)
-'''
-    
-    with open(output_path, 'w') as f:
-        f.write(typst_content)
-
-def typst_to_image(typst_file, output_file, format='png', dpi=300, tmpdir_path=None):
+def single_card_input_args(config):
+    """Build the --input arguments for single-card-input.typ that stay fixed across cards.
+
+    Only the number and side vary per card, so the same Typst source is
+    compiled every time and Typst can reuse its parse of the templates.
+    """
+    inputs = {
+        'bead_shape': config.get('bead_shape', 'diamond'),
+        'color_scheme': config.get('color_scheme', 'monochrome'),
+        'color_palette': config.get('color_palette', 'default'),
+        'colored_numerals': str(config.get('colored_numerals', False)).lower(),
+        'hide_inactive_beads': str(config.get('hide_inactive_beads', False)).lower(),
+        'show_empty_columns': str(config.get('show_empty_columns', False)).lower(),
+        'columns': config.get('columns', 'auto'),
+        'transparent': str(config.get('transparent', False)).lower(),
+        'card_width': config.get('card_width', '3.5in'),
+        'card_height': config.get('card_height', '2.5in'),
+        'font_size': config.get('font_size', '48pt'),
+        'font_family': config.get('font_family', 'DejaVu Sans'),
+        'scale_factor': config.get('scale_factor', 1.0),
+    }
+    input_args = []
+    for key, value in inputs.items():
+        input_args.extend(['--input', f'{key}={value}'])
+    return input_args
+
+def flashcards_typst_inputs(numbers, config):
+    """Build the sys.inputs values for flashcards-input.typ as a dict of strings."""
+    margins = config.get('margins', {})
+    return {
+        # Numbers as comma-separated string; map(str) keeps the join in C
+        'numbers': ','.join(map(str, numbers)),
+        'cards_per_page': str(config.get('cards_per_page', 6)),
+        'paper_size': config.get('paper_size', 'us-letter'),
+        'orientation': config.get('orientation', 'portrait'),
+        # Margins as comma-separated top,bottom,left,right
+        'margins': f'{margins.get("top", "0.5in")},{margins.get("bottom", "0.5in")},{margins.get("left", "0.5in")},{margins.get("right", "0.5in")}',
+        'gutter': config.get('gutter', '5mm'),
+        'show_cut_marks': str(config.get('show_cut_marks', False)).lower(),
+        'show_registration': str(config.get('show_registration', False)).lower(),
+        'font_family': config.get('font_family', 'DejaVu Sans'),
+        'font_size': config.get('font_size', '48pt'),
+        'columns': str(config.get('columns', 'auto')),
+        'show_empty_columns': str(config.get('show_empty_columns', False)).lower(),
+        'hide_inactive_beads': str(config.get('hide_inactive_beads', False)).lower(),
+        'bead_shape': config.get('bead_shape', 'diamond'),
+        'color_scheme': config.get('color_scheme', 'monochrome'),
+        'color_palette': config.get('color_palette', 'default'),
+        'colored_numerals': str(config.get('colored_numerals', False)).lower(),
+        'scale_factor': str(config.get('scale_factor', 0.9)),
+    }
+
+def typst_to_image(typst_file, output_file, format='png', dpi=300, input_args=None):
     """Convert Typst file directly to PNG or SVG"""
     
-    # Use relative paths from tmpdir
-    if tmpdir_path:
-        rel_input = typst_file.name  # Just filename since we're running from tmpdir
-        abs_output = output_file.resolve()  # Absolute path for output
-    else:
-        rel_input = str(typst_file)
-        abs_output = str(output_file)
-    
     # Typst can export directly to PNG or SVG
     cmd = [
         'typst', 'compile',
         '--format', format,
-        rel_input,
-        str(abs_output)
+    ] + (input_args or []) + [
+        str(typst_file),
+        str(output_file)
     ]
     
     # Add DPI for PNG only
@@ -100,15 +294,7 @@ def typst_to_image(typst_file, output_file, format='png', dpi=300, tmpdir_path=N
         cmd.insert(-2, '--ppi')
         cmd.insert(-2, str(dpi))
     
-    # Add font path from tmpdir if fonts were copied there
-    if tmpdir_path:
-        fonts_path = tmpdir_path / 'fonts'
-        if fonts_path.exists():
-            cmd.extend(['--font-path', str(fonts_path)])
-    
-    # Run from tmpdir where templates are copied
-    cwd = tmpdir_path if tmpdir_path else None
-    result = subprocess.run(cmd, capture_output=True, text=True, cwd=cwd)
+    result = subprocess.run(cmd, capture_output=True, text=True)
     
     if result.returncode != 0:
         print(f"Error generating {format.upper()}: {result.stderr}")
@@ -123,9 +309,6 @@ def generate_cards_direct(numbers, config, output_dir, format='png', dpi=300, se
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
     
-    # Get project root (monorepo root is 2 levels up from packages/core/src)
-    project_root = Path(__file__).parent.parent.parent.parent
-
     # Apply shuffle if configured
     if config.get('shuffle', False):
         if 'seed' in config:
@@ -146,61 +329,54 @@ def generate_cards_direct(numbers, config, output_dir, format='png', dpi=300, se
 
     generated_files = []
 
-    # Use temp directory for Typst files
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
+    # Compile the input-driven template in place; Typst resolves its imports
+    # relative to the templates directory, so nothing needs to be staged
+    card_typst = TEMPLATES_DIR / 'single-card-input.typ'
+
+    # Settings shared by every card
+    config_inputs = single_card_input_args(config)
+
+    # Use the project fonts directly if present
+    if HAS_FONTS:
+        config_inputs += ['--font-path', str(FONTS_DIR)]
+
+    if not numbers:
+        return generated_files
+
+    # Compile all cards in a single Typst run, so startup and font loading
+    # are paid once. The template renders each number as a front page
+    # followed by a back page, and Typst writes one image per page.
+    card_inputs = config_inputs + ['--input', 'numbers=' + ','.join(map(str, numbers))]
 
-        # Copy template files to temp directory so imports work
-        templates_dir = project_root / 'packages' / 'templates'
-        shutil.copy2(templates_dir / 'single-card.typ', tmpdir_path)
-        shutil.copy2(templates_dir / 'flashcards.typ', tmpdir_path)
+    with tempfile.TemporaryDirectory(dir=output_dir) as scratch_dir:
+        scratch_dir = Path(scratch_dir)
+        if not typst_to_image(card_typst, scratch_dir / f'page-{{p}}.{format}', format, dpi, input_args=card_inputs):
+            print(f"  ✗ Failed to compile {len(numbers)} cards")
+            return generated_files
+
+        pages = {int(page.stem.split('-')[1]): page for page in scratch_dir.iterdir()}
 
-        # Copy fonts directory if it exists
-        fonts_dir = project_root / 'fonts'
-        if fonts_dir.exists():
-            shutil.copytree(fonts_dir, tmpdir_path / 'fonts')
-        
         for i, num in enumerate(numbers):
-            # Generate front (soroban)
-            front_typst = tmpdir_path / f'card_{i}_front.typ'
-            generate_single_card_typst(num, 'front', config, front_typst, project_root)
-            
-            if separate_fronts_backs:
-                front_file = fronts_dir / f'card_{i:03d}.{format}'
-            else:
-                front_file = output_dir / f'card_{i:03d}_front.{format}'
-            
-            # Ensure parent directory exists
-            front_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            if typst_to_image(front_typst, front_file, format, dpi, tmpdir_path):
-                generated_files.append(front_file)
-                print(f"  ✓ Card {i:03d} front: {num}")
-            else:
-                print(f"  ✗ Failed card {i:03d} front: {num}")
-            
-            # Generate back (numeral)
-            back_typst = tmpdir_path / f'card_{i}_back.typ'
-            generate_single_card_typst(num, 'back', config, back_typst, project_root)
-            
-            if separate_fronts_backs:
-                back_file = backs_dir / f'card_{i:03d}.{format}'
-            else:
-                back_file = output_dir / f'card_{i:03d}_back.{format}'
-            
-            # Ensure parent directory exists
-            back_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            if typst_to_image(back_typst, back_file, format, dpi, tmpdir_path):
-                generated_files.append(back_file)
-                print(f"  ✓ Card {i:03d} back: {num}")
-            else:
-                print(f"  ✗ Failed card {i:03d} back: {num}")
+            for offset, side in ((1, 'front'), (2, 'back')):
+                if separate_fronts_backs:
+                    card_dir = fronts_dir if side == 'front' else backs_dir
+                    card_file = card_dir / f'card_{i:03d}.{format}'
+                else:
+                    card_file = output_dir / f'card_{i:03d}_{side}.{format}'
+
+                page = pages.get(2 * i + offset)
+                if page is not None:
+                    os.replace(page, card_file)
+                    generated_files.append(card_file)
+                    print(f"  ✓ Card {i:03d} {side}: {num}")
+                else:
+                    print(f"  ✗ Failed card {i:03d} {side}: {num}")
     
     return generated_files
 
-
-def main():
+@lru_cache(maxsize=1)
+def build_parser():
+    """Build the command-line parser once; parse_args doesn't mutate it."""
     parser = argparse.ArgumentParser(description='Generate Soroban flashcards PDF')
     parser.add_argument('--config', '-c', type=str, help='Configuration file (JSON or YAML)')
     parser.add_argument('--range', '-r', type=str, help='Number range (e.g., "0-99") or list (e.g., "1,2,5,10")')
@@ -231,6 +407,7 @@ def main():
     
     # PDF-specific options
     parser.add_argument('--linearize', action='store_true', default=True, help='Create linearized PDF (default: True)')
+    parser.add_argument('--validate', action='store_true', help='Validate the generated PDF with qpdf --check')
     
     # PNG/SVG-specific options  
     parser.add_argument('--dpi', type=int, default=300, help='DPI for PNG output (default: 300)')
@@ -240,9 +417,21 @@ def main():
     parser.add_argument('--card-width', type=str, default='3.5in', help='Card width for PNG/SVG (default: 3.5in)')
     parser.add_argument('--card-height', type=str, default='2.5in', help='Card height for PNG/SVG (default: 2.5in)')
     
+    # Web-specific options
+    parser.add_argument('--external-css', dest='inline_css', action='store_false', help='Write the web stylesheets next to the page and link them instead of inlining them')
+    parser.add_argument('--renderer', choices=['typst', 'fast'], default='typst', help='Card renderer for web output: typst, or fast for the built-in SVG builder (default: typst)')
+    
     parser.add_argument('--font-path', type=str, help='Path to fonts directory')
     
-    args = parser.parse_args()
+    return parser
+
+def parse_options(argv=None):
+    """Parse command-line arguments and merge them with the config file.
+
+    Returns (args, numbers, final_config).
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
     
     # Load config file if provided
     config = {}
@@ -251,10 +440,12 @@ def main():
     
     # Override config with command-line arguments
     step = args.step or config.get('step', 1)
+    range_str = args.range or config.get('range')
+    # Contiguous ranges stay a lazy range object; see number_range
     if args.range:
-        numbers = parse_range(args.range, step)
+        numbers = number_range(args.range, step)
     elif 'range' in config:
-        numbers = parse_range(config['range'], step)
+        numbers = number_range(config['range'], step)
     elif 'numbers' in config:
         numbers = config['numbers']
     else:
@@ -266,32 +457,22 @@ def main():
         seed = args.seed or config.get('seed')
         if seed is not None:
             random.seed(seed)
-        random.shuffle(numbers)
+        numbers = shuffle_numbers(numbers, range_str, step)
+    
+    # The PDF path only joins the numbers into a Typst input; the card and
+    # web generators shuffle and index them, so they get a real list
+    if args.format != 'pdf':
+        numbers = list(numbers)
     
     # Build final configuration
-    final_config = {
-        'cards_per_page': args.cards_per_page or config.get('cards_per_page', 6),
-        'paper_size': args.paper_size or config.get('paper_size', 'us-letter'),
-        'orientation': args.orientation or config.get('orientation', 'portrait'),
-        'gutter': args.gutter or config.get('gutter', '5mm'),
-        'show_cut_marks': args.cut_marks or config.get('show_cut_marks', False),
-        'show_registration': args.registration or config.get('show_registration', False),
-        'font_family': args.font_family or config.get('font_family', 'DejaVu Sans'),
-        'font_size': args.font_size or config.get('font_size', '48pt'),
-        'show_empty_columns': args.show_empty_columns or config.get('show_empty_columns', False),
-        'hide_inactive_beads': args.hide_inactive_beads or config.get('hide_inactive_beads', False),
-        'bead_shape': args.bead_shape if args.bead_shape != 'diamond' else config.get('bead_shape', 'diamond'),
-        'color_scheme': args.color_scheme if args.color_scheme != 'monochrome' else config.get('color_scheme', 'monochrome'),
-        'color_palette': args.color_palette if args.color_palette != 'default' else config.get('color_palette', 'default'),
-        'colored_numerals': args.colored_numerals or config.get('colored_numerals', False),
-        'scale_factor': args.scale_factor if args.scale_factor != 0.9 else config.get('scale_factor', 0.9),
-        # PNG/SVG specific options
-        'transparent': args.transparent or config.get('transparent', False),
-        'card_width': args.card_width or config.get('card_width', '3.5in'),
-        'card_height': args.card_height or config.get('card_height', '2.5in'),
-        'shuffle': args.shuffle or config.get('shuffle', False),
-        'seed': args.seed or config.get('seed'),
-    }
+    cli_overrides = {}
+    for key in DEFAULT_CONFIG:
+        dest = CONFIG_ARG_DESTS.get(key, key)
+        value = getattr(args, dest)
+        if value != parser.get_default(dest):
+            cli_overrides[key] = value
+    file_config = {key: value for key, value in config.items() if key in DEFAULT_CONFIG}
+    final_config = {**DEFAULT_CONFIG, **file_config, **cli_overrides}
     
     # Handle margins
     if args.margins:
@@ -322,6 +503,11 @@ def main():
     else:
         final_config['columns'] = config.get('columns', 'auto')
     
+    return args, numbers, final_config
+
+def main(argv=None):
+    args, numbers, final_config = parse_options(argv)
+    
     # Determine output path based on format
     if args.output:
         output_path = Path(args.output)
@@ -342,99 +528,85 @@ def main():
     # Generate based on format
     if args.format == 'pdf':
         # Generate PDF (original functionality)
-        # Get monorepo root (2 levels up from packages/core/src)
-        project_root = Path(__file__).parent.parent.parent.parent
-
         # Set up font path if provided
         font_args = []
         if args.font_path:
             font_args = ['--font-path', args.font_path]
-        elif os.path.exists('fonts'):
-            font_args = ['--font-path', 'fonts']
+        elif HAS_FONTS:
+            font_args = ['--font-path', str(FONTS_DIR)]
 
         # Build input arguments for Typst
         input_args = []
-
-        # Numbers as comma-separated string
-        numbers_str = ','.join(str(n) for n in numbers)
-        input_args.extend(['--input', f'numbers={numbers_str}'])
-
-        # Add all configuration as input parameters
-        input_args.extend(['--input', f'cards_per_page={final_config.get("cards_per_page", 6)}'])
-        input_args.extend(['--input', f'paper_size={final_config.get("paper_size", "us-letter")}'])
-        input_args.extend(['--input', f'orientation={final_config.get("orientation", "portrait")}'])
-
-        # Format margins as comma-separated string
-        margins = final_config.get('margins', {})
-        margins_str = f'{margins.get("top", "0.5in")},{margins.get("bottom", "0.5in")},{margins.get("left", "0.5in")},{margins.get("right", "0.5in")}'
-        input_args.extend(['--input', f'margins={margins_str}'])
-
-        input_args.extend(['--input', f'gutter={final_config.get("gutter", "5mm")}'])
-        input_args.extend(['--input', f'show_cut_marks={str(final_config.get("show_cut_marks", False)).lower()}'])
-        input_args.extend(['--input', f'show_registration={str(final_config.get("show_registration", False)).lower()}'])
-        input_args.extend(['--input', f'font_family={final_config.get("font_family", "DejaVu Sans")}'])
-        input_args.extend(['--input', f'font_size={final_config.get("font_size", "48pt")}'])
-        input_args.extend(['--input', f'columns={final_config.get("columns", "auto")}'])
-        input_args.extend(['--input', f'show_empty_columns={str(final_config.get("show_empty_columns", False)).lower()}'])
-        input_args.extend(['--input', f'hide_inactive_beads={str(final_config.get("hide_inactive_beads", False)).lower()}'])
-        input_args.extend(['--input', f'bead_shape={final_config.get("bead_shape", "diamond")}'])
-        input_args.extend(['--input', f'color_scheme={final_config.get("color_scheme", "monochrome")}'])
-        input_args.extend(['--input', f'color_palette={final_config.get("color_palette", "default")}'])
-        input_args.extend(['--input', f'colored_numerals={str(final_config.get("colored_numerals", False)).lower()}'])
-        input_args.extend(['--input', f'scale_factor={final_config.get("scale_factor", 0.9)}'])
+        for key, value in flashcards_typst_inputs(numbers, final_config).items():
+            input_args.extend(['--input', f'{key}={value}'])
 
         # Path to the input-based template
-        template_path = project_root / 'packages' / 'templates' / 'flashcards-input.typ'
+        template_path = TEMPLATES_DIR / 'flashcards-input.typ'
 
         # Compile with Typst using input parameters
         print(f"Generating PDF flashcards for {len(numbers)} numbers...")
         try:
-            # Run typst from project root directory
-            result = subprocess.run(
-                ['typst', 'compile'] + font_args + input_args + [str(template_path), str(output_path)],
-                capture_output=True,
-                text=True,
-                cwd=str(project_root)
-            )
-            
-            if result.returncode != 0:
-                print(f"Error compiling Typst document:", file=sys.stderr)
-                print(result.stderr, file=sys.stderr)
-                sys.exit(1)
-            
-            print(f"Generated: {output_path}")
+            # When linearizing, Typst compiles into scratch space and qpdf
+            # writes the final file, so the output path is only written once.
+            # qpdf needs a seekable input, so it can't read Typst's stdout.
+            with tempfile.TemporaryDirectory() as scratch_dir:
+                if args.linearize:
+                    compiled_path = Path(scratch_dir) / output_path.name
+                else:
+                    compiled_path = output_path
 
-            # Add duplex printing hints and linearize if requested
-            if args.linearize:
-                linearized_path = output_path.parent / f"{output_path.stem}_linear{output_path.suffix}"
-                print(f"Linearizing PDF with duplex hints...")
+                # Run typst from project root directory
+                result = subprocess.run(
+                    ['typst', 'compile'] + font_args + input_args + [str(template_path), str(compiled_path)],
+                    capture_output=True,
+                    text=True,
+                    cwd=str(PROJECT_ROOT)
+                )
+                
+                if result.returncode != 0:
+                    print(f"Error compiling Typst document:", file=sys.stderr)
+                    print(result.stderr, file=sys.stderr)
+                    sys.exit(1)
                 
-                # Use qpdf to add duplex hints and linearize
+                print(f"Generated: {output_path}")
+
+                # Add duplex printing hints and linearize if requested
+                if args.linearize:
+                    print(f"Linearizing PDF with duplex hints...")
+                    
+                    # Use qpdf to add duplex hints and linearize
+                    try:
+                        result = subprocess.run(
+                            ['qpdf', '--linearize', 
+                             '--object-streams=preserve',
+                             str(compiled_path), str(output_path)],
+                            capture_output=True,
+                            text=True
+                        )
+                    except FileNotFoundError:
+                        # Still deliver the unlinearized PDF
+                        shutil.move(compiled_path, output_path)
+                        raise
+                    
+                    if result.returncode == 0:
+                        print(f"Linearized: {output_path}")
+                    else:
+                        print(f"Warning: Failed to linearize PDF: {result.stderr}", file=sys.stderr)
+                        shutil.move(compiled_path, output_path)
+            
+            # Run basic PDF validation on the final PDF if requested
+            if args.validate:
+                print("Validating PDF...")
                 result = subprocess.run(
-                    ['qpdf', '--linearize', 
-                     '--object-streams=preserve',
-                     str(output_path), str(linearized_path)],
+                    ['qpdf', '--check', str(output_path)],
                     capture_output=True,
                     text=True
                 )
                 
                 if result.returncode == 0:
-                    print(f"Linearized: {linearized_path}")
+                    print("PDF validation passed")
                 else:
-                    print(f"Warning: Failed to linearize PDF: {result.stderr}", file=sys.stderr)
-            
-            # Run basic PDF validation
-            print("Validating PDF...")
-            result = subprocess.run(
-                ['qpdf', '--check', str(output_path)],
-                capture_output=True,
-                text=True
-            )
-            
-            if result.returncode == 0:
-                print("PDF validation passed")
-            else:
-                print(f"Warning: PDF validation issues: {result.stderr}", file=sys.stderr)
+                    print(f"Warning: PDF validation issues: {result.stderr}", file=sys.stderr)
                 
         except FileNotFoundError as e:
             if 'typst' in str(e):
@@ -497,5 +669,19 @@ def main():
                 raise
             sys.exit(1)
 
+def run(argv):
+    """Run the generator in-process with the given arguments.
+
+    Returns the exit status instead of exiting, so callers that generate
+    many outputs don't have to start a new interpreter for each one.
+    """
+    try:
+        main(argv)
+    except SystemExit as e:
+        if e.code is None:
+            return 0
+        return e.code if isinstance(e.code, int) else 1
+    return 0
+
 if __name__ == '__main__':
     main()
\ No newline at end of file
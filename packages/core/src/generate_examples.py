@@ -1,13 +1,50 @@
 #!/usr/bin/env python3
 """
 Generate example PNG images for the README
-Converts PDFs to PNGs using ImageMagick or Ghostscript
+Renders PNGs directly with Typst, falling back to converting PDFs with
+pdftoppm, ImageMagick or Ghostscript
 """
 
+import glob
+import io
 import subprocess
 import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout, redirect_stderr
+from functools import lru_cache, partial
 from pathlib import Path
 import tempfile
+import hashlib
+import json
+import shutil
+
+import generate
+
+try:
+    import typst
+except ImportError:
+    typst = None
+
+# PDFium hands rendered pages to Pillow for the PNG encode, so it is only
+# usable when both are installed
+try:
+    import pypdfium2 as pdfium
+    import PIL  # noqa: F401
+except ImportError:
+    pdfium = None
+
+# Upper bound on parallel example builds
+MAX_EXAMPLE_WORKERS = 8
+
+# Typst templates that PDF examples are compiled from
+PDF_TEMPLATES = ['flashcards.typ', 'flashcards-input.typ']
+
+# Seconds before a hung converter or Typst run is abandoned
+SUBPROCESS_TIMEOUT = 120
+
+# zlib level for PNGs written by converters that expose it; the gallery
+# images are rebuilt often and size matters less than encode time
+PNG_COMPRESS_LEVEL = 1
 
 def generate_examples():
     """Generate various example images (SVG for single cards, PNG for grids)"""
@@ -107,92 +144,239 @@ def generate_examples():
         },
     ]
     
+    for example in examples:
+        example['opts'] = example_options(example['args'])
     return examples
 
-def pdf_to_png(pdf_path, png_path, dpi=150, page=1):
-    """Convert PDF to PNG using various methods"""
+def example_options(args):
+    """Map an example's CLI args to {option: value}, with True for bare flags"""
+    options = {}
+    for i, arg in enumerate(args):
+        if arg.startswith('--'):
+            value = args[i + 1] if i + 1 < len(args) else None
+            options[arg] = value if value is not None and not value.startswith('--') else True
+    return options
+
+def run_quiet(cmd):
+    """Run a command for its exit status only
     
-    # Method 1: Try pdftoppm (usually available on Unix systems)
+    Output is discarded instead of buffered in memory, and a run that
+    hangs is killed after SUBPROCESS_TIMEOUT seconds and reported as a
+    failure. FileNotFoundError still propagates for missing commands.
+    """
     try:
-        result = subprocess.run([
-            'pdftoppm',
-            '-png',
-            '-f', str(page),
-            '-l', str(page),
-            '-r', str(dpi),
-            '-singlefile',
-            pdf_path,
-            png_path.replace('.png', '')
-        ], capture_output=True, text=True)
-        
-        if result.returncode == 0:
-            # pdftoppm adds -1.png suffix, rename it
-            temp_file = png_path.replace('.png', '-1.png')
-            if os.path.exists(temp_file):
-                os.rename(temp_file, png_path)
-            return True
-    except FileNotFoundError:
-        pass
+        return subprocess.run(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=SUBPROCESS_TIMEOUT
+        ).returncode
+    except subprocess.TimeoutExpired:
+        return -1
+
+
+def _pdfium_render(pdf_path, png_paths, dpi, first_page):
+    """Render consecutive PDF pages in-process with PDFium
     
-    # Method 2: Try ImageMagick convert
+    The PDF is opened once for all pages, and no converter process is
+    started. png_paths[i] receives page first_page + i. Returns True if
+    every page was written.
+    """
+    try:
+        pdf = pdfium.PdfDocument(pdf_path)
+    except pdfium.PdfiumError:
+        return False
     try:
-        result = subprocess.run([
-            'convert',
-            '-density', str(dpi),
-            f'{pdf_path}[{page-1}]',  # ImageMagick uses 0-based indexing
-            '-trim',
-            '-bordercolor', 'white',
-            '-border', '20x20',
-            png_path
-        ], capture_output=True, text=True)
+        for i, png_path in enumerate(png_paths):
+            bitmap = pdf[first_page - 1 + i].render(scale=dpi / 72)
+            bitmap.to_pil().save(png_path, compress_level=PNG_COMPRESS_LEVEL)
+        return True
+    except (pdfium.PdfiumError, IndexError, OSError):
+        return False
+    finally:
+        pdf.close()
+
+
+def _pdfium_to_png(pdf_path, png_path, dpi, page):
+    """Convert one PDF page in-process with PDFium (pypdfium2)"""
+    return _pdfium_render(pdf_path, [png_path], dpi, page)
+
+
+def _pdftoppm_to_png(pdf_path, png_path, dpi, page):
+    """Convert one PDF page with pdftoppm (usually available on Unix systems)"""
+    returncode = run_quiet([
+        'pdftoppm',
+        '-png',
+        '-f', str(page),
+        '-l', str(page),
+        '-r', str(dpi),
+        '-singlefile',
+        pdf_path,
+        png_path.replace('.png', '')
+    ])
+    
+    if returncode == 0:
+        # pdftoppm adds -1.png suffix, rename it
+        temp_file = png_path.replace('.png', '-1.png')
+        if os.path.exists(temp_file):
+            os.rename(temp_file, png_path)
+        return True
+    return False
+
+
+def _convert_to_png(pdf_path, png_path, dpi, page):
+    """Convert one PDF page with ImageMagick convert"""
+    returncode = run_quiet([
+        'convert',
+        '-density', str(dpi),
+        f'{pdf_path}[{page-1}]',  # ImageMagick uses 0-based indexing
+        '-trim',
+        '-bordercolor', 'white',
+        '-border', '20x20',
+        '-define', f'png:compression-level={PNG_COMPRESS_LEVEL}',
+        png_path
+    ])
+    
+    return returncode == 0
+
+
+def _gs_to_png(pdf_path, png_path, dpi, page):
+    """Convert one PDF page with Ghostscript directly"""
+    returncode = run_quiet([
+        'gs',
+        '-dNOPAUSE',
+        '-dBATCH',
+        '-sDEVICE=png16m',
+        f'-r{dpi}',
+        f'-dFirstPage={page}',
+        f'-dLastPage={page}',
+        f'-sOutputFile={png_path}',
+        pdf_path
+    ])
+    
+    return returncode == 0
+
+
+def _sips_to_png(pdf_path, png_path, dpi, page):
+    """Convert a PDF with sips (macOS)"""
+    # First convert PDF to temporary format
+    with tempfile.NamedTemporaryFile(suffix='.png') as tmp:
+        returncode = run_quiet([
+            'sips',
+            '-s', 'format', 'png',
+            '--out', tmp.name,
+            pdf_path
+        ])
         
-        if result.returncode == 0:
+        if returncode == 0:
+            # Copy to final location
+            shutil.copyfile(tmp.name, png_path)
             return True
-    except FileNotFoundError:
-        pass
+    return False
+
+
+# PDF to PNG converters in order of preference, keyed by their command
+PDF_TO_PNG_CONVERTERS = [
+    ('pdftoppm', _pdftoppm_to_png),
+    ('convert', _convert_to_png),
+    ('gs', _gs_to_png),
+    ('sips', _sips_to_png),
+]
+
+
+@lru_cache(maxsize=1)
+def available_converters():
+    """Converters whose command is installed, looked up once per process
+    
+    PDFium comes first when pypdfium2 is installed, since it renders
+    in-process without starting a converter per page.
+    """
+    converters = [convert for cmd, convert in PDF_TO_PNG_CONVERTERS if shutil.which(cmd)]
+    if pdfium is not None:
+        converters.insert(0, _pdfium_to_png)
+    return converters
+
+
+def pdf_to_png(pdf_path, png_path, dpi=150, page=1):
+    """Convert PDF to PNG using various methods
+    
+    Only installed converters are tried, so a missing tool doesn't cost a
+    failed process spawn on every call.
+    """
+    for convert in available_converters():
+        if convert(pdf_path, png_path, dpi, page):
+            return True
+    return False
+
+
+def pdf_to_png_range(pdf_path, png_paths, dpi=150, first_page=1):
+    """Convert consecutive PDF pages to PNG with a single converter run
+    
+    png_paths[i] receives page first_page + i. Tries PDFium in-process,
+    then MuPDF's mutool, then pdftoppm, and falls back to one pdf_to_png
+    call per page if none is available or all fail.
+    """
+    if pdfium is not None and _pdfium_render(pdf_path, png_paths, dpi, first_page):
+        return [True] * len(png_paths)
     
-    # Method 3: Try Ghostscript directly
+    last_page = first_page + len(png_paths) - 1
+    prefix = png_paths[0].replace('.png', '') + '-pages'
+    
+    # mutool renders the whole page range in one process and names the
+    # output after the unpadded page number
     try:
-        result = subprocess.run([
-            'gs',
-            '-dNOPAUSE',
-            '-dBATCH',
-            '-sDEVICE=png16m',
-            f'-r{dpi}',
-            f'-dFirstPage={page}',
-            f'-dLastPage={page}',
-            f'-sOutputFile={png_path}',
-            pdf_path
-        ], capture_output=True, text=True)
+        returncode = run_quiet([
+            'mutool', 'draw',
+            '-r', str(dpi),
+            '-o', f'{prefix}-%d.png',
+            pdf_path,
+            f'{first_page}-{last_page}'
+        ])
         
-        if result.returncode == 0:
-            return True
+        page_files = [f'{prefix}-{first_page + i}.png' for i in range(len(png_paths))]
+        if returncode == 0 and all(os.path.exists(f) for f in page_files):
+            for page_file, png_path in zip(page_files, png_paths):
+                os.replace(page_file, png_path)
+            return [True] * len(png_paths)
     except FileNotFoundError:
         pass
     
-    # Method 4: Try sips (macOS)
     try:
-        # First convert PDF to temporary format
-        with tempfile.NamedTemporaryFile(suffix='.png') as tmp:
-            result = subprocess.run([
-                'sips',
-                '-s', 'format', 'png',
-                '--out', tmp.name,
-                pdf_path
-            ], capture_output=True, text=True)
+        returncode = run_quiet([
+            'pdftoppm',
+            '-png',
+            '-f', str(first_page),
+            '-l', str(last_page),
+            '-r', str(dpi),
+            pdf_path,
+            prefix
+        ])
+        
+        if returncode == 0:
+            # pdftoppm names pages <prefix>-N.png, zero-padding N to the
+            # width of the document's page count
+            pages = {}
+            for page_file in glob.glob(f'{glob.escape(prefix)}-*.png'):
+                pages[int(page_file[len(prefix) + 1:-len('.png')])] = page_file
             
-            if result.returncode == 0:
-                # Copy to final location
-                subprocess.run(['cp', tmp.name, png_path])
-                return True
+            if all(first_page + i in pages for i in range(len(png_paths))):
+                for i, png_path in enumerate(png_paths):
+                    os.replace(pages[first_page + i], png_path)
+                return [True] * len(png_paths)
     except FileNotFoundError:
         pass
     
-    return False
+    return [pdf_to_png(pdf_path, png_path, dpi=dpi, page=first_page + i)
+            for i, png_path in enumerate(png_paths)]
 
 
-def copy_svg_files(svg_dir, output_dir, example_name):
-    """Copy SVG files from the generated directory to examples"""
+def copy_svg_files(svg_dir, output_dir, example_name, log=print):
+    """Copy SVG files from the generated directory to examples
+    
+    Uses shutil.copyfile, which copies in the kernel via sendfile on Linux
+    and skips copy2's metadata syscalls the gallery doesn't need.
+    """
     svg_dir = Path(svg_dir)
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
@@ -205,21 +389,280 @@ def copy_svg_files(svg_dir, output_dir, example_name):
     
     if front_file.exists():
         dest = output_dir / f'{example_name}_front.svg'
-        import shutil
-        shutil.copy2(front_file, dest)
+        shutil.copyfile(front_file, dest)
         copied_files.append(dest)
-        print(f"    ✓ Generated {dest.name}")
+        log(f"    ✓ Generated {dest.name}")
     
     if back_file.exists():
         dest = output_dir / f'{example_name}_back.svg'
-        import shutil
-        shutil.copy2(back_file, dest)
+        shutil.copyfile(back_file, dest)
         copied_files.append(dest)
-        print(f"    ✓ Generated {dest.name}")
+        log(f"    ✓ Generated {dest.name}")
     
     return copied_files
 
 
+def run_generate(argv):
+    """Run generate.py in-process, returning (exit status, captured stderr)"""
+    stdout, stderr = io.StringIO(), io.StringIO()
+    with redirect_stdout(stdout), redirect_stderr(stderr):
+        returncode = generate.run(argv)
+    return returncode, stderr.getvalue()
+
+
+def render_pages_png(args, png_paths, dpi=150):
+    """Render the first pages of an example's PDF layout directly to PNG
+    
+    Typst rasterizes the pages itself, so no intermediate PDF or external
+    converter is needed. png_paths[i] receives page i + 1. Returns a list
+    of per-page success flags.
+    """
+    _, numbers, config = generate.parse_options(args)
+    typst_inputs = generate.flashcards_typst_inputs(numbers, config)
+    
+    if typst is not None:
+        return _render_pages_png_in_process(typst_inputs, png_paths, dpi)
+    
+    cmd = ['typst', 'compile', '--format', 'png', '--ppi', str(dpi)]
+    if generate.HAS_FONTS:
+        cmd.extend(['--font-path', str(generate.FONTS_DIR)])
+    for key, value in typst_inputs.items():
+        cmd.extend(['--input', f'{key}={value}'])
+    
+    with tempfile.TemporaryDirectory() as scratch_dir:
+        try:
+            returncode = run_quiet(
+                cmd + [str(generate.TEMPLATES_DIR / 'flashcards-input.typ'), os.path.join(scratch_dir, 'page-{p}.png')]
+            )
+        except FileNotFoundError:
+            return [False] * len(png_paths)
+        
+        if returncode != 0:
+            return [False] * len(png_paths)
+        
+        results = []
+        for page, png_path in enumerate(png_paths, start=1):
+            page_file = os.path.join(scratch_dir, f'page-{page}.png')
+            if os.path.exists(page_file):
+                shutil.move(page_file, png_path)
+                results.append(True)
+            else:
+                results.append(False)
+        return results
+
+
+@lru_cache(maxsize=1)
+def _png_compiler():
+    """Typst compiler for flashcards-input.typ, built once per process
+    
+    Reusing it keeps the scanned fonts and parsed template across the
+    examples a pool worker renders; only sys.inputs change per example.
+    """
+    return typst.Compiler(
+        str(generate.TEMPLATES_DIR / 'flashcards-input.typ'),
+        root=str(generate.TEMPLATES_DIR),
+        font_paths=[str(generate.FONTS_DIR)] if generate.HAS_FONTS else [],
+    )
+
+
+def _render_pages_png_in_process(typst_inputs, png_paths, dpi):
+    """Render pages with the typst Python binding instead of the CLI
+    
+    Compiling in the worker process skips starting a typst binary for
+    every example; the compiler is built once per pool worker.
+    """
+    try:
+        pages = _png_compiler().compile(
+            format='png',
+            ppi=float(dpi),
+            sys_inputs=typst_inputs,
+        )
+    except Exception:
+        return [False] * len(png_paths)
+    
+    # Multi-page documents come back as one PNG per page
+    if not isinstance(pages, list):
+        pages = [pages]
+    
+    results = []
+    for page, png_path in enumerate(png_paths):
+        if page < len(pages):
+            with open(png_path, 'wb') as f:
+                f.write(pages[page])
+            results.append(True)
+        else:
+            results.append(False)
+    return results
+
+
+def pdf_cache_key(args):
+    """Hash example arguments with the template mtimes
+    
+    A cached PDF is reused only while the arguments and both Typst
+    templates it was built from are unchanged.
+    """
+    mtimes = [os.path.getmtime(generate.TEMPLATES_DIR / name) for name in PDF_TEMPLATES]
+    payload = json.dumps(args) + ''.join(str(mtime) for mtime in mtimes)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def build_example(example, images_dir, temp_dir, svg_dir):
+    """Build the images for one example.
+    
+    Runs in a worker process, so output is collected and returned as
+    (name, ok, lines, conversion) for the parent to print in order.
+    conversion is a (pdf_path, png_paths) job when the PNGs still have to
+    be rasterized from a PDF, else None.
+    """
+    lines = [f"  - {example['name']}: {example['desc']}"]
+    
+    if example['format'] == 'svg':
+        # Generate SVG directly with the card generator, skipping the
+        # CLI's output handling
+        svg_temp_dir = temp_dir / f"{example['name']}_svg"
+        args, numbers, config = generate.parse_options(example['args'])
+        try:
+            with redirect_stdout(io.StringIO()):
+                generate.generate_cards_direct(
+                    numbers, config, svg_temp_dir,
+                    format=args.format,
+                    dpi=args.dpi,
+                    separate_fronts_backs=args.separate
+                )
+        except (OSError, subprocess.SubprocessError) as e:
+            lines.append(f"    ERROR generating SVG: {e}")
+            return example['name'], False, lines, None
+            
+        # Copy SVG files to final destination
+        copied = copy_svg_files(svg_temp_dir, svg_dir, example['name'], log=lines.append)
+        if not copied:
+            lines.append(f"    ✗ No SVG files found")
+            return example['name'], False, lines, None
+        return example['name'], True, lines, None
+    
+    # Render the pages straight to PNG with Typst; if that fails, build
+    # the PDF (or reuse a cached build) and rasterize it with a converter
+    front_png = images_dir / f"{example['name']}-front.png"
+    png_paths = [str(front_png)]
+    # For single cards, also generate back page
+    if example['opts'].get('--cards-per-page') == '1':
+        back_png = images_dir / f"{example['name']}-back.png"
+        png_paths.append(str(back_png))
+    else:
+        back_png = None
+    
+    results = render_pages_png(example['args'], png_paths, dpi=150)
+    if not all(results):
+        pdf_path = temp_dir / f"{example['name']}.pdf"
+        cached_pdf = temp_dir / 'cache' / f"{pdf_cache_key(example['args'])}.pdf"
+        
+        if cached_pdf.exists():
+            shutil.copyfile(cached_pdf, pdf_path)
+        else:
+            returncode, stderr = run_generate(['--output', str(pdf_path)] + example['args'])
+            
+            if returncode != 0:
+                lines.append(f"    ERROR generating PDF: {stderr}")
+                return example['name'], False, lines, None
+            
+            cached_pdf.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(pdf_path, cached_pdf)
+        
+        # Rasterized later, together with the other examples' PDFs
+        lines.append(f"    … Built {pdf_path.name}, converting to PNG after all examples")
+        return example['name'], True, lines, (str(pdf_path), png_paths)
+    
+    return (example['name'],) + report_pngs(png_paths, results, lines) + (None,)
+
+
+def report_pngs(png_paths, results, lines):
+    """Log the outcome of each PNG and return (ok, lines)
+    
+    Only the first PNG (the front) is required; a missing back is not
+    an error.
+    """
+    ok = True
+    
+    if results[0]:
+        lines.append(f"    ✓ Generated {Path(png_paths[0]).name}")
+    else:
+        lines.append(f"    ✗ Failed to convert {Path(png_paths[0]).name}")
+        ok = False
+    
+    for png_path, result in zip(png_paths[1:], results[1:]):
+        if result:
+            lines.append(f"    ✓ Generated {Path(png_path).name}")
+    
+    return ok, lines
+
+
+def convert_pdfs_to_png(jobs, dpi=150):
+    """Rasterize several PDFs with as few Ghostscript runs as possible
+    
+    jobs is a list of (pdf_path, png_paths); png_paths[i] receives page
+    i + 1 of its PDF. Jobs needing the same number of pages share one gs
+    process, which numbers its output pages consecutively across input
+    files. Returns a list of per-page success flags for each job. Falls
+    back to converting each PDF separately if gs is unavailable or its
+    output doesn't line up, and skips gs entirely when PDFium is
+    available to convert each PDF in-process.
+    """
+    results = [None] * len(jobs)
+    
+    by_page_count = {}
+    if pdfium is None:
+        for index, (_, png_paths) in enumerate(jobs):
+            by_page_count.setdefault(len(png_paths), []).append(index)
+    
+    for page_count, indexes in by_page_count.items():
+        with tempfile.TemporaryDirectory() as scratch_dir:
+            try:
+                returncode = run_quiet([
+                    'gs',
+                    '-dNOPAUSE',
+                    '-dBATCH',
+                    '-dSAFER',
+                    '-sDEVICE=png16m',
+                    f'-r{dpi}',
+                    '-dFirstPage=1',
+                    f'-dLastPage={page_count}',
+                    f'-sOutputFile={os.path.join(scratch_dir, "page-%d.png")}',
+                ] + [jobs[index][0] for index in indexes])
+            except FileNotFoundError:
+                break
+            
+            rendered = len(os.listdir(scratch_dir))
+            if returncode != 0 or rendered != page_count * len(indexes):
+                continue
+            
+            output_page = 1
+            for index in indexes:
+                for png_path in jobs[index][1]:
+                    shutil.move(os.path.join(scratch_dir, f'page-{output_page}.png'), png_path)
+                    output_page += 1
+                results[index] = [True] * page_count
+    
+    # Anything Ghostscript didn't handle goes through the per-file ladder
+    for index, (pdf_path, png_paths) in enumerate(jobs):
+        if results[index] is None:
+            if len(png_paths) > 1:
+                results[index] = pdf_to_png_range(pdf_path, png_paths, dpi=dpi)
+            else:
+                results[index] = [pdf_to_png(pdf_path, png_paths[0], dpi=dpi, page=1)]
+    
+    return results
+
+
+def example_workers(count):
+    """Number of worker processes for building count examples
+    
+    Capped at MAX_EXAMPLE_WORKERS: each worker runs Typst and a converter
+    with their own pipes and files, and an uncapped pool on a many-core
+    machine can run into the open file limit.
+    """
+    return max(1, min(count, os.cpu_count() or 1, MAX_EXAMPLE_WORKERS))
+
+
 def main():
     """Generate example images for README"""
     
@@ -237,78 +680,45 @@ def main():
     
     examples = generate_examples()
     
-    # Check if we have a PDF to PNG converter available
-    converters = []
-    for cmd in ['pdftoppm', 'convert', 'gs']:
-        if subprocess.run(['which', cmd], capture_output=True).returncode == 0:
-            converters.append(cmd)
-    
-    if not converters:
-        print("ERROR: No PDF to PNG converter found. Please install one of:")
-        print("  - poppler-utils (for pdftoppm)")
-        print("  - imagemagick (for convert)")
-        print("  - ghostscript (for gs)")
-        print("\nOn Ubuntu/Debian: sudo apt-get install poppler-utils")
-        print("On macOS: brew install poppler")
-        return 1
+    # Typst renders the PNGs itself; a PDF to PNG converter is only used
+    # as a fallback when that fails
+    converters = [cmd for cmd in ('mutool', 'pdftoppm', 'convert', 'gs') if shutil.which(cmd)]
+    if pdfium is not None:
+        converters.insert(0, 'pypdfium2')
+    
+    if converters:
+        print(f"Fallback PDF converters: {', '.join(converters)}")
+    else:
+        print("No PDF to PNG converter found; PNGs will only be rendered by Typst.")
+        print("To enable the fallback, install pypdfium2, mupdf-tools, poppler-utils, imagemagick or ghostscript.")
     
-    print(f"Using PDF converters: {', '.join(converters)}")
     print("Generating example images...")
     
+    # Examples are independent, so build them in parallel; map() keeps
+    # the results (and therefore the log output) in example order, and
+    # each example is printed as soon as it and those before it finish
+    build = partial(build_example, images_dir=images_dir,
+                    temp_dir=temp_dir, svg_dir=svg_dir)
     failed = []
-    for example in examples:
-        print(f"  - {example['name']}: {example['desc']}")
-        
-        if example['format'] == 'svg':
-            # Generate SVG directly
-            svg_temp_dir = temp_dir / f"{example['name']}_svg"
-            cmd = [
-                'python3',
-                str(project_root / 'src' / 'generate.py'),
-                '--output', str(svg_temp_dir)
-            ] + example['args']
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, cwd=str(project_root))
-            
-            if result.returncode != 0:
-                print(f"    ERROR generating SVG: {result.stderr}")
-                failed.append(example['name'])
-                continue
-                
-            # Copy SVG files to final destination
-            copied = copy_svg_files(svg_temp_dir, svg_dir, example['name'])
-            if not copied:
-                print(f"    ✗ No SVG files found")
-                failed.append(example['name'])
-                
-        else:
-            # Generate PDF and convert to PNG
-            pdf_path = temp_dir / f"{example['name']}.pdf"
-            cmd = [
-                'python3',
-                str(project_root / 'src' / 'generate.py'),
-                '--output', str(pdf_path)
-            ] + example['args']
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, cwd=str(project_root))
-            
-            if result.returncode != 0:
-                print(f"    ERROR generating PDF: {result.stderr}")
-                continue
-            
-            # Convert front page to PNG
-            front_png = images_dir / f"{example['name']}-front.png"
-            if pdf_to_png(str(pdf_path), str(front_png), dpi=150, page=1):
-                print(f"    ✓ Generated {front_png.name}")
-            else:
-                print(f"    ✗ Failed to convert {front_png.name}")
-                failed.append(example['name'])
-            
-            # For single cards, also generate back page
-            if '--cards-per-page' in example['args'] and example['args'][example['args'].index('--cards-per-page') + 1] == '1':
-                back_png = images_dir / f"{example['name']}-back.png"
-                if pdf_to_png(str(pdf_path), str(back_png), dpi=150, page=2):
-                    print(f"    ✓ Generated {back_png.name}")
+    pending = []
+    with ProcessPoolExecutor(max_workers=example_workers(len(examples))) as executor:
+        for name, ok, lines, conversion in executor.map(build, examples):
+            print("\n".join(lines), flush=True)
+            if not ok:
+                failed.append(name)
+            if conversion is not None:
+                pending.append((name, conversion))
+    
+    # PDFs that Typst couldn't render to PNG directly are converted in
+    # one batch, so the converter starts once rather than per example
+    if pending:
+        print(f"Converting {len(pending)} PDFs to PNG...")
+        results = convert_pdfs_to_png([conversion for _, conversion in pending], dpi=150)
+        for (name, (_, png_paths)), result in zip(pending, results):
+            ok, lines = report_pngs(png_paths, result, [f"  - {name}"])
+            print("\n".join(lines))
+            if not ok:
+                failed.append(name)
     
     if failed:
         print(f"\n✗ Failed to generate {len(failed)} images: {', '.join(failed)}")
@@ -319,4 +729,4 @@ def main():
 
 if __name__ == '__main__':
     import sys
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main())
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Pure-Python soroban SVG renderer for web flashcards.
+
+Mirrors the geometry of draw-soroban in packages/templates/flashcards.typ
+(base-size 1.0, all lengths in pt) so a card front can be drawn without a
+Typst compile. Selected with the 'fast' renderer; PDF, PNG and SVG exports
+always go through Typst.
+"""
+
+import re
+
+from generate import COLOR_PALETTES
+
+# Drawing parameters from draw-soroban at base-size 1.0
+ROD_WIDTH = 3
+BEAD_SIZE = 12
+BEAD_SPACING = 4
+ADJACENT_SPACING = 0.5
+COLUMN_SPACING = 25
+HEAVEN_EARTH_GAP = 30
+BAR_THICKNESS = 2
+ACTIVE_GAP = 1
+INACTIVE_GAP = 8
+TOTAL_HEIGHT = HEAVEN_EARTH_GAP + 5 * (BEAD_SIZE + BEAD_SPACING) + 10
+
+# Typst's gray.lighten(80%) and gray.lighten(70%)
+ROD_COLOR = '#eeeeee'
+INACTIVE_COLOR = '#e6e6e6'
+
+# Points per unit for the card_width/card_height lengths Typst accepts
+LENGTH_UNITS = {'pt': 1.0, 'in': 72.0, 'mm': 72 / 25.4, 'cm': 72 / 2.54}
+LENGTH_RE = re.compile(r'\s*([\d.]+)\s*(pt|in|mm|cm)\s*')
+
+
+def length_pt(value, default):
+    """Convert a Typst length such as '1.5in' to points."""
+    match = LENGTH_RE.fullmatch(str(value))
+    if not match:
+        return default
+    return float(match.group(1)) * LENGTH_UNITS[match.group(2)]
+
+
+def fmt(value):
+    """Format a coordinate compactly (no trailing zeros)."""
+    return f'{value:.2f}'.rstrip('0').rstrip('.')
+
+
+def display_digits(number, columns, show_empty):
+    """Digits drawn for number, padded or trimmed to columns like draw-soroban."""
+    digits = [int(d) for d in str(number)]
+    num_columns = len(digits) if columns in (None, 'auto') else int(columns)
+    if len(digits) < num_columns:
+        digits = [0] * (num_columns - len(digits)) + digits
+    else:
+        digits = digits[max(0, len(digits) - num_columns):]
+    if not show_empty:
+        first_nonzero = next((i for i, d in enumerate(digits) if d != 0), 0)
+        digits = digits[first_nonzero:]
+    return digits or [0]
+
+
+def column_color(idx, total_cols, scheme, palette):
+    """Active bead color for a column, as get-column-color in flashcards.typ."""
+    if scheme == 'place-value':
+        place_idx = total_cols - idx - 1
+        return palette[place_idx % len(palette)]
+    if scheme == 'alternating':
+        return '#1E88E5' if idx % 2 == 0 else '#43A047'
+    return '#000000'
+
+
+def earth_bead_y(i, earth_active):
+    """Center y of earth bead i (0 is nearest the reckoning bar)."""
+    below_bar = HEAVEN_EARTH_GAP + BAR_THICKNESS
+    step = BEAD_SIZE + ADJACENT_SPACING
+    if i < earth_active:
+        return below_bar + ACTIVE_GAP + BEAD_SIZE / 2 + i * step
+    if earth_active > 0:
+        last_active = below_bar + ACTIVE_GAP + BEAD_SIZE / 2 + (earth_active - 1) * step
+        return last_active + BEAD_SIZE + INACTIVE_GAP + (i - earth_active) * step
+    return below_bar + INACTIVE_GAP + BEAD_SIZE / 2 + i * step
+
+
+def bead(parts, x, y, shape, fill):
+    """Append one bead centered on (x, y) to parts."""
+    half = BEAD_SIZE / 2
+    if shape == 'diamond':
+        # Horizontally elongated rhombus, 1.4 bead sizes wide
+        w = BEAD_SIZE * 0.7
+        parts.append(
+            f'<polygon points="{fmt(x)},{fmt(y - half)} {fmt(x + w)},{fmt(y)} '
+            f'{fmt(x)},{fmt(y + half)} {fmt(x - w)},{fmt(y)}" fill="{fill}"/>'
+        )
+    elif shape == 'square':
+        parts.append(
+            f'<rect x="{fmt(x - half)}" y="{fmt(y - half)}" width="{BEAD_SIZE}" '
+            f'height="{BEAD_SIZE}" rx="1" fill="{fill}"/>'
+        )
+    else:
+        parts.append(f'<circle cx="{fmt(x)}" cy="{fmt(y)}" r="{fmt(half)}" fill="{fill}"/>')
+
+
+def render_soroban_svg(number, cfg):
+    """Render the front of a card for number as an inline SVG string."""
+    scheme = cfg.get('color_scheme', 'monochrome')
+    shape = cfg.get('bead_shape', 'diamond')
+    hide_inactive = cfg.get('hide_inactive_beads', False)
+    palette = COLOR_PALETTES.get(cfg.get('color_palette', 'default'), COLOR_PALETTES['default'])
+    digits = display_digits(number, cfg.get('columns', 'auto'), cfg.get('show_empty_columns', False))
+
+    width = length_pt(cfg.get('card_width', '3.5in'), 252.0)
+    height = length_pt(cfg.get('card_height', '2.5in'), 180.0)
+    scale = float(cfg.get('scale_factor', 1.0))
+    total_width = len(digits) * COLUMN_SPACING
+
+    # Center the soroban on the card and scale it about its center, as
+    # single-card.typ does with align(center + horizon) and scale()
+    dx = width / 2 - total_width * scale / 2
+    dy = height / 2 - TOTAL_HEIGHT * scale / 2
+
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {fmt(width)} {fmt(height)}" '
+        f'width="{fmt(width)}pt" height="{fmt(height)}pt">',
+        f'<g transform="translate({fmt(dx)} {fmt(dy)}) scale({fmt(scale)})">',
+    ]
+    beads = []
+    for idx, digit in enumerate(digits):
+        x = idx * COLUMN_SPACING + COLUMN_SPACING / 2
+        heaven_active = digit >= 5
+        earth_active = digit % 5
+        color = column_color(idx, len(digits), scheme, palette)
+
+        if heaven_active:
+            heaven_y = HEAVEN_EARTH_GAP - BEAD_SIZE / 2 - ACTIVE_GAP
+        else:
+            heaven_y = HEAVEN_EARTH_GAP - INACTIVE_GAP - BEAD_SIZE / 2
+
+        # Rod spans the outermost visible beads, or stops at the bar
+        if heaven_active or not hide_inactive:
+            rod_start = heaven_y - BEAD_SIZE / 2
+        else:
+            rod_start = HEAVEN_EARTH_GAP - BAR_THICKNESS / 2
+        if earth_active or not hide_inactive:
+            rod_end = earth_bead_y(3, earth_active) + BEAD_SIZE / 2
+        else:
+            rod_end = HEAVEN_EARTH_GAP + BAR_THICKNESS / 2
+        parts.append(
+            f'<rect x="{fmt(x - ROD_WIDTH / 2)}" y="{fmt(rod_start)}" width="{ROD_WIDTH}" '
+            f'height="{fmt(rod_end - rod_start)}" fill="{ROD_COLOR}"/>'
+        )
+
+        if heaven_active:
+            bead(beads, x, heaven_y, shape, '#F18F01' if scheme == 'heaven-earth' else color)
+        elif not hide_inactive:
+            bead(beads, x, heaven_y, shape, INACTIVE_COLOR)
+
+        for i in range(4):
+            if i < earth_active:
+                bead(beads, x, earth_bead_y(i, earth_active), shape,
+                     '#2E86AB' if scheme == 'heaven-earth' else color)
+            elif not hide_inactive:
+                bead(beads, x, earth_bead_y(i, earth_active), shape, INACTIVE_COLOR)
+
+    # Beads share one stroke, set on their group
+    parts.append('<g stroke="#000000" stroke-width="0.5">')
+    parts.extend(beads)
+    parts.append('</g>')
+
+    # Reckoning bar is drawn last, over the rods
+    parts.append(
+        f'<rect x="0" y="{HEAVEN_EARTH_GAP}" width="{total_width}" '
+        f'height="{BAR_THICKNESS}" fill="#000000"/>'
+    )
+    parts.append('</g></svg>')
+    return ''.join(parts)
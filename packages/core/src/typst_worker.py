@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Pool of long-lived Typst worker processes for the API server.
+
+Each worker compiles flashcards-input.typ with the `typst` Python binding,
+so font discovery and template parsing happen once per worker instead of
+once per request. Without the binding, workers fall back to the typst CLI.
+"""
+
+import asyncio
+import os
+import shutil
+import subprocess
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.util import Finalize
+from pathlib import Path
+
+try:
+    import typst
+except ImportError:
+    typst = None
+
+# Monorepo root (3 levels up from packages/core/src)
+PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+FLASHCARDS_INPUT_TEMPLATE = PROJECT_ROOT / 'packages' / 'templates' / 'flashcards-input.typ'
+FONTS_DIR = PROJECT_ROOT / 'fonts'
+
+# String form of the template path, computed once rather than per compile
+_TEMPLATE_STR = str(FLASHCARDS_INPUT_TEMPLATE)
+
+# Per-worker settings, filled in by _init_worker
+_cli_prefix = []
+_compiler = None
+_scratch_dir = None
+_scratch_pdf = None
+
+
+def _init_worker(root, font_paths):
+    """Store compile settings in the worker process."""
+    global _cli_prefix, _compiler
+    # One Compiler per worker keeps the scanned fonts and parsed template
+    # across requests; only sys.inputs change between compiles
+    if typst is not None:
+        _compiler = typst.Compiler(_TEMPLATE_STR, root=root, font_paths=font_paths)
+    # The CLI fallback's fixed arguments never change within a worker
+    _cli_prefix = ['typst', 'compile', '--root', root]
+    for font_path in font_paths:
+        _cli_prefix.extend(['--font-path', font_path])
+
+
+def _get_scratch_dir():
+    """Return this process's scratch directory, creating it on first use.
+
+    A worker runs one compile at a time, so a single directory can be
+    reused for every job instead of creating and removing a temporary
+    directory per request. mkdtemp picks an unpredictable name and creates
+    it privately, so another user can't plant the directory in advance.
+    """
+    global _scratch_dir
+    if _scratch_dir is None:
+        _scratch_dir = Path(tempfile.mkdtemp(prefix=f'soroban-{os.getpid()}-'))
+        # Finalize (unlike atexit) also runs when a pool worker process exits
+        Finalize(None, shutil.rmtree, args=(_scratch_dir,), kwargs={'ignore_errors': True}, exitpriority=0)
+    return _scratch_dir
+
+
+def compile_pdf(sys_inputs):
+    """Compile flashcards-input.typ and return the raw PDF bytes."""
+    global _scratch_pdf
+    if _compiler is not None:
+        return _compiler.compile(sys_inputs=sys_inputs)
+
+    # Fallback: the typst CLI, writing into this worker's scratch directory
+    cmd = list(_cli_prefix)
+    for key, value in sys_inputs.items():
+        cmd.extend(['--input', f'{key}={value}'])
+
+    if _scratch_pdf is None:
+        _scratch_pdf = str(_get_scratch_dir() / 'flashcards.pdf')
+    # Capture raw bytes and only decode stderr when the compile fails
+    result = subprocess.run(
+        cmd + [_TEMPLATE_STR, _scratch_pdf],
+        stdin=subprocess.DEVNULL,
+        capture_output=True
+    )
+    if result.returncode != 0:
+        stderr = result.stderr.decode('utf-8', errors='replace')
+        raise RuntimeError(f"Typst compilation failed: {stderr}")
+    with open(_scratch_pdf, 'rb') as f:
+        return f.read()
+
+
+class TypstWorkerPool:
+    """Process pool that compiles flashcard PDFs off the event loop."""
+
+    def __init__(self, max_workers=None):
+        self.max_workers = max_workers
+        self._executor = None
+
+    def start(self):
+        """Start the worker processes."""
+        font_paths = [str(FONTS_DIR)] if FONTS_DIR.exists() else []
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=_init_worker,
+            initargs=(str(PROJECT_ROOT), font_paths),
+        )
+
+    def shutdown(self):
+        """Stop the worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    async def compile(self, sys_inputs):
+        """Compile a flashcards PDF in a worker process and return its bytes."""
+        if self._executor is None:
+            self.start()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, compile_pdf, sys_inputs)
@@ -5,6433 +5,373 @@ Generates static HTML with inline SVG abacus representations using existing Typs
 """
 
 import tempfile
+import hashlib
 import json
 import subprocess
 import os
+import re
+import string
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 
 # Import PDF generation functionality
 try:
-    from generate import generate_typst_file
+    from generate import flashcards_typst_inputs, single_card_input_args, PROJECT_ROOT, TEMPLATES_DIR, FONTS_DIR, HAS_FONTS, COLOR_PALETTES
 except ImportError:
     # If running as a standalone script, try relative import
-    import sys
     sys.path.append(str(Path(__file__).parent))
-    from generate import generate_typst_file
+    from generate import flashcards_typst_inputs, single_card_input_args, PROJECT_ROOT, TEMPLATES_DIR, FONTS_DIR, HAS_FONTS, COLOR_PALETTES
+from svg_builder import render_soroban_svg
 
-
-def get_colored_numeral_html(number, config):
-    """Generate HTML for numeral with appropriate coloring based on configuration."""
-    color_scheme = config.get('color_scheme', 'monochrome')
-    
-    # For web display, automatically use colored numerals for non-monochrome schemes
-    use_colored = config.get('colored_numerals', False) or color_scheme != 'monochrome'
-    
-    if not use_colored or color_scheme == 'monochrome':
-        return str(number)
-    
-    # Color palettes - all are colorblind-friendly and tested with deuteranopia/protanopia/tritanopia
-    color_palettes = {
-        # Default palette (current colors - moderately colorblind friendly)
-        'default': {
-            'colors': [
-                "#2E86AB",  # ones - blue
-                "#A23B72",  # tens - magenta  
-                "#F18F01",  # hundreds - orange
-                "#6A994E",  # thousands - green
-                "#BC4B51",  # ten-thousands - red
-            ],
-            'name': 'Default Colors'
-        },
-        
-        # High contrast colorblind-safe palette
-        'colorblind': {
-            'colors': [
-                "#0173B2",  # ones - strong blue
-                "#DE8F05",  # tens - orange  
-                "#CC78BC",  # hundreds - pink
-                "#029E73",  # thousands - teal green
-                "#D55E00",  # ten-thousands - vermillion
-            ],
-            'name': 'Colorblind Safe'
-        },
-        
-        # Mnemonic palette using color associations for place values
-        'mnemonic': {
-            'colors': [
-                "#1f77b4",  # ones - BLUE (Blue = Basic/Beginning = ones)
-                "#ff7f0e",  # tens - ORANGE (Orange = Ten commandments = tens) 
-                "#2ca02c",  # hundreds - GREEN (Green = Grass/Ground = hundreds)
-                "#d62728",  # thousands - RED (Red = Thousand suns/fire = thousands)
-                "#9467bd",  # ten-thousands - PURPLE (Purple = Prestigious/Premium = ten-thousands)
-            ],
-            'name': 'Memory Aid Colors'
-        },
-        
-        # High contrast monochromatic palette (different shades)
-        'grayscale': {
-            'colors': [
-                "#000000",  # ones - black
-                "#404040",  # tens - dark gray
-                "#808080",  # hundreds - medium gray  
-                "#b0b0b0",  # thousands - light gray
-                "#d0d0d0",  # ten-thousands - very light gray
-            ],
-            'name': 'Grayscale Shades'
-        },
-        
-        # Nature-inspired colorblind safe palette
-        'nature': {
-            'colors': [
-                "#4E79A7",  # ones - sky blue
-                "#F28E2C",  # tens - sunset orange
-                "#E15759",  # hundreds - coral red
-                "#76B7B2",  # thousands - seafoam green
-                "#59A14F",  # ten-thousands - forest green
-            ],
-            'name': 'Nature Colors'
-        }
-    }
-    
-    # Get the selected palette (default to 'default' palette)
-    palette_name = config.get('color_palette', 'default')
-    selected_palette = color_palettes.get(palette_name, color_palettes['default'])
-    place_value_colors = selected_palette['colors']
-    
-    if color_scheme == 'place-value':
-        # Color each digit by its place value (right-to-left: rightmost is ones)
-        digits = str(number)
-        colored_spans = []
-        
-        for i, digit in enumerate(digits):
-            place_idx = len(digits) - 1 - i  # rightmost digit is place 0 (ones)
-            color_idx = place_idx % len(place_value_colors)
-            color = place_value_colors[color_idx]
-            colored_spans.append(f'<span style="color: {color};">{digit}</span>')
-        
-        return ''.join(colored_spans)
-    elif color_scheme == 'heaven-earth':
-        # Use orange (heaven bead color)
-        return f'<span style="color: #F18F01;">{number}</span>'
-    elif color_scheme == 'alternating':
-        # For alternating, use blue for simplicity in web display
-        return f'<span style="color: #1E88E5;">{number}</span>'
-    else:
-        return str(number)
-
-
-def get_numeral_color(number, config):
-    """Get single color for numeral (kept for backwards compatibility with tests).""" 
-    color_scheme = config.get('color_scheme', 'monochrome')
-    
-    # For web display, automatically use colored numerals for non-monochrome schemes
-    use_colored = config.get('colored_numerals', False) or color_scheme != 'monochrome'
-    
-    if not use_colored or color_scheme == 'monochrome':
-        return "#333"
-    
-    # Get color palette (reuse same palette logic)
-    color_palettes = {
-        'default': ['#2E86AB', '#A23B72', '#F18F01', '#6A994E', '#BC4B51'],
-        'colorblind': ['#0173B2', '#DE8F05', '#CC78BC', '#029E73', '#D55E00'],
-        'mnemonic': ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd'],
-        'grayscale': ['#000000', '#404040', '#808080', '#b0b0b0', '#d0d0d0'],
-        'nature': ['#4E79A7', '#F28E2C', '#E15759', '#76B7B2', '#59A14F']
-    }
-    
-    palette_name = config.get('color_palette', 'default')
-    place_value_colors = color_palettes.get(palette_name, color_palettes['default'])
-    
-    if color_scheme == 'place-value':
-        # For single color (used by tests), return highest place value color
-        digits = str(number)
-        place_idx = len(digits) - 1  # Most significant digit place
-        color_idx = place_idx % len(place_value_colors)
-        return place_value_colors[color_idx]
-    elif color_scheme == 'heaven-earth':
-        # Use orange (heaven bead color)
-        return "#F18F01"
-    elif color_scheme == 'alternating':
-        # For alternating, use blue for simplicity in web display
-        return "#1E88E5"
-    else:
-        return "#333"
-
-
-def generate_card_svgs(numbers, config):
-    """Generate SVG content for each flashcard using existing Typst pipeline."""
-    try:
-        from .generate import generate_cards_direct
-    except ImportError:
-        # Fallback for when running tests directly
-        from generate import generate_cards_direct
-    
-    # Create temporary directory for SVG generation
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-        svg_dir = tmpdir_path / 'svg_cards'
-        
-        # Configure for web-optimized SVGs
-        web_config = {
-            **config,
-            'card_width': '1.5in',  # Much smaller card = larger abacus relative to viewBox
-            'card_height': '1.5in',
-            'transparent': True,  # Transparent background for web
-            'scale_factor': 1.0   # Full size for web (was 0.8 - too small)
-        }
-        
-        # Generate SVG files using existing pipeline
-        generated_files = generate_cards_direct(
-            numbers, web_config, svg_dir,
-            format='svg', separate_fronts_backs=True
-        )
-        
-        # Read SVG contents
-        card_data = {}
-        fronts_dir = svg_dir / 'fronts'
-        
-        for i, number in enumerate(numbers):
-            front_file = fronts_dir / f'card_{i:03d}.svg'
-            if front_file.exists():
-                with open(front_file, 'r') as f:
-                    svg_content = f.read()
-                    # Remove XML declaration and DOCTYPE if present
-                    if svg_content.startswith('<?xml'):
-                        svg_content = svg_content.split('>', 1)[1]
-                    card_data[number] = svg_content.strip()
-            else:
-                # Fallback if SVG generation failed
-                card_data[number] = f'<svg width="300" height="200"><text x="150" y="100" text-anchor="middle" font-size="48">{number}</text></svg>'
-        
-        return card_data
-
-
-def generate_companion_pdf(numbers, config, output_path):
-    """Generate a PDF version alongside the web flashcards for print functionality."""
-    
-    # Ensure output_path is a Path object
-    output_path = Path(output_path)
-    
-    # Use PDF-optimized config
-    pdf_config = config.copy()
-    pdf_config.update({
-        'cards_per_page': 6,  # Standard 6 cards per page for printing
-        'show_cut_marks': True,  # Always show cut marks for printing
-        'show_registration': True,  # Always show registration marks
-        'paper_size': 'us-letter',  # Standard paper size
-        'orientation': 'portrait',  # Standard orientation
-        'margins': {'top': '0.5in', 'bottom': '0.5in', 'left': '0.5in', 'right': '0.5in'},
-        'gutter': '5mm'
-    })
-    
-    # Generate Typst file
-    project_root = Path(__file__).parent.parent
-    temp_typst = project_root / 'temp_web_companion.typ'
-    generate_typst_file(numbers, pdf_config, temp_typst)
-    
-    # Set up font path
-    font_args = []
-    if os.path.exists(str(project_root / 'fonts')):
-        font_args = ['--font-path', str(project_root / 'fonts')]
-    
-    # Compile with Typst - use absolute paths to ensure correct location
-    result = subprocess.run(
-        ['typst', 'compile'] + font_args + [str(temp_typst), str(output_path.resolve())],
-        capture_output=True,
-        text=True,
-        cwd=str(project_root)
-    )
-    
-    if result.returncode != 0:
-        raise RuntimeError(f"Typst compilation failed: {result.stderr}")
-    
-    # Clean up temp file
-    temp_typst.unlink(missing_ok=True)
-    
-    # Linearize PDF for web delivery
-    try:
-        linearized_path = output_path.with_name(f"{output_path.stem}_linearized.pdf")
-        result = subprocess.run(
-            ['qpdf', '--linearize', str(output_path), str(linearized_path)],
-            capture_output=True,
-            text=True
-        )
-        if result.returncode == 0:
-            linearized_path.replace(output_path)  # Replace original with linearized
-    except FileNotFoundError:
-        pass  # qpdf not available, skip linearization
-
-
-def generate_tutorial_svgs(config):
-    """Generate SVG content for tutorial examples."""
-    tutorial_numbers = [0, 1, 3, 5, 7, 9, 23, 67, 158, 456]  # Key examples for tutorial
-    tutorial_svgs = generate_card_svgs(tutorial_numbers, config)
-    return tutorial_svgs
-
-def generate_arithmetic_svgs(config):
-    """Generate SVG content for arithmetic examples."""
-    arithmetic_numbers = [23, 27, 37, 47, 55, 75, 89, 85, 92, 84, 21]  # Arithmetic step examples
-    arithmetic_svgs = generate_card_svgs(arithmetic_numbers, config)
-    return arithmetic_svgs
-
-def generate_web_flashcards(numbers, config, output_path):
-    """Generate HTML file with flashcard layout."""
-    
-    # Generate SVG content for all cards
-    print(f"Generating SVG content for {len(numbers)} cards...")
-    card_svgs = generate_card_svgs(numbers, config)
-    
-    # Generate tutorial SVGs
-    print("Generating tutorial examples...")
-    tutorial_svgs = generate_tutorial_svgs(config)
-    
-    # Generate arithmetic SVGs
-    print("Generating arithmetic examples...")
-    arithmetic_svgs = generate_arithmetic_svgs(config)
-    
-    # Generate individual cards HTML
-    cards_html = []
-    for i, number in enumerate(numbers):
-        svg_content = card_svgs.get(number, f'<svg width="300" height="200"><text x="150" y="100" text-anchor="middle" font-size="48">Error</text></svg>')
-        colored_numeral = get_colored_numeral_html(number, config)
-        
-        card_html = f'''
-        <div class="flashcard" data-number="{number}">
-            <div class="card-number">#{i+1}</div>
-            <div class="abacus-container">
-                {svg_content}
-            </div>
-            <div class="numeral">{colored_numeral}</div>
-        </div>'''
-        
-        cards_html.append(card_html)
-    
-    # Configuration descriptions
-    color_schemes = {
-        'monochrome': 'All beads are the same color',
-        'place-value': 'Each place value (ones, tens, hundreds) has a different color',
-        'heaven-earth': 'Heaven beads (5-value) and earth beads (1-value) have different colors',
-        'alternating': 'Columns alternate between two colors'
-    }
-    
-    color_scheme_description = color_schemes.get(
-        config.get('color_scheme', 'monochrome'),
-        'Monochrome color scheme'
-    )
-    
-    # Format font size for CSS
-    font_size = config.get('font_size', '48pt')
-    if not font_size.endswith(('px', 'pt', 'em', 'rem', '%')):
-        font_size = font_size + 'px'  # Add px if no unit specified
-    
-    # HTML template
-    html_template = '''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Soroban Flashcards</title>
-    <style>
-        /* CSS @property declarations for smooth gradient transitions */
-        @property --sky-gradient {{
-            syntax: '<image>';
-            inherits: false;
-            initial-value: linear-gradient(135deg, #ffb347 0%, #ffcc5c 50%, #87ceeb 100%);
-        }}
-        
-        /* Time-of-day gradient definitions */
-        :root {{
-            --dawn-gradient: linear-gradient(135deg, #ffb347 0%, #ffcc5c 30%, #87ceeb 70%, #98d8e8 100%);
-            --morning-gradient: linear-gradient(135deg, #87ceeb 0%, #98d8e8 30%, #b6e2ff 70%, #cce7ff 100%);
-            --midday-gradient: linear-gradient(135deg, #87ceeb 0%, #a8d8ea 30%, #c7e2f7 70%, #e3f2fd 100%);
-            --afternoon-gradient: linear-gradient(135deg, #ffecd2 0%, #fcb69f 30%, #ff8a65 70%, #ff7043 100%);
-            --dusk-gradient: linear-gradient(135deg, #ff8a65 0%, #ff7043 30%, #8e44ad 70%, #5b2c87 100%);
-            --night-gradient: linear-gradient(135deg, #2c3e50 0%, #34495e 30%, #1a252f 70%, #0f1419 100%);
-        }}
-
-        body {{
-            font-family: {font_family}, sans-serif;
-            margin: 0;
-            padding: 0;
-            background: #f8fafc;
-            line-height: 1.6;
-            color: #2d3748;
-        }}
-        
-        .container {{
-            max-width: 1400px;
-            margin: 0 auto;
-            padding: 0;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-        }}
-        
-        /* Beautiful Header */
-        .main-header {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            text-align: center;
-            padding: 60px 40px 40px;
-            position: relative;
-            overflow: hidden;
-        }}
-        
-        .main-header::before {{
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 0;
-            right: 0;
-            bottom: 0;
-            background: url('data:image/svg+xml,<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 100 100"><defs><pattern id="grain" width="100" height="100" patternUnits="userSpaceOnUse"><circle cx="25" cy="25" r="1" fill="white" opacity="0.1"/><circle cx="75" cy="75" r="1" fill="white" opacity="0.1"/><circle cx="50" cy="10" r="0.5" fill="white" opacity="0.15"/></pattern></defs><rect width="100" height="100" fill="url(%23grain)"/></svg>');
-            pointer-events: none;
-        }}
-        
-        .main-header h1 {{
-            font-size: 3.5rem;
-            font-weight: 700;
-            margin: 0 0 15px 0;
-            text-shadow: 0 4px 20px rgba(0,0,0,0.3);
-            letter-spacing: -0.02em;
-            position: relative;
-            z-index: 1;
-        }}
-        
-        .main-header p {{
-            font-size: 1.3rem;
-            margin: 0;
-            opacity: 0.95;
-            font-weight: 300;
-            max-width: 600px;
-            margin: 0 auto;
-            line-height: 1.6;
-            position: relative;
-            z-index: 1;
-        }}
-        
-        /* Modern Navigation */
-        .page-nav {{
-            position: sticky;
-            top: 0;
-            background: rgba(255, 255, 255, 0.95);
-            backdrop-filter: blur(10px);
-            border-bottom: 1px solid rgba(102, 126, 234, 0.2);
-            z-index: 1000;
-            padding: 20px 40px;
-            box-shadow: 0 8px 32px rgba(0,0,0,0.1);
-        }}
-        
-        .nav-buttons {{
-            display: flex;
-            gap: 8px;
-            justify-content: center;
-            max-width: 800px;
-            margin: 0 auto;
-            flex-wrap: wrap;
-        }}
-        
-        .nav-btn {{
-            padding: 12px 24px;
-            border: none;
-            background: rgba(102, 126, 234, 0.1);
-            color: #4a5568;
-            border-radius: 50px;
-            cursor: pointer;
-            font-size: 15px;
-            font-weight: 600;
-            transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-            text-decoration: none;
-            position: relative;
-            overflow: hidden;
-            min-width: 140px;
-            text-align: center;
-        }}
-        
-        .nav-btn::before {{
-            content: '';
-            position: absolute;
-            top: 0;
-            left: -100%;
-            width: 100%;
-            height: 100%;
-            background: linear-gradient(90deg, transparent, rgba(255,255,255,0.4), transparent);
-            transition: left 0.6s;
-        }}
-        
-        .nav-btn:hover {{
-            background: rgba(102, 126, 234, 0.15);
-            transform: translateY(-2px);
-            box-shadow: 0 8px 25px rgba(102, 126, 234, 0.2);
-        }}
-        
-        .nav-btn:hover::before {{
-            left: 100%;
-        }}
-        
-        .nav-btn.active {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            box-shadow: 0 8px 25px rgba(102, 126, 234, 0.4);
-        }}
-        
-        .nav-btn.active:hover {{
-            transform: translateY(-2px);
-            box-shadow: 0 12px 35px rgba(102, 126, 234, 0.5);
-        }}
-        
-        /* Content Area */
-        .content-area {{
-            background: white;
-            margin: 0;
-            padding: 0;
-            min-height: calc(100vh - 200px);
-        }}
-        
-        /* Section Styles */
-        .page-section {{
-            display: none;
-            animation: fadeInUp 0.6s cubic-bezier(0.4, 0, 0.2, 1);
-            padding: 60px 40px 80px;
-            max-width: 1200px;
-            margin: 0 auto;
-        }}
-        
-        .page-section.active {{
-            display: block;
-        }}
-        
-        @keyframes fadeInUp {{
-            from {{ 
-                opacity: 0; 
-                transform: translateY(30px);
-            }}
-            to {{ 
-                opacity: 1; 
-                transform: translateY(0);
-            }}
-        }}
-        
-        .section-header {{
-            text-align: center;
-            margin-bottom: 60px;
-            position: relative;
-        }}
-        
-        .section-title {{
-            font-size: 2.8rem;
-            font-weight: 700;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-            margin: 0 0 15px 0;
-            letter-spacing: -0.02em;
-        }}
-        
-        .section-subtitle {{
-            color: #718096;
-            font-size: 1.2rem;
-            margin: 0;
-            font-weight: 400;
-            max-width: 600px;
-            margin: 0 auto;
-            line-height: 1.6;
-        }}
-        
-        /* Welcome Section Styles */
-        .welcome-hero {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            margin: -60px -40px 0;
-            padding: 80px 40px 60px;
-            text-align: center;
-            position: relative;
-            overflow: hidden;
-        }}
-        
-        .welcome-hero::before {{
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 0;
-            right: 0;
-            bottom: 0;
-            background: url('data:image/svg+xml,<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 100 100"><circle cx="20" cy="20" r="2" fill="white" opacity="0.1"/><circle cx="80" cy="30" r="1.5" fill="white" opacity="0.1"/><circle cx="60" cy="70" r="1" fill="white" opacity="0.15"/><circle cx="30" cy="80" r="2.5" fill="white" opacity="0.08"/><circle cx="90" cy="80" r="1" fill="white" opacity="0.1"/></svg>');
-            animation: float 20s ease-in-out infinite;
-        }}
-        
-        @keyframes float {{
-            0%, 100% {{ transform: translateY(0px); }}
-            50% {{ transform: translateY(-10px); }}
-        }}
-        
-        .welcome-content {{
-            position: relative;
-            z-index: 1;
-            max-width: 1200px;
-            margin: 0 auto;
-        }}
-        
-        .welcome-title {{
-            font-size: 3.5rem;
-            font-weight: 800;
-            margin-bottom: 20px;
-            text-shadow: 2px 2px 4px rgba(0,0,0,0.1);
-        }}
-        
-        .welcome-subtitle {{
-            font-size: 1.4rem;
-            margin-bottom: 60px;
-            opacity: 0.95;
-            font-weight: 300;
-            line-height: 1.6;
-        }}
-        
-        .feature-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(280px, 1fr));
-            gap: 30px;
-            margin: 60px 0;
-            padding: 0 20px;
-        }}
-        
-        .feature-card {{
-            background: rgba(255, 255, 255, 0.95);
-            backdrop-filter: blur(10px);
-            border-radius: 20px;
-            padding: 40px 30px;
-            text-align: center;
-            color: #333;
-            box-shadow: 0 20px 40px rgba(0,0,0,0.1);
-            transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-            border: 1px solid rgba(255, 255, 255, 0.2);
-        }}
-        
-        .feature-card:hover {{
-            transform: translateY(-10px);
-            box-shadow: 0 30px 60px rgba(0,0,0,0.15);
-        }}
-        
-        .feature-icon {{
-            font-size: 3rem;
-            margin-bottom: 20px;
-            display: block;
-        }}
-        
-        .feature-card h3 {{
-            font-size: 1.5rem;
-            font-weight: 600;
-            margin-bottom: 15px;
-            color: #333;
-        }}
-        
-        .feature-card p {{
-            color: #666;
-            line-height: 1.6;
-            margin-bottom: 25px;
-        }}
-        
-        .feature-btn {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            border: none;
-            padding: 12px 24px;
-            border-radius: 25px;
-            font-weight: 600;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            font-size: 1rem;
-        }}
-        
-        .feature-btn:hover {{
-            transform: translateY(-2px);
-            box-shadow: 0 8px 20px rgba(102, 126, 234, 0.3);
-        }}
-        
-        .quick-start {{
-            background: rgba(255, 255, 255, 0.1);
-            border-radius: 20px;
-            padding: 50px 40px;
-            margin: 60px 20px 40px;
-            backdrop-filter: blur(10px);
-            border: 1px solid rgba(255, 255, 255, 0.2);
-        }}
-        
-        .quick-start h2 {{
-            font-size: 2.2rem;
-            font-weight: 700;
-            margin-bottom: 40px;
-            text-align: center;
-        }}
-        
-        .steps {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-            gap: 30px;
-        }}
-        
-        .step {{
-            display: flex;
-            align-items: flex-start;
-            gap: 20px;
-        }}
-        
-        .step-number {{
-            background: rgba(255, 255, 255, 0.2);
-            width: 50px;
-            height: 50px;
-            border-radius: 50%;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-weight: 700;
-            font-size: 1.3rem;
-            flex-shrink: 0;
-            border: 2px solid rgba(255, 255, 255, 0.3);
-        }}
-        
-        .step-content h4 {{
-            font-size: 1.3rem;
-            font-weight: 600;
-            margin-bottom: 10px;
-        }}
-        
-        .step-content p {{
-            opacity: 0.9;
-            line-height: 1.6;
-        }}
-        
-        .stats-preview {{
-            background: rgba(255, 255, 255, 0.1);
-            border-radius: 20px;
-            padding: 40px;
-            margin: 40px 20px 0;
-            backdrop-filter: blur(10px);
-            border: 1px solid rgba(255, 255, 255, 0.2);
-            text-align: center;
-        }}
-        
-        .stats-preview h3 {{
-            font-size: 2rem;
-            font-weight: 700;
-            margin-bottom: 30px;
-        }}
-        
-        .stats-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 30px;
-        }}
-        
-        .stat-item {{
-            text-align: center;
-        }}
-        
-        .stat-number {{
-            font-size: 3rem;
-            font-weight: 800;
-            margin-bottom: 10px;
-            background: rgba(255, 255, 255, 0.2);
-            border-radius: 15px;
-            padding: 20px;
-            display: inline-block;
-            min-width: 80px;
-        }}
-        
-        .stat-label {{
-            font-size: 1.1rem;
-            opacity: 0.9;
-            font-weight: 500;
-        }}
-        
-        /* Responsive adjustments */
-        @media (max-width: 768px) {{
-            .welcome-title {{
-                font-size: 2.5rem;
-            }}
-            
-            .welcome-subtitle {{
-                font-size: 1.2rem;
-            }}
-            
-            .feature-grid {{
-                grid-template-columns: 1fr;
-                gap: 20px;
-                padding: 0 10px;
-            }}
-            
-            .quick-start {{
-                margin: 40px 10px 20px;
-                padding: 30px 20px;
-            }}
-            
-            .steps {{
-                grid-template-columns: 1fr;
-                gap: 20px;
-            }}
-            
-            .stats-grid {{
-                grid-template-columns: repeat(2, 1fr);
-                gap: 20px;
-            }}
-        }}
-        
-        .section-header::after {{
-            content: '';
-            display: block;
-            width: 60px;
-            height: 4px;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            margin: 30px auto 0;
-            border-radius: 2px;
-        }}
-        
-        .header {{
-            text-align: center;
-            margin-bottom: 30px;
-        }}
-        
-        .header h1 {{
-            color: #333;
-            font-size: 2.5em;
-            margin-bottom: 10px;
-        }}
-        
-        .header p {{
-            color: #666;
-            font-size: 1.2em;
-        }}
-        
-        .cards-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fill, minmax(320px, 1fr));
-            gap: 20px;
-            margin: 20px 0;
-        }}
-        
-        .flashcard {{
-            background: white;
-            border-radius: 12px;
-            padding: 20px;
-            box-shadow: 0 4px 8px rgba(0,0,0,0.1);
-            transition: transform 0.2s ease, box-shadow 0.2s ease;
-            cursor: pointer;
-            position: relative;
-            min-height: 220px;
-            display: flex;
-            flex-direction: column;
-            justify-content: center;
-            align-items: center;
-        }}
-        
-        .flashcard:hover {{
-            transform: translateY(-2px);
-            box-shadow: 0 8px 16px rgba(0,0,0,0.15);
-        }}
-        
-        .abacus-container {{
-            flex: 1;
-            display: flex;
-            justify-content: center;
-            align-items: center;
-            margin: 10px 0;
-            max-width: 100%;
-            overflow: hidden;
-        }}
-        
-        .abacus-container svg {{
-            max-width: 100%;
-            height: auto;
-        }}
-        
-        .numeral {{
-            font-size: {font_size};
-            font-weight: bold;
-            color: {numeral_color};
-            opacity: 0;
-            transition: opacity 0.3s ease;
-            position: absolute;
-            top: 50%;
-            left: 50%;
-            transform: translate(-50%, -50%);
-            background: rgba(255,255,255,0.95);
-            padding: 15px 25px;
-            border-radius: 8px;
-            border: 2px solid #ddd;
-            box-shadow: 0 4px 8px rgba(0,0,0,0.2);
-            z-index: 10;
-        }}
-        
-        .flashcard:hover .numeral {{
-            opacity: 1;
-        }}
-        
-        .card-number {{
-            position: absolute;
-            top: 10px;
-            left: 10px;
-            font-size: 0.8em;
-            color: #999;
-            background: rgba(255,255,255,0.8);
-            padding: 2px 6px;
-            border-radius: 4px;
-        }}
-        
-        .instructions {{
-            background: linear-gradient(135deg, #f8fafc 0%, #e2e8f0 100%);
-            padding: 40px;
-            border-radius: 20px;
-            box-shadow: 0 20px 40px rgba(0, 0, 0, 0.1);
-            margin: 50px 0;
-            text-align: left;
-            position: relative;
-            border: 1px solid rgba(102, 126, 234, 0.1);
-        }}
-        
-        .instructions::before {{
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 0;
-            right: 0;
-            bottom: 0;
-            background: linear-gradient(135deg, rgba(102, 126, 234, 0.03) 0%, rgba(118, 75, 162, 0.03) 100%);
-            border-radius: 20px;
-            pointer-events: none;
-        }}
-        
-        .instructions h3 {{
-            color: #2d3748;
-            margin-top: 0;
-            margin-bottom: 20px;
-            font-size: 1.5rem;
-            font-weight: 600;
-            position: relative;
-            z-index: 1;
-        }}
-        
-        .instructions h4 {{
-            color: #4a5568;
-            margin-top: 30px;
-            margin-bottom: 15px;
-            font-size: 1.2rem;
-            font-weight: 600;
-            position: relative;
-            z-index: 1;
-        }}
-        
-        .instructions p {{
-            position: relative;
-            z-index: 1;
-            line-height: 1.7;
-            color: #4a5568;
-        }}
-        
-        .instructions ul {{
-            position: relative;
-            z-index: 1;
-            margin: 20px 0;
-            padding-left: 0;
-            list-style: none;
-        }}
-        
-        .instructions li {{
-            padding: 12px 0;
-            padding-left: 35px;
-            position: relative;
-            color: #4a5568;
-            line-height: 1.6;
-        }}
-        
-        .instructions li::before {{
-            content: '✓';
-            position: absolute;
-            left: 0;
-            top: 12px;
-            width: 20px;
-            height: 20px;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            border-radius: 50%;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-size: 12px;
-            font-weight: bold;
-        }}
-        
-        .instructions p {{
-            position: relative;
-            z-index: 1;
-            line-height: 1.7;
-            color: #4a5568;
-        }}
-        
-        .stats {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 20px;
-            margin-top: 40px;
-            padding: 0;
-        }}
-        
-        .stats div {{
-            background: white;
-            padding: 25px;
-            border-radius: 15px;
-            font-size: 14px;
-            border: 1px solid rgba(102, 126, 234, 0.1);
-            box-shadow: 0 10px 25px rgba(0, 0, 0, 0.08);
-            position: relative;
-            overflow: hidden;
-            transition: transform 0.3s ease, box-shadow 0.3s ease;
-            text-align: left;
-        }}
-        
-        .stats div::before {{
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 0;
-            width: 4px;
-            height: 100%;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        }}
-        
-        .stats div:hover {{
-            transform: translateY(-5px);
-            box-shadow: 0 20px 40px rgba(102, 126, 234, 0.15);
-        }}
-        
-        .stats div strong {{
-            color: #2d3748;
-            display: block;
-            margin-bottom: 5px;
-            font-weight: 600;
-        }}
-        
-        /* Configuration Showcase Styles */
-        .config-showcase {{
-            display: flex;
-            flex-direction: column;
-            gap: 30px;
-            margin-top: 30px;
-        }}
-        
-        .config-item {{
-            background: white;
-            padding: 25px;
-            border-radius: 15px;
-            border: 1px solid rgba(102, 126, 234, 0.1);
-            position: relative;
-            transition: all 0.3s ease;
-        }}
-        
-        .config-item:hover {{
-            transform: translateY(-2px);
-            box-shadow: 0 10px 30px rgba(102, 126, 234, 0.15);
-        }}
-        
-        .config-item::before {{
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 0;
-            width: 4px;
-            height: 100%;
-            background: linear-gradient(135deg, #667eea, #764ba2);
-            border-radius: 2px 0 0 2px;
-        }}
-        
-        .config-label {{
-            font-size: 16px;
-            margin-bottom: 8px;
-            color: #2d3748;
-        }}
-        
-        .config-value {{
-            font-size: 18px;
-            color: #4a5568;
-            margin-bottom: 10px;
-            font-weight: 500;
-        }}
-        
-        .config-description {{
-            font-size: 14px;
-            color: #718096;
-            line-height: 1.5;
-            margin-top: 8px;
-        }}
-        
-        .color-palette {{
-            display: flex;
-            gap: 12px;
-            margin: 12px 0;
-            align-items: center;
-        }}
-        
-        .color-sample {{
-            width: 24px;
-            height: 24px;
-            border-radius: 50%;
-            border: 2px solid rgba(0,0,0,0.1);
-            cursor: pointer;
-            transition: transform 0.2s ease;
-        }}
-        
-        .color-sample:hover {{
-            transform: scale(1.2);
-        }}
-        
-        .color-sample.heaven {{
-            background: #8B4513;
-        }}
-        
-        .color-sample.earth {{
-            background: #F4A460;
-        }}
-        
-        .color-sample.frame {{
-            background: #2F4F4F;
-        }}
-        
-        .bead-examples {{
-            display: flex;
-            align-items: center;
-            gap: 8px;
-        }}
-        
-        .bead-sample {{
-            width: 20px;
-            height: 20px;
-            border: 2px solid rgba(0,0,0,0.2);
-            transition: transform 0.2s ease;
-        }}
-        
-        .bead-sample:hover {{
-            transform: scale(1.3);
-        }}
-        
-        .bead-sample.circle {{
-            border-radius: 50%;
-            background: #8B4513;
-        }}
-        
-        .bead-sample.diamond {{
-            transform: rotate(45deg);
-            background: #8B4513;
-        }}
-        
-        .bead-sample.square {{
-            border-radius: 2px;
-            background: #8B4513;
-        }}
-        
-        .shape-label {{
-            font-size: 13px;
-            color: #718096;
-            font-weight: 500;
-        }}
-        
-        .offline-info {{
-            background: linear-gradient(135deg, #e6fffa 0%, #b2f5ea 100%);
-            padding: 30px;
-            border-radius: 20px;
-            border: 1px solid #4fd1c7;
-            margin-top: 40px;
-            text-align: center;
-        }}
-        
-        .offline-info h3 {{
-            color: #234e52;
-            margin-top: 0;
-            margin-bottom: 15px;
-            font-size: 1.4rem;
-        }}
-        
-        .offline-info p {{
-            color: #2d5a5f;
-            line-height: 1.6;
-            margin-bottom: 20px;
-        }}
-        
-        .tech-features {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 15px;
-            margin-top: 20px;
-        }}
-        
-        .feature {{
-            background: rgba(255, 255, 255, 0.7);
-            padding: 12px 20px;
-            border-radius: 25px;
-            font-size: 14px;
-            font-weight: 500;
-            color: #234e52;
-            border: 1px solid rgba(79, 209, 199, 0.3);
-        }}
-        
-        /* Tutorial Styles */
-        .tutorial-content {{
-            max-width: 1000px;
-            margin: 0 auto;
-        }}
-        
-        .tutorial-step {{
-            background: white;
-            margin-bottom: 40px;
-            border-radius: 20px;
-            overflow: hidden;
-            box-shadow: 0 15px 35px rgba(0,0,0,0.08);
-            border: 1px solid rgba(102, 126, 234, 0.1);
-        }}
-        
-        .step-header {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            padding: 25px 40px;
-            color: white;
-        }}
-        
-        .step-header h3 {{
-            margin: 0;
-            font-size: 1.5rem;
-            font-weight: 600;
-            display: flex;
-            align-items: center;
-            gap: 15px;
-        }}
-        
-        .step-number {{
-            background: rgba(255,255,255,0.2);
-            width: 35px;
-            height: 35px;
-            border-radius: 50%;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-weight: 700;
-            font-size: 1.1rem;
-        }}
-        
-        .step-content {{
-            padding: 40px;
-        }}
-        
-        .tutorial-grid {{
-            display: grid;
-            grid-template-columns: 1fr 400px;
-            gap: 40px;
-            align-items: center;
-        }}
-        
-        .tutorial-text h4 {{
-            color: #2d3748;
-            margin-top: 25px;
-            margin-bottom: 15px;
-            font-size: 1.1rem;
-            font-weight: 600;
-        }}
-        
-        .tutorial-text ol, .tutorial-text ul {{
-            color: #4a5568;
-            line-height: 1.7;
-        }}
-        
-        .tutorial-text li {{
-            margin-bottom: 8px;
-        }}
-        
-        .tutorial-visual {{
-            text-align: center;
-        }}
-        
-        .example-abacus {{
-            background: #f8fafc;
-            padding: 20px;
-            border-radius: 12px;
-            margin-bottom: 15px;
-            border: 2px solid rgba(102, 126, 234, 0.1);
-            display: flex;
-            justify-content: center;
-            align-items: center;
-            min-height: 120px;
-        }}
-        
-        .example-abacus svg {{
-            max-width: 100%;
-            height: auto;
-        }}
-        
-        .example-label {{
-            font-weight: 600;
-            color: #2d3748;
-            font-size: 0.95rem;
-        }}
-        
-        .example-breakdown {{
-            font-size: 0.85rem;
-            color: #718096;
-            margin-top: 5px;
-            font-style: italic;
-        }}
-        
-        .examples-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(180px, 1fr));
-            gap: 25px;
-            margin-top: 30px;
-        }}
-        
-        .example-item {{
-            text-align: center;
-        }}
-        
-        .example-item .example-abacus {{
-            margin-bottom: 12px;
-            min-height: 100px;
-            padding: 15px;
-        }}
-        
-        .practice-hint {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 10px 15px;
-            border-radius: 8px;
-            font-size: 0.9rem;
-            margin-top: 10px;
-            font-style: italic;
-        }}
-        
-        .reveal-btn {{
-            background: linear-gradient(135deg, #28a745 0%, #20c997 100%);
-            color: white;
-            border: none;
-            padding: 12px 24px;
-            border-radius: 8px;
-            font-size: 0.9rem;
-            font-weight: 600;
-            cursor: pointer;
-            margin-top: 15px;
-            transition: all 0.3s ease;
-            box-shadow: 0 4px 15px rgba(40, 167, 69, 0.3);
-        }}
-        
-        .reveal-btn:hover {{
-            transform: translateY(-2px);
-            box-shadow: 0 8px 25px rgba(40, 167, 69, 0.4);
-        }}
-        
-        .reveal-btn:active {{
-            transform: translateY(0);
-        }}
-        
-        .revealed {{
-            animation: revealAnimation 0.5s ease-out;
-        }}
-        
-        @keyframes revealAnimation {{
-            0% {{ 
-                background: #fff3cd; 
-                transform: scale(1.05); 
-            }}
-            100% {{ 
-                background: #f8fafc; 
-                transform: scale(1); 
-            }}
-        }}
-        
-        /* Arithmetic Section Styles */
-        .arithmetic-intro {{
-            background: rgba(102, 126, 234, 0.05);
-            padding: 20px;
-            border-radius: 12px;
-            margin-bottom: 30px;
-            border-left: 4px solid #667eea;
-        }}
-        
-        .operation-section {{
-            margin: 30px 0;
-            padding: 25px;
-            background: #f8fafc;
-            border-radius: 15px;
-            border: 1px solid rgba(102, 126, 234, 0.1);
-        }}
-        
-        .operation-section h4 {{
-            color: #2d3748;
-            margin-top: 0;
-            margin-bottom: 20px;
-            font-size: 1.3rem;
-            font-weight: 600;
-        }}
-        
-        .calculation-example {{
-            margin: 20px 0;
-        }}
-        
-        .calc-step {{
-            display: grid;
-            grid-template-columns: 1fr 2fr;
-            gap: 30px;
-            align-items: start;
-        }}
-        
-        .step-description {{
-            padding: 20px;
-            background: white;
-            border-radius: 12px;
-            box-shadow: 0 4px 12px rgba(0,0,0,0.08);
-        }}
-        
-        .step-description h5 {{
-            color: #667eea;
-            margin-top: 0;
-            margin-bottom: 15px;
-            font-size: 1.1rem;
-            font-weight: 600;
-        }}
-        
-        .technique-steps {{
-            margin: 15px 0;
-            padding-left: 20px;
-        }}
-        
-        .technique-steps li {{
-            margin-bottom: 8px;
-            color: #4a5568;
-            line-height: 1.5;
-        }}
-        
-        .calc-visual-sequence {{
-            display: flex;
-            align-items: center;
-            gap: 15px;
-            padding: 20px;
-            background: white;
-            border-radius: 12px;
-            box-shadow: 0 4px 12px rgba(0,0,0,0.08);
-            overflow-x: auto;
-        }}
-        
-        .calc-frame {{
-            text-align: center;
-            min-width: 120px;
-            flex-shrink: 0;
-        }}
-        
-        .frame-label {{
-            font-size: 0.9rem;
-            font-weight: 600;
-            color: #2d3748;
-            margin-bottom: 10px;
-        }}
-        
-        .calc-arrow {{
-            font-size: 0.85rem;
-            color: #667eea;
-            font-weight: 600;
-            text-align: center;
-            min-width: 80px;
-            flex-shrink: 0;
-        }}
-        
-        .technique-box {{
-            background: linear-gradient(135deg, #e3f2fd 0%, #f3e5f5 100%);
-            padding: 20px;
-            border-radius: 12px;
-            margin: 20px 0;
-            border: 1px solid rgba(102, 126, 234, 0.2);
-        }}
-        
-        .technique-box h5 {{
-            color: #2d3748;
-            margin-top: 0;
-            margin-bottom: 15px;
-            font-size: 1.1rem;
-            font-weight: 600;
-        }}
-        
-        .complement-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-            gap: 12px;
-            margin: 15px 0;
-        }}
-        
-        .complement-pair {{
-            background: white;
-            padding: 12px 15px;
-            border-radius: 8px;
-            font-family: 'Courier New', monospace;
-            font-size: 0.9rem;
-            color: #4a5568;
-            border: 1px solid rgba(102, 126, 234, 0.15);
-        }}
-        
-        .mult-layout, .div-layout {{
-            display: grid;
-            grid-template-columns: 1fr 1fr;
-            gap: 30px;
-            padding: 20px;
-            background: white;
-            border-radius: 12px;
-            box-shadow: 0 4px 12px rgba(0,0,0,0.08);
-        }}
-        
-        .mult-setup, .mult-result, .div-setup, .div-result {{
-            text-align: center;
-        }}
-        
-        .mult-label, .div-label {{
-            font-size: 0.95rem;
-            font-weight: 600;
-            color: #2d3748;
-            margin-bottom: 15px;
-        }}
-        
-        .tips-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(280px, 1fr));
-            gap: 25px;
-            margin-top: 30px;
-        }}
-        
-        .tip-card {{
-            background: linear-gradient(135deg, #fff5f5 0%, #f0fff4 100%);
-            padding: 25px;
-            border-radius: 15px;
-            border: 1px solid rgba(102, 126, 234, 0.1);
-            box-shadow: 0 8px 20px rgba(0,0,0,0.08);
-            transition: transform 0.3s ease, box-shadow 0.3s ease;
-        }}
-        
-        .tip-card:hover {{
-            transform: translateY(-5px);
-            box-shadow: 0 15px 30px rgba(102, 126, 234, 0.15);
-        }}
-        
-        .tip-card h4 {{
-            color: #2d3748;
-            margin-top: 0;
-            margin-bottom: 15px;
-            font-size: 1.1rem;
-            font-weight: 600;
-        }}
-        
-        .tip-card p {{
-            color: #4a5568;
-            line-height: 1.6;
-            margin: 0;
-        }}
-        
-        /* Guide Navigation Styles */
-        .guide-nav {{
-            background: rgba(102, 126, 234, 0.05);
-            padding: 20px;
-            border-radius: 15px;
-            margin-bottom: 40px;
-            border: 1px solid rgba(102, 126, 234, 0.1);
-        }}
-        
-        .guide-nav-buttons {{
-            display: flex;
-            gap: 15px;
-            justify-content: center;
-            flex-wrap: wrap;
-        }}
-        
-        .guide-nav-btn {{
-            padding: 12px 24px;
-            border: 2px solid #667eea;
-            background: white;
-            color: #667eea;
-            border-radius: 25px;
-            cursor: pointer;
-            font-size: 15px;
-            font-weight: 600;
-            transition: all 0.3s ease;
-            text-decoration: none;
-        }}
-        
-        .guide-nav-btn:hover {{
-            background: #667eea;
-            color: white;
-            transform: translateY(-2px);
-            box-shadow: 0 8px 20px rgba(102, 126, 234, 0.3);
-        }}
-        
-        .guide-nav-btn.active {{
-            background: #667eea;
-            color: white;
-            box-shadow: 0 6px 15px rgba(102, 126, 234, 0.4);
-        }}
-        
-        .guide-content {{
-            position: relative;
-        }}
-        
-        .guide-section {{
-            display: none;
-            animation: fadeInGuide 0.4s ease-out;
-        }}
-        
-        .guide-section.active {{
-            display: block;
-        }}
-        
-        @keyframes fadeInGuide {{
-            from {{ 
-                opacity: 0;
-                transform: translateX(20px);
-            }}
-            to {{ 
-                opacity: 1;
-                transform: translateX(0);
-            }}
-        }}
-        
-        .section-intro {{
-            text-align: center;
-            margin-bottom: 40px;
-            padding: 30px;
-            background: linear-gradient(135deg, #f8fafc 0%, #e2e8f0 100%);
-            border-radius: 15px;
-            border: 1px solid rgba(102, 126, 234, 0.1);
-        }}
-        
-        .section-intro h3 {{
-            color: #2d3748;
-            margin: 0 0 15px 0;
-            font-size: 1.8rem;
-            font-weight: 600;
-        }}
-        
-        .section-intro p {{
-            color: #4a5568;
-            margin: 0;
-            font-size: 1.1rem;
-            line-height: 1.6;
-        }}
-        
-        @media (max-width: 768px) {{
-            .tutorial-grid {{
-                grid-template-columns: 1fr;
-                gap: 25px;
-            }}
-            
-            .step-content {{
-                padding: 25px;
-            }}
-            
-            .step-header {{
-                padding: 20px 25px;
-            }}
-            
-            .examples-grid {{
-                grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
-                gap: 20px;
-            }}
-            
-            .calc-step {{
-                grid-template-columns: 1fr;
-                gap: 20px;
-            }}
-            
-            .calc-visual-sequence {{
-                padding: 15px;
-            }}
-            
-            .mult-layout, .div-layout {{
-                grid-template-columns: 1fr;
-                gap: 20px;
-            }}
-            
-            .tips-grid {{
-                grid-template-columns: 1fr;
-            }}
-        }}
-        
-        @media (max-width: 768px) {{
-            .cards-grid {{
-                grid-template-columns: repeat(auto-fill, minmax(280px, 1fr));
-                gap: 15px;
-            }}
-            
-            .flashcard {{
-                min-height: 120px;
-                padding: 15px;
-            }}
-            
-            .numeral {{
-                font-size: calc({font_size} * 0.8);
-                padding: 10px 20px;
-            }}
-        }}
-        
-        /* Quiz Styling */
-        .quiz-section {{
-            background: #f8f9fa;
-            border-radius: 12px;
-            padding: 30px;
-            margin: 30px 0;
-            text-align: center;
-        }}
-        
-        .quiz-section h2 {{
-            color: #333;
-            margin-bottom: 10px;
-        }}
-        
-        .quiz-controls {{
-            max-width: 600px;
-            margin: 0 auto;
-        }}
-        
-        .control-group {{
-            margin: 20px 0;
-        }}
-        
-        .control-group label {{
-            display: block;
-            font-weight: bold;
-            margin-bottom: 10px;
-            color: #555;
-        }}
-        
-        .count-buttons {{
-            display: flex;
-            gap: 10px;
-            justify-content: center;
-            flex-wrap: wrap;
-        }}
-        
-        .count-btn {{
-            background: white;
-            border: 2px solid #ddd;
-            border-radius: 8px;
-            padding: 10px 20px;
-            cursor: pointer;
-            transition: all 0.2s ease;
-            font-size: 16px;
-        }}
-        
-        .count-btn:hover {{
-            border-color: #4a90e2;
-            background: #f0f7ff;
-        }}
-        
-        .count-btn.active {{
-            background: #4a90e2;
-            color: white;
-            border-color: #4a90e2;
-        }}
-        
-        .slider-container {{
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            gap: 15px;
-        }}
-        
-        .slider-container input[type="range"] {{
-            width: 200px;
-            height: 6px;
-            border-radius: 3px;
-            background: #ddd;
-            outline: none;
-            -webkit-appearance: none;
-        }}
-        
-        .slider-container input[type="range"]::-webkit-slider-thumb {{
-            -webkit-appearance: none;
-            appearance: none;
-            width: 20px;
-            height: 20px;
-            border-radius: 50%;
-            background: #4a90e2;
-            cursor: pointer;
-        }}
-        
-        .slider-value {{
-            font-weight: bold;
-            color: #4a90e2;
-            min-width: 50px;
-        }}
-        
-        .quiz-start-btn {{
-            background: #28a745;
-            color: white;
-            border: none;
-            border-radius: 8px;
-            padding: 15px 30px;
-            font-size: 18px;
-            font-weight: bold;
-            cursor: pointer;
-            transition: background 0.2s ease;
-            margin-top: 20px;
-        }}
-        
-        .quiz-start-btn:hover {{
-            background: #218838;
-        }}
-        
-        /* Quiz Game Area */
-        .quiz-game {{
-            text-align: center;
-            padding: 40px 20px;
-        }}
-        
-        .quiz-progress {{
-            margin-bottom: 30px;
-        }}
-        
-        .progress-bar {{
-            width: 100%;
-            max-width: 400px;
-            height: 8px;
-            background: #ddd;
-            border-radius: 4px;
-            margin: 0 auto 10px;
-            overflow: hidden;
-        }}
-        
-        .progress-fill {{
-            height: 100%;
-            background: #4a90e2;
-            transition: width 0.3s ease;
-            width: 0%;
-        }}
-        
-        .progress-text {{
-            color: #666;
-            font-size: 16px;
-        }}
-        
-        .quiz-display {{
-            position: relative;
-            min-height: 300px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-        }}
-        
-        .quiz-flashcard {{
-            background: white;
-            border-radius: 12px;
-            padding: 20px;
-            box-shadow: 0 8px 16px rgba(0,0,0,0.1);
-            width: min(85vw, 700px);
-            height: min(50vh, 400px);
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            margin: 0 auto;
-            transition: transform 0.3s ease;
-        }}
-        
-        /* Ensure quiz game section fits in viewport */
-        #quiz-game {{
-            min-height: 100vh;
-            display: flex;
-            flex-direction: column;
-            justify-content: center;
-            align-items: center;
-            padding: 20px;
-            box-sizing: border-box;
-        }}
-        
-        /* Responsive adjustments for smaller screens */
-        @media (max-height: 600px) {{
-            .quiz-flashcard {{
-                height: min(40vh, 300px);
-                padding: 15px;
-            }}
-        }}
-        
-        @media (max-height: 500px) {{
-            .quiz-flashcard {{
-                height: min(35vh, 250px);
-                padding: 10px;
-            }}
-            
-            #quiz-game {{
-                min-height: auto;
-                padding: 10px;
-            }}
-        }}
-        
-        .quiz-flashcard svg {{
-            width: 100%;
-            height: 100%;
-            max-width: 100%;
-            max-height: 100%;
-        }}
-        
-        .quiz-flashcard.pulse {{
-            transform: scale(1.05);
-        }}
-        
-        .quiz-flashcard.card-exit-warning {{
-            border-color: #dc3545;
-            box-shadow: 0 0 15px rgba(220, 53, 69, 0.4);
-        }}
-        
-        .quiz-flashcard.card-fade-out {{
-            opacity: 0.3;
-            transform: scale(0.95);
-            transition: all 0.1s ease;
-        }}
-        
-        .countdown {{
-            position: absolute;
-            top: 50%;
-            left: 50%;
-            transform: translate(-50%, -50%);
-            font-size: 48px;
-            font-weight: bold;
-            color: #4a90e2;
-            text-shadow: 2px 2px 4px rgba(0,0,0,0.1);
-            z-index: 10;
-        }}
-        
-        .countdown.ready {{
-            color: #28a745;
-        }}
-        
-        .countdown.go {{
-            color: #ffc107;
-        }}
-        
-        .countdown.new-card-flash {{
-            color: #17a2b8;
-            font-size: 24px;
-            animation: flashIn 0.15s ease;
-        }}
-        
-        @keyframes flashIn {{
-            from {{
-                opacity: 0;
-                transform: translate(-50%, -50%) scale(0.8);
-            }}
-            to {{
-                opacity: 1;
-                transform: translate(-50%, -50%) scale(1);
-            }}
-        }}
-        
-        /* Quiz Input */
-        .quiz-input {{
-            text-align: center;
-            padding: 40px 20px;
-            max-width: 700px;
-            margin: 0 auto;
-        }}
-        
-        .quiz-stats {{
-            display: flex;
-            justify-content: center;
-            gap: 30px;
-            margin-bottom: 30px;
-            padding: 20px;
-            background: #f8f9fa;
-            border-radius: 12px;
-        }}
-        
-        .stats-item {{
-            display: flex;
-            flex-direction: column;
-            align-items: center;
-            gap: 5px;
-        }}
-        
-        .stats-label {{
-            font-size: 14px;
-            color: #666;
-            font-weight: 500;
-        }}
-        
-        .stats-item span:last-child {{
-            font-size: 24px;
-            font-weight: bold;
-            color: #2c5f76;
-        }}
-        
-        .smart-input-container {{
-            position: relative;
-            margin: 40px 0;
-            text-align: center;
-        }}
-        
-        .smart-input-prompt {{
-            font-size: 16px;
-            color: #7a8695;
-            margin-bottom: 15px;
-            font-weight: normal;
-        }}
-        
-        .number-display {{
-            min-height: 60px;
-            padding: 20px;
-            font-size: 32px;
-            font-family: 'Courier New', 'Monaco', monospace;
-            text-align: center;
-            font-weight: bold;
-            color: #2c3e50;
-            letter-spacing: 3px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            transition: all 0.3s ease;
-        }}
-        
-        .current-typing {{
-            display: inline-block;
-            transition: all 0.3s ease;
-        }}
-        
-        .number-display.correct .current-typing {{
-            color: #28a745;
-            animation: successPulse 0.5s ease;
-        }}
-        
-        .number-display.incorrect .current-typing {{
-            color: #dc3545;
-            animation: errorShake 0.5s ease;
-        }}
-        
-        @keyframes successPulse {{
-            0%, 100% {{ transform: scale(1); }}
-            50% {{ transform: scale(1.05); }}
-        }}
-        
-        @keyframes errorShake {{
-            0%, 100% {{ transform: translateX(0); }}
-            25% {{ transform: translateX(-10px); }}
-            75% {{ transform: translateX(10px); }}
-        }}
-        
-        /* Particle Effects System */
-        .particle-container {{
-            position: fixed;
-            top: 0;
-            left: 0;
-            width: 100vw;
-            height: 100vh;
-            pointer-events: none;
-            z-index: 10000;
-        }}
-        
-        .particle {{
-            position: absolute;
-            border-radius: 50%;
-            pointer-events: none;
-        }}
-        
-        .particle.star {{
-            background: linear-gradient(45deg, #ffd700, #ffed4e);
-            box-shadow: 0 0 10px #ffd700;
-        }}
-        
-        .particle.heart {{
-            background: #ff6b6b;
-            border-radius: 0;
-            transform: rotate(-45deg);
-        }}
-        
-        .particle.heart::before,
-        .particle.heart::after {{
-            content: '';
-            position: absolute;
-            width: 100%;
-            height: 100%;
-            background: #ff6b6b;
-            border-radius: 50%;
-        }}
-        
-        .particle.heart::before {{
-            top: -50%;
-            left: 0;
-        }}
-        
-        .particle.heart::after {{
-            top: 0;
-            left: 50%;
-        }}
-        
-        .particle.circle {{
-            background: linear-gradient(45deg, #667eea, #764ba2);
-            box-shadow: 0 0 8px rgba(102, 126, 234, 0.4);
-        }}
-        
-        .particle.diamond {{
-            background: linear-gradient(45deg, #00b894, #00cec9);
-            transform: rotate(45deg);
-            border-radius: 0;
-        }}
-        
-        .particle.confetti {{
-            background: linear-gradient(45deg, #ff6b6b, #feca57);
-            border-radius: 2px;
-        }}
-        
-        /* Burst Animation */
-        @keyframes particleBurst {{
-            0% {{
-                opacity: 1;
-                transform: translateY(0) scale(0) rotate(0deg);
-            }}
-            30% {{
-                opacity: 1;
-                transform: translateY(-20px) scale(1.2) rotate(180deg);
-            }}
-            100% {{
-                opacity: 0;
-                transform: translateY(-80px) scale(0.3) rotate(360deg);
-            }}
-        }}
-        
-        /* Celebration Firework */
-        @keyframes firework {{
-            0% {{
-                opacity: 1;
-                transform: translateY(0) scale(0);
-            }}
-            20% {{
-                opacity: 1;
-                transform: translateY(-30px) scale(1.5);
-            }}
-            100% {{
-                opacity: 0;
-                transform: translateY(-120px) scale(0.5);
-            }}
-        }}
-        
-        /* Floating Animation */
-        @keyframes float {{
-            0% {{
-                opacity: 0;
-                transform: translateY(20px) scale(0) rotate(0deg);
-            }}
-            20% {{
-                opacity: 1;
-                transform: translateY(0) scale(1) rotate(72deg);
-            }}
-            100% {{
-                opacity: 0;
-                transform: translateY(-100px) scale(0.8) rotate(360deg);
-            }}
-        }}
-        
-        /* Trail Effect */
-        @keyframes trail {{
-            0% {{
-                opacity: 1;
-                transform: translate(0, 0) scale(1);
-            }}
-            100% {{
-                opacity: 0;
-                transform: translate(var(--dx), var(--dy)) scale(0.3);
-            }}
-        }}
-        
-        /* Sparkle Effect */
-        @keyframes sparkle {{
-            0%, 100% {{
-                opacity: 0;
-                transform: scale(0) rotate(0deg);
-            }}
-            50% {{
-                opacity: 1;
-                transform: scale(1) rotate(180deg);
-            }}
-        }}
-        
-        .particle.burst {{
-            animation: particleBurst 0.8s ease-out forwards;
-        }}
-        
-        .particle.firework {{
-            animation: firework 1.2s ease-out forwards;
-        }}
-        
-        .particle.floating {{
-            animation: float 2s ease-out forwards;
-        }}
-        
-        .particle.trail {{
-            animation: trail 1.5s ease-out forwards;
-        }}
-        
-        .particle.sparkle {{
-            animation: sparkle 1s ease-in-out forwards;
-        }}
-        
-        .input-feedback {{
-            margin-top: 10px;
-            font-weight: bold;
-            min-height: 20px;
-        }}
-        
-        .input-feedback.success {{
-            color: #28a745;
-        }}
-        
-        .input-feedback.error {{
-            color: #dc3545;
-        }}
-        
-        .input-feedback.survival {{
-            color: #ff6b6b;
-            background: linear-gradient(135deg, rgba(255, 107, 107, 0.1), rgba(255, 193, 7, 0.1));
-            padding: 8px 12px;
-            border-radius: 8px;
-            font-weight: 600;
-            border: 1px solid rgba(255, 107, 107, 0.3);
-        }}
-        
-        .found-numbers {{
-            margin: 30px 0;
-            min-height: 60px;
-        }}
-        
-        .found-number {{
-            display: inline-block;
-            margin: 5px;
-            padding: 10px 15px;
-            background: #28a745;
-            color: white;
-            border-radius: 8px;
-            font-weight: bold;
-            font-size: 18px;
-            animation: slideIn 0.3s ease;
-        }}
-        
-        @keyframes slideIn {{
-            from {{
-                opacity: 0;
-                transform: translateY(-20px);
-            }}
-            to {{
-                opacity: 1;
-                transform: translateY(0);
-            }}
-        }}
-        
-        .finish-btn {{
-            background: #2c5f76;
-            color: white;
-            border: none;
-            padding: 15px 30px;
-            font-size: 18px;
-            border-radius: 8px;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            margin-top: 20px;
-        }}
-        
-        .finish-btn:hover {{
-            background: #1e4a5c;
-            transform: translateY(-2px);
-        }}
-        
-        .quiz-finish-buttons {{
-            display: flex;
-            gap: 15px;
-            justify-content: center;
-            margin-top: 20px;
-            flex-wrap: wrap;
-        }}
-        
-        .give-up-btn {{
-            background: #17a2b8;
-            color: white;
-            border: none;
-            padding: 15px 30px;
-            font-size: 18px;
-            border-radius: 8px;
-            cursor: pointer;
-            transition: all 0.3s ease;
-        }}
-        
-        .give-up-btn:hover {{
-            background: #138496;
-            transform: translateY(-2px);
-        }}
-        
-        .input-container {{
-            margin-top: 20px;
-        }}
-        
-        .quiz-input textarea {{
-            width: 100%;
-            max-width: 400px;
-            height: 120px;
-            border: 2px solid #ddd;
-            border-radius: 8px;
-            padding: 15px;
-            font-size: 16px;
-            resize: vertical;
-            font-family: inherit;
-        }}
-        
-        .quiz-input textarea:focus {{
-            outline: none;
-            border-color: #4a90e2;
-        }}
-        
-        .quiz-input button {{
-            background: #4a90e2;
-            color: white;
-            border: none;
-            border-radius: 8px;
-            padding: 12px 24px;
-            font-size: 16px;
-            cursor: pointer;
-            margin-top: 15px;
-        }}
-        
-        .quiz-input button:hover {{
-            background: #357abd;
-        }}
-        
-        /* Quiz Results */
-        .quiz-results {{
-            text-align: center;
-            padding: 40px 20px;
-            max-width: 700px;
-            margin: 0 auto;
-        }}
-        
-        .score-display {{
-            display: flex;
-            justify-content: center;
-            align-items: center;
-            gap: 40px;
-            margin: 30px 0;
-            flex-wrap: wrap;
-        }}
-        
-        .score-circle {{
-            width: 120px;
-            height: 120px;
-            border-radius: 50%;
-            background: linear-gradient(135deg, #4a90e2, #357abd);
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            color: white;
-            font-size: 24px;
-            font-weight: bold;
-            box-shadow: 0 4px 8px rgba(0,0,0,0.2);
-        }}
-        
-        .score-details {{
-            text-align: left;
-        }}
-        
-        .score-details p {{
-            margin: 8px 0;
-            font-size: 16px;
-        }}
-        
-        .results-breakdown {{
-            background: #f8f9fa;
-            border-radius: 8px;
-            padding: 20px;
-            margin: 30px 0;
-            text-align: left;
-        }}
-        
-        .result-item {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            padding: 10px 0;
-            border-bottom: 1px solid #eee;
-        }}
-        
-        .result-item:last-child {{
-            border-bottom: none;
-        }}
-        
-        .result-correct {{
-            color: #28a745;
-            font-weight: bold;
-        }}
-        
-        .result-incorrect {{
-            color: #dc3545;
-            font-weight: bold;
-        }}
-        
-        .quiz-actions {{
-            margin-top: 30px;
-            display: flex;
-            gap: 15px;
-            justify-content: center;
-            flex-wrap: wrap;
-        }}
-        
-        .quiz-actions button {{
-            padding: 12px 24px;
-            border: none;
-            border-radius: 8px;
-            font-size: 16px;
-            cursor: pointer;
-            transition: background 0.2s ease;
-        }}
-        
-        #retry-quiz {{
-            background: #ffc107;
-            color: #333;
-        }}
-        
-        #retry-quiz:hover {{
-            background: #e0a800;
-        }}
-        
-        #back-to-cards {{
-            background: #6c757d;
-            color: white;
-        }}
-        
-        #back-to-cards:hover {{
-            background: #545b62;
-        }}
-        
-        /* End Game Button */
-        .end-game-btn {{
-            background: #dc3545;
-            color: white;
-            border: none;
-            border-radius: 8px;
-            padding: 8px 16px;
-            font-size: 14px;
-            cursor: pointer;
-            transition: background 0.2s ease;
-        }}
-        
-        .end-game-btn:hover {{
-            background: #c82333;
-        }}
-        
-        /* Quiz Header for Game Mode */
-        .quiz-header {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 20px;
-            padding: 15px 20px;
-            background: rgba(74, 144, 226, 0.1);
-            border-radius: 8px;
-        }}
-        
-        .quiz-header .quiz-progress {{
-            flex: 1;
-        }}
-        
-        @media (max-width: 768px) {{
-            .quiz-section {{
-                padding: 20px;
-            }}
-            
-            .count-buttons {{
-                gap: 8px;
-            }}
-            
-            .count-btn {{
-                padding: 8px 16px;
-                font-size: 14px;
-            }}
-            
-            .score-display {{
-                flex-direction: column;
-                gap: 20px;
-            }}
-            
-            .score-details {{
-                text-align: center;
-            }}
-            
-            .countdown {{
-                font-size: 36px;
-            }}
-            
-            .sorting-section {{
-                padding: 20px;
-            }}
-            
-            .sorting-grid {{
-                grid-template-columns: repeat(auto-fill, minmax(150px, 1fr));
-                gap: 10px;
-                padding: 15px;
-            }}
-            
-            .sort-card {{
-                padding: 10px;
-            }}
-            
-            .sort-count-btn {{
-                padding: 8px 16px;
-                font-size: 14px;
-                margin: 2px;
-            }}
-            
-            .sort-start-btn, .sort-check-btn, .sort-reveal-btn, .sort-new-btn {{
-                padding: 10px 16px;
-                font-size: 14px;
-                margin: 5px;
-            }}
-            
-            .sorting-actions {{
-                display: flex;
-                flex-wrap: wrap;
-                justify-content: center;
-            }}
-            
-            .tag-filter-bar {{
-                padding: 15px;
-            }}
-            
-            .filter-title {{
-                font-size: 1rem;
-                margin-bottom: 12px;
-            }}
-            
-            .tag-filters {{
-                gap: 8px;
-            }}
-            
-            .tag-filter {{
-                font-size: 0.8rem;
-                padding: 6px 12px;
-            }}
-            
-            .challenges-grid {{
-                grid-template-columns: 1fr;
-                gap: 20px;
-                margin: 20px 0;
-            }}
-            
-            .challenge-card {{
-                min-height: 80px;
-                padding: 15px;
-            }}
-            
-            .challenge-icon {{
-                width: 40px;
-                height: 40px;
-                font-size: 24px;
-            }}
-            
-            .modal-content {{
-                width: 95%;
-                max-height: 95vh;
-            }}
-            
-            .modal-header {{
-                padding: 15px 20px;
-            }}
-            
-            .modal-body {{
-                padding: 20px;
-            }}
-            
-            .modal-header h2 {{
-                font-size: 18px;
-            }}
-        }}
-        
-        /* Card Sorting Styling */
-        .sorting-section {{
-            background: #e8f4f8;
-            border-radius: 12px;
-            padding: 30px;
-            margin: 30px 0;
-            text-align: center;
-        }}
-        
-        .sorting-section h2 {{
-            color: #2c5f76;
-            margin-bottom: 10px;
-        }}
-        
-        .sorting-controls {{
-            max-width: 600px;
-            margin: 0 auto;
-        }}
-        
-        .sort-count-btn {{
-            background: #ffffff;
-            color: #2c5f76;
-            border: 2px solid #2c5f76;
-            border-radius: 8px;
-            padding: 10px 20px;
-            margin: 0 5px;
-            cursor: pointer;
-            font-size: 16px;
-            transition: all 0.3s ease;
-        }}
-        
-        .sort-count-btn:hover {{
-            background: #2c5f76;
-            color: white;
-            transform: translateY(-2px);
-        }}
-        
-        .sort-count-btn.active {{
-            background: #2c5f76;
-            color: white;
-        }}
-        
-        .sorting-actions {{
-            margin-top: 20px;
-        }}
-        
-        /* Setup modal body for sticky positioning */
-        .modal-body {{
-            position: relative;
-        }}
-        
-        /* Sticky header within modal body */
-        .sorting-header {{
-            position: sticky;
-            top: 0;
-            background: #f8f9fa;
-            border-bottom: 2px solid #e1e5e9;
-            border-radius: 8px 8px 0 0;
-            z-index: 50;
-            padding: 12px 20px;
-            margin: 0 -20px 15px -20px; /* Extend to edges of modal body */
-        }}
-        
-        .sorting-header-content {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            flex-wrap: wrap;
-            gap: 15px;
-        }}
-        
-        .sorting-status-group {{
-            display: flex;
-            flex-direction: column;
-            gap: 5px;
-        }}
-        
-        .sorting-timer {{
-            font-size: 18px;
-            font-weight: bold;
-            color: #2c5f76;
-        }}
-        
-        .sorting-controls {{
-            display: flex;
-            gap: 10px;
-            flex-wrap: wrap;
-        }}
-        
-        .header-btn {{
-            padding: 8px 16px;
-            border: none;
-            border-radius: 6px;
-            font-size: 14px;
-            cursor: pointer;
-            transition: all 0.2s ease;
-        }}
-        
-        .check-btn {{
-            background: #28a745;
-            color: white;
-        }}
-        
-        .check-btn:hover {{
-            background: #218838;
-        }}
-        
-        .reveal-btn {{
-            background: #ffc107;
-            color: #212529;
-        }}
-        
-        .reveal-btn:hover {{
-            background: #e0a800;
-        }}
-        
-        .new-btn {{
-            background: #007bff;
-            color: white;
-        }}
-        
-        .new-btn:hover {{
-            background: #0056b3;
-        }}
-        
-        .end-btn {{
-            background: #dc3545;
-            color: white;
-        }}
-        
-        .end-btn:hover {{
-            background: #c82333;
-        }}
-        
-        .sorting-game-actions {{
-            display: none; /* Hide old action buttons */
-        }}
-        
-        /* Score Modal Styles */
-        .score-modal {{
-            position: fixed;
-            top: 0;
-            left: 0;
-            width: 100%;
-            height: 100%;
-            background: rgba(0, 0, 0, 0.7);
-            z-index: 2000;
-            display: flex;
-            justify-content: center;
-            align-items: center;
-            animation: fadeIn 0.3s ease;
-        }}
-        
-        .score-modal-content {{
-            background: white;
-            border-radius: 12px;
-            max-width: 600px;
-            width: 90%;
-            max-height: 80vh;
-            overflow-y: auto;
-            box-shadow: 0 20px 40px rgba(0, 0, 0, 0.3);
-            animation: slideIn 0.3s ease;
-        }}
-        
-        .score-modal-header {{
-            padding: 20px 30px;
-            border-bottom: 1px solid #e1e5e9;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }}
-        
-        .score-modal-header h3 {{
-            margin: 0;
-            color: #333;
-            font-size: 24px;
-        }}
-        
-        .score-modal-close {{
-            background: none;
-            border: none;
-            font-size: 32px;
-            cursor: pointer;
-            color: #666;
-            padding: 0;
-            width: 40px;
-            height: 40px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            border-radius: 20px;
-            transition: all 0.2s ease;
-        }}
-        
-        .score-modal-close:hover {{
-            background: #f8f9fa;
-            color: #333;
-        }}
-        
-        .score-modal-body {{
-            padding: 30px;
-        }}
-        
-        .score-modal-body .feedback-score {{
-            font-size: 48px;
-            font-weight: bold;
-            text-align: center;
-            margin-bottom: 20px;
-            color: #28a745;
-        }}
-        
-        .score-modal-body .feedback-message {{
-            font-size: 20px;
-            text-align: center;
-            margin-bottom: 15px;
-            color: #333;
-        }}
-        
-        .score-modal-body .feedback-time {{
-            font-size: 18px;
-            text-align: center;
-            margin-bottom: 25px;
-            color: #666;
-            font-weight: bold;
-        }}
-        
-        .score-modal-body .feedback-breakdown {{
-            background: #f8f9fa;
-            border-radius: 8px;
-            padding: 20px;
-            margin: 20px 0;
-        }}
-        
-        .score-modal-body .score-component {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            padding: 8px 0;
-            border-bottom: 1px solid #e9ecef;
-        }}
-        
-        .score-modal-body .score-component:last-child {{
-            border-bottom: none;
-        }}
-        
-        .score-modal-body .component-label {{
-            font-weight: bold;
-            color: #333;
-        }}
-        
-        .score-modal-body .component-score {{
-            font-weight: bold;
-            color: #007bff;
-        }}
-        
-        .score-modal-body .component-weight {{
-            color: #666;
-            font-size: 14px;
-        }}
-        
-        .score-modal-body .feedback-details {{
-            background: #e9ecef;
-            padding: 15px;
-            border-radius: 6px;
-            text-align: center;
-            font-size: 16px;
-            color: #495057;
-        }}
-        
-        .score-modal-footer {{
-            padding: 20px 30px;
-            border-top: 1px solid #e1e5e9;
-            display: flex;
-            gap: 15px;
-            justify-content: flex-end;
-        }}
-        
-        .modal-btn {{
-            padding: 10px 20px;
-            border: none;
-            border-radius: 6px;
-            cursor: pointer;
-            font-size: 16px;
-            transition: all 0.2s ease;
-        }}
-        
-        .new-game-btn {{
-            background: #007bff;
-            color: white;
-        }}
-        
-        .new-game-btn:hover {{
-            background: #0056b3;
-        }}
-        
-        .close-btn {{
-            background: #6c757d;
-            color: white;
-        }}
-        
-        .close-btn:hover {{
-            background: #545b62;
-        }}
-        
-        /* Race Results Specific Styles */
-        .race-results-summary {{
-            text-align: center;
-        }}
-        
-        .race-podium {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            border-radius: 15px;
-            padding: 30px;
-            margin-bottom: 30px;
-            box-shadow: 0 10px 25px rgba(102, 126, 234, 0.3);
-        }}
-        
-        .medal-display {{
-            margin-bottom: 25px;
-        }}
-        
-        .medal-icon {{
-            font-size: 4rem;
-            margin-bottom: 10px;
-            display: block;
-            filter: drop-shadow(0 4px 8px rgba(0,0,0,0.3));
-        }}
-        
-        .medal-rank {{
-            font-size: 1.8rem;
-            font-weight: 700;
-            margin-bottom: 5px;
-            text-shadow: 0 2px 4px rgba(0,0,0,0.3);
-        }}
-        
-        .medal-title {{
-            font-size: 1.3rem;
-            font-weight: 600;
-            opacity: 0.9;
-            letter-spacing: 1px;
-        }}
-        
-        .race-performance {{
-            display: grid;
-            grid-template-columns: repeat(3, 1fr);
-            gap: 20px;
-            margin-top: 25px;
-        }}
-        
-        .perf-metric {{
-            background: rgba(255, 255, 255, 0.15);
-            border-radius: 10px;
-            padding: 15px;
-            backdrop-filter: blur(10px);
-        }}
-        
-        .metric-label {{
-            display: block;
-            font-size: 0.9rem;
-            opacity: 0.8;
-            margin-bottom: 5px;
-        }}
-        
-        .metric-value {{
-            display: block;
-            font-size: 1.4rem;
-            font-weight: 700;
-            text-shadow: 0 1px 3px rgba(0,0,0,0.3);
-        }}
-        
-        .race-statistics {{
-            background: #f8f9fa;
-            border-radius: 12px;
-            padding: 25px;
-            margin-bottom: 25px;
-        }}
-        
-        .stat-row {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            padding: 12px 0;
-            border-bottom: 1px solid #e9ecef;
-        }}
-        
-        .stat-row:last-child {{
-            border-bottom: none;
-        }}
-        
-        .stat-label {{
-            font-weight: 500;
-            color: #495057;
-        }}
-        
-        .stat-value {{
-            font-weight: 700;
-            color: #007bff;
-            font-size: 1.1rem;
-        }}
-        
-        .race-feedback {{
-            background: linear-gradient(135deg, #e3f2fd, #f3e5f5);
-            border-radius: 10px;
-            padding: 20px;
-            border-left: 4px solid #2196f3;
-        }}
-        
-        .race-feedback p {{
-            margin: 0;
-            font-size: 1rem;
-            line-height: 1.5;
-            color: #495057;
-            text-align: center;
-        }}
-        
-        /* Responsive adjustments for race results */
-        @media (max-width: 768px) {{
-            .race-performance {{
-                grid-template-columns: 1fr;
-                gap: 15px;
-            }}
-            
-            .medal-icon {{
-                font-size: 3rem;
-            }}
-            
-            .medal-rank {{
-                font-size: 1.5rem;
-            }}
-            
-            .metric-value {{
-                font-size: 1.2rem;
-            }}
-        }}
-        
-        @keyframes fadeIn {{
-            from {{ opacity: 0; }}
-            to {{ opacity: 1; }}
-        }}
-        
-        @keyframes slideIn {{
-            from {{ 
-                transform: translateY(-50px);
-                opacity: 0;
-            }}
-            to {{ 
-                transform: translateY(0);
-                opacity: 1;
-            }}
-        }}
-        
-        .sort-start-btn, .sort-check-btn, .sort-reveal-btn, .sort-new-btn {{
-            background: #2c5f76;
-            color: white;
-            border: none;
-            border-radius: 8px;
-            padding: 12px 24px;
-            font-size: 16px;
-            cursor: pointer;
-            margin: 0 10px;
-            transition: all 0.3s ease;
-        }}
-        
-        .sort-start-btn:hover, .sort-check-btn:hover, .sort-reveal-btn:hover, .sort-new-btn:hover {{
-            background: #1e4a61;
-            transform: translateY(-2px);
-        }}
-        
-        .sort-check-btn {{
-            background: #28a745;
-        }}
-        
-        .sort-check-btn:hover {{
-            background: #218838;
-        }}
-        
-        .sort-reveal-btn {{
-            background: #ffc107;
-            color: #333;
-        }}
-        
-        .sort-reveal-btn:hover {{
-            background: #e0a800;
-        }}
-        
-        .sort-new-btn {{
-            background: #6f42c1;
-        }}
-        
-        .sort-new-btn:hover {{
-            background: #5a32a3;
-        }}
-        
-        .sorting-instructions {{
-            margin: 20px 0;
-            color: #2c5f76;
-        }}
-        
-        .sorting-progress {{
-            background: #fff;
-            border-radius: 8px;
-            padding: 10px 20px;
-            margin: 10px 0;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        
-        /* Horizontal layout for sorting game */
-        .sorting-game-layout {{
-            display: flex;
-            gap: 30px;
-            margin: 20px 0;
-        }}
-        
-        .available-cards-section {{
-            flex: 1;
-        }}
-        
-        .sorting-slots-section {{
-            flex: 2;
-        }}
-        
-        .available-cards-section h4,
-        .sorting-slots-section h4 {{
-            margin: 0 0 15px 0;
-            color: #2c5f76;
-            font-size: 18px;
-            text-align: center;
-        }}
-        
-        .sorting-area {{
-            display: flex;
-            flex-wrap: wrap;
-            gap: 10px;
-            justify-content: center;
-            padding: 15px;
-            background: rgba(255,255,255,0.5);
-            border-radius: 8px;
-            min-height: 120px;
-            border: 2px dashed #2c5f76;
-        }}
-        
-        @media (max-width: 768px) {{
-            .sorting-game-layout {{
-                flex-direction: column;
-                gap: 20px;
-            }}
-            
-            .available-cards-section,
-            .sorting-slots-section {{
-                flex: none;
-            }}
-        }}
-        
-        .position-slots {{
-            display: flex;
-            flex-wrap: wrap;
-            gap: 8px;
-            justify-content: center;
-            align-items: center;
-            padding: 15px;
-            background: rgba(255,255,255,0.7);
-            border-radius: 8px;
-            border: 2px dashed #2c5f76;
-        }}
-        
-        .insert-button {{
-            width: 32px;
-            height: 50px;
-            background: #2c5f76;
-            color: white;
-            border: none;
-            border-radius: 20px;
-            cursor: pointer;
-            font-size: 24px;
-            font-weight: bold;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            transition: all 0.3s ease;
-            opacity: 0.3;
-        }}
-        
-        .insert-button:hover {{
-            opacity: 1;
-            background: #1976d2;
-            transform: scale(1.1);
-        }}
-        
-        .insert-button.active {{
-            opacity: 1;
-            background: #1976d2;
-            box-shadow: 0 4px 12px rgba(25, 118, 210, 0.3);
-        }}
-        
-        .insert-button.disabled {{
-            opacity: 0.1;
-            cursor: not-allowed;
-        }}
-        
-        .position-slot {{
-            width: 90px;
-            height: 110px;
-            border: 2px solid #2c5f76;
-            border-radius: 8px;
-            background: #fff;
-            display: flex;
-            flex-direction: column;
-            align-items: center;
-            justify-content: center;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            position: relative;
-        }}
-        
-        .position-slot.gradient-bg {{
-            color: white;
-            border-color: rgba(255,255,255,0.3);
-        }}
-        
-        .position-slot:hover {{
-            background: #f0f8ff;
-            border-color: #1a4a5c;
-            transform: scale(1.05);
-        }}
-        
-        .position-slot.active {{
-            background: #e3f2fd;
-            border-color: #1976d2;
-            box-shadow: 0 4px 12px rgba(25, 118, 210, 0.3);
-        }}
-        
-        
-        .position-slot .slot-label {{
-            font-size: 12px;
-            text-align: center;
-            font-weight: 500;
-            text-shadow: 0 1px 2px rgba(0,0,0,0.3);
-            /* Color will be set dynamically based on background */
-        }}
-        
-        .position-slot.filled .slot-label {{
-            position: absolute;
-            bottom: 8px;
-            left: 8px;
-            right: 8px;
-            color: #2c3e50;
-            text-shadow: none;
-            font-size: 11px;
-            font-weight: 600;
-            opacity: 0;
-            transition: opacity 0.3s ease;
-            background: rgba(255, 255, 255, 0.9);
-            border-radius: 4px;
-            padding: 4px 8px;
-        }}
-        
-        .position-slot.filled:hover .slot-label {{
-            opacity: 1;
-        }}
-        
-        .position-slot.filled {{
-            background: #e8f5e8;
-            border-color: #28a745;
-        }}
-        
-        .position-slot.filled .slot-card {{
-            position: absolute;
-            top: 5px;
-            left: 5px;
-            right: 5px;
-            bottom: 5px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-        }}
-        
-        .position-slot.correct {{
-            border-color: #28a745;
-            background: #f8fff9;
-        }}
-        
-        .position-slot.incorrect {{
-            border-color: #dc3545;
-            background: #fff8f8;
-            animation: shake 0.5s ease-in-out;
-        }}
-        
-        .sorting-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fill, minmax(200px, 1fr));
-            gap: 15px;
-            margin: 30px 0;
-            padding: 20px;
-            background: rgba(255,255,255,0.7);
-            border-radius: 12px;
-            min-height: 300px;
-        }}
-        
-        .sort-card {{
-            background: white;
-            border-radius: 8px;
-            padding: 8px;
-            box-shadow: 0 2px 6px rgba(0,0,0,0.1);
-            cursor: pointer;
-            transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-            border: 2px solid transparent;
-            position: relative;
-            user-select: none;
-            width: 90px;
-            height: 90px;
-            display: flex;
-            flex-direction: column;
-            align-items: center;
-            justify-content: center;
-        }}
-        
-        .sort-card .card-svg svg {{
-            max-width: 100%;
-            height: auto;
-        }}
-        
-        .sort-card:hover {{
-            transform: translateY(-5px);
-            box-shadow: 0 8px 16px rgba(0,0,0,0.2);
-            border-color: #2c5f76;
-        }}
-        
-        .sort-card.selected {{
-            border-color: #1976d2;
-            background: #e3f2fd;
-            transform: scale(1.1);
-            box-shadow: 0 6px 20px rgba(25, 118, 210, 0.3);
-        }}
-        
-        .sort-card.placed {{
-            opacity: 0.7;
-            transform: scale(0.9);
-            cursor: default;
-        }}
-        
-        .sort-card.placed:hover {{
-            transform: scale(0.95);
-            border-color: #28a745;
-        }}
-        
-        .sort-card.correct {{
-            border-color: #28a745;
-            background: #f8fff9;
-        }}
-        
-        .sort-card.incorrect {{
-            border-color: #dc3545;
-            background: #fff8f8;
-            animation: shake 0.5s ease-in-out;
-        }}
-        
-        .sort-card .card-position {{
-            position: absolute;
-            top: 5px;
-            left: 5px;
-            background: rgba(44, 95, 118, 0.8);
-            color: white;
-            border-radius: 50%;
-            width: 24px;
-            height: 24px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-size: 12px;
-            font-weight: bold;
-        }}
-        
-        .sort-card .revealed-number {{
-            position: absolute;
-            top: 5px;
-            right: 5px;
-            background: #ffc107;
-            color: #333;
-            border-radius: 4px;
-            padding: 2px 8px;
-            font-size: 14px;
-            font-weight: bold;
-            display: none;
-        }}
-        
-        .sort-card.revealed .revealed-number {{
-            display: block;
-        }}
-        
-        .sorting-feedback {{
-            background: white;
-            border-radius: 12px;
-            padding: 20px;
-            margin: 20px 0;
-            text-align: center;
-        }}
-        
-        .feedback-perfect {{
-            background: linear-gradient(135deg, #d4edda, #c3e6cb);
-            color: #155724;
-            border: 2px solid #28a745;
-        }}
-        
-        .feedback-good {{
-            background: linear-gradient(135deg, #fff3cd, #ffeaa7);
-            color: #856404;
-            border: 2px solid #ffc107;
-        }}
-        
-        .feedback-needs-work {{
-            background: linear-gradient(135deg, #f8d7da, #f5c6cb);
-            color: #721c24;
-            border: 2px solid #dc3545;
-        }}
-        
-        .feedback-score {{
-            font-size: 24px;
-            font-weight: bold;
-            margin: 10px 0;
-        }}
-        
-        .feedback-message {{
-            font-size: 18px;
-            margin: 10px 0;
-        }}
-        
-        .feedback-details {{
-            margin-top: 15px;
-            font-size: 14px;
-            opacity: 0.8;
-        }}
-        
-        .feedback-breakdown {{
-            margin: 20px 0;
-            padding: 15px;
-            background: rgba(255, 255, 255, 0.1);
-            border-radius: 8px;
-        }}
-        
-        .score-component {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin: 8px 0;
-            padding: 5px 0;
-            border-bottom: 1px solid rgba(255, 255, 255, 0.1);
-        }}
-        
-        .score-component:last-child {{
-            border-bottom: none;
-        }}
-        
-        .component-label {{
-            font-weight: bold;
-            flex: 1;
-        }}
-        
-        .component-score {{
-            font-weight: bold;
-            margin: 0 10px;
-            min-width: 40px;
-            text-align: right;
-        }}
-        
-        .component-weight {{
-            font-size: 12px;
-            opacity: 0.7;
-            min-width: 80px;
-            text-align: right;
-        }}
-        
-        @keyframes shake {{
-            0%, 100% {{ transform: translateX(0); }}
-            25% {{ transform: translateX(-5px); }}
-            75% {{ transform: translateX(5px); }}
-        }}
-        
-        @keyframes success-pulse {{
-            0% {{ transform: scale(1); }}
-            50% {{ transform: scale(1.05); }}
-            100% {{ transform: scale(1); }}
-        }}
-        
-        .sort-card.success {{
-            animation: success-pulse 0.6s ease-in-out;
-        }}
-        
-        /* Challenge Buttons */
-        .challenges-section {{
-            margin: 40px 0;
-            max-width: 1200px;
-            margin-left: auto;
-            margin-right: auto;
-        }}
-        
-        .section-header {{
-            text-align: center;
-            margin-bottom: 30px;
-        }}
-        
-        .section-header h2 {{
-            margin: 0 0 10px 0;
-            color: #2c3e50;
-            font-size: 28px;
-        }}
-        
-        .section-header p {{
-            margin: 0;
-            color: #7a8695;
-            font-size: 16px;
-        }}
-        
-        /* Tag Filter Bar */
-        .tag-filter-bar {{
-            background: white;
-            border-radius: 16px;
-            padding: 25px;
-            box-shadow: 0 4px 15px rgba(0, 0, 0, 0.1);
-            margin-bottom: 30px;
-        }}
-        
-        .filter-title {{
-            font-size: 1.1rem;
-            font-weight: 600;
-            color: #2c3e50;
-            margin-bottom: 15px;
-            text-align: center;
-        }}
-        
-        .tag-filters {{
-            display: flex;
-            flex-wrap: wrap;
-            gap: 12px;
-            justify-content: center;
-        }}
-        
-        .tag-filter {{
-            background: #f8f9fa;
-            border: 2px solid #e9ecef;
-            border-radius: 25px;
-            padding: 8px 16px;
-            font-size: 0.9rem;
-            font-weight: 500;
-            color: #6c757d;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            display: flex;
-            align-items: center;
-            gap: 5px;
-        }}
-        
-        .tag-filter:hover {{
-            background: #e9ecef;
-            transform: translateY(-2px);
-            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.1);
-        }}
-        
-        .tag-filter.active {{
-            background: linear-gradient(135deg, #4a90e2, #357abd);
-            color: white;
-            border-color: #4a90e2;
-            box-shadow: 0 4px 15px rgba(74, 144, 226, 0.3);
-        }}
-        
-        .tag-count {{
-            background: rgba(255, 255, 255, 0.2);
-            border-radius: 12px;
-            padding: 2px 8px;
-            font-size: 0.8rem;
-            font-weight: 600;
-        }}
-        
-        .tag-filter.active .tag-count {{
-            background: rgba(255, 255, 255, 0.3);
-        }}
-
-        .challenges-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(350px, 1fr));
-            gap: 30px;
-            margin-top: 0px;
-        }}
-        
-        .challenge-category {{
-            background: white;
-            border-radius: 16px;
-            padding: 25px;
-            box-shadow: 0 4px 12px rgba(0,0,0,0.1);
-            border: 1px solid #f0f2f5;
-        }}
-        
-        .category-title {{
-            margin: 0 0 20px 0;
-            color: #2c3e50;
-            font-size: 18px;
-            font-weight: 600;
-            text-align: center;
-            padding-bottom: 15px;
-            border-bottom: 2px solid #f0f2f5;
-        }}
-        
-        .challenge-cards {{
-            display: flex;
-            flex-direction: column;
-            gap: 15px;
-        }}
-        
-        .challenge-card {{
-            background: linear-gradient(135deg, #4a90e2, #357abd);
-            color: white;
-            border: none;
-            border-radius: 12px;
-            padding: 20px;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            display: flex;
-            align-items: center;
-            gap: 15px;
-            text-align: left;
-            min-height: 100px;
-        }}
-        
-        .challenge-card:hover {{
-            transform: translateY(-2px);
-            box-shadow: 0 8px 25px rgba(74, 144, 226, 0.4);
-        }}
-        
-        .challenge-icon {{
-            font-size: 32px;
-            flex-shrink: 0;
-            width: 50px;
-            height: 50px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            background: rgba(255,255,255,0.2);
-            border-radius: 12px;
-        }}
-        
-        .challenge-content {{
-            flex: 1;
-        }}
-        
-        .challenge-content h4 {{
-            margin: 0 0 8px 0;
-            font-size: 18px;
-            font-weight: 600;
-        }}
-        
-        .challenge-content p {{
-            margin: 0 0 12px 0;
-            opacity: 0.9;
-            font-size: 14px;
-            line-height: 1.4;
-        }}
-        
-        .challenge-tags {{
-            display: flex;
-            gap: 10px;
-            flex-wrap: wrap;
-            margin-top: 8px;
-        }}
-        
-        .tag {{
-            background: rgba(255,255,255,0.2);
-            padding: 4px 8px;
-            border-radius: 6px;
-            font-size: 12px;
-            font-weight: 500;
-            border: 1px solid rgba(255,255,255,0.3);
-        }}
-        
-        .sorting-card {{
-            background: linear-gradient(135deg, #2c5f76, #1e4a61);
-        }}
-        
-        .sorting-card:hover {{
-            box-shadow: 0 8px 25px rgba(44, 95, 118, 0.4);
-        }}
-        
-        .matching-card {{
-            background: linear-gradient(135deg, #7b4397, #dc2430);
-        }}
-        
-        .matching-card:hover {{
-            box-shadow: 0 8px 25px rgba(123, 67, 151, 0.4);
-        }}
-        
-        .start-game-btn {{
-            background: linear-gradient(135deg, #6c5ce7, #a29bfe);
-            color: white;
-            border: none;
-            padding: 15px 20px;
-            border-radius: 12px;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            text-align: center;
-            min-height: 70px;
-            display: flex;
-            flex-direction: column;
-            justify-content: center;
-            align-items: center;
-            gap: 4px;
-        }}
-        
-        .start-game-btn:hover {{
-            background: linear-gradient(135deg, #5f4ed6, #9085f5);
-            transform: translateY(-2px);
-            box-shadow: 0 8px 20px rgba(108, 92, 231, 0.4);
-        }}
-        
-        .start-game-btn .btn-main {{
-            font-size: 16px;
-            font-weight: 600;
-            line-height: 1.2;
-        }}
-        
-        .start-game-btn .btn-sub {{
-            font-size: 13px;
-            opacity: 0.9;
-            font-weight: 400;
-        }}
-        
-        .mode-buttons, .timer-buttons {{
-            display: flex;
-            gap: 10px;
-            flex-wrap: wrap;
-        }}
-        
-        .mode-btn, .timer-btn, .game-type-btn, .timeout-btn {{
-            background: #f8f9fa;
-            border: 2px solid #e9ecef;
-            padding: 10px 15px;
-            border-radius: 8px;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            display: flex;
-            align-items: center;
-            gap: 8px;
-            min-width: 120px;
-            justify-content: center;
-        }}
-        
-        .mode-btn.active, .timer-btn.active, .game-type-btn.active, .timeout-btn.active {{
-            background: #007bff;
-            border-color: #007bff;
-            color: white;
-        }}
-        
-        .mode-btn:hover, .timer-btn:hover, .game-type-btn:hover, .timeout-btn:hover {{
-            border-color: #007bff;
-            background: #e3f2fd;
-        }}
-        
-        .mode-btn.active:hover, .timer-btn.active:hover, .game-type-btn.active:hover, .timeout-btn.active:hover {{
-            background: #0056b3;
-        }}
-        
-        .mode-icon {{
-            font-size: 18px;
-        }}
-        
-        .mode-text {{
-            font-weight: 500;
-        }}
-        
-        .timer-btn {{
-            min-width: 80px;
-            font-size: 14px;
-            font-weight: 500;
-        }}
-        
-        /* Matching Game Styles */
-        .matching-header {{
-            position: sticky;
-            top: 0;
-            background: #f8f9fa;
-            border-bottom: 2px solid #e9ecef;
-            padding: 15px 20px;
-            z-index: 100;
-            margin: 0 -20px 15px -20px;
-        }}
-        
-        .matching-header-content {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }}
-        
-        .matching-status-group {{
-            display: flex;
-            flex-direction: column;
-            gap: 5px;
-        }}
-        
-        .matching-stats {{
-            display: flex;
-            gap: 15px;
-            font-size: 14px;
-            color: #6c757d;
-        }}
-        
-        .matching-timer {{
-            font-weight: 600;
-            color: #495057;
-        }}
-        
-        .player-stats {{
-            display: flex;
-            align-items: center;
-            gap: 20px;
-            margin-top: 10px;
-        }}
-        
-        .player-info {{
-            display: flex;
-            flex-direction: column;
-            align-items: center;
-            padding: 8px 12px;
-            background: #f8f9fa;
-            border-radius: 8px;
-            min-width: 80px;
-        }}
-        
-        .player-info.active {{
-            color: white;
-        }}
-        
-        .player-info.player1 {{
-            border: 2px solid #007bff;
-        }}
-        
-        .player-info.player1.active {{
-            background: #007bff;
-        }}
-        
-        .player-info.player2 {{
-            border: 2px solid #fd7e14;
-        }}
-        
-        .player-info.player2.active {{
-            background: #fd7e14;
-        }}
-        
-        .player-name {{
-            font-size: 12px;
-            font-weight: 600;
-            margin-bottom: 2px;
-        }}
-        
-        .player-score {{
-            font-size: 14px;
-            font-weight: 500;
-        }}
-        
-        .current-turn {{
-            font-size: 16px;
-            font-weight: 600;
-            color: #007bff;
-            text-align: center;
-        }}
-        
-        .turn-timer {{
-            font-size: 20px;
-            font-weight: 700;
-            color: #495057;
-            background: #e9ecef;
-            padding: 8px 12px;
-            border-radius: 8px;
-            min-width: 60px;
-            text-align: center;
-            border: 2px solid #dee2e6;
-        }}
-        
-        .turn-timer.warning {{
-            background: #fff3cd;
-            color: #856404;
-            animation: timerPulse 1s infinite;
-        }}
-        
-        .turn-timer.critical {{
-            background: #f8d7da;
-            color: #721c24;
-            animation: timerPulse 0.5s infinite;
-        }}
-        
-        .turn-timer.waiting {{
-            background: #d1ecf1;
-            color: #0c5460;
-            opacity: 0.8;
-        }}
-        
-        @keyframes timerPulse {{
-            0%, 100% {{ transform: scale(1); }}
-            50% {{ transform: scale(1.1); }}
-        }}
-        
-        .two-player-results {{
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            gap: 30px;
-            margin: 20px 0;
-            padding: 20px;
-            background: #f8f9fa;
-            border-radius: 12px;
-        }}
-        
-        .player-result {{
-            display: flex;
-            flex-direction: column;
-            align-items: center;
-            gap: 10px;
-        }}
-        
-        .player-name {{
-            font-size: 16px;
-            font-weight: 600;
-            color: #495057;
-        }}
-        
-        .player-final-score {{
-            font-size: 24px;
-            font-weight: 700;
-            color: #007bff;
-        }}
-        
-        .vs-divider {{
-            font-size: 18px;
-            font-weight: 700;
-            color: #6c757d;
-            padding: 0 10px;
-        }}
-        
-        .game-summary {{
-            display: flex;
-            justify-content: space-between;
-            margin-top: 20px;
-            padding: 15px;
-            background: #e3f2fd;
-            border-radius: 8px;
-        }}
-        
-        .summary-item {{
-            display: flex;
-            flex-direction: column;
-            align-items: center;
-            gap: 5px;
-        }}
-        
-        .summary-label {{
-            font-size: 12px;
-            color: #6c757d;
-            text-transform: uppercase;
-            font-weight: 600;
-        }}
-        
-        .summary-value {{
-            font-size: 16px;
-            font-weight: 600;
-            color: #495057;
-        }}
-        
-        .matching-grid {{
-            display: grid;
-            gap: 8px;
-            padding: 10px;
-            justify-content: center;
-            width: 100%;
-            max-width: 100%;
-            box-sizing: border-box;
-        }}
-        
-        .matching-grid.grid-3x4 {{
-            grid-template-columns: repeat(4, 1fr);
-            aspect-ratio: 4/3;
-            width: min(100%, calc(100vh - 280px) * 4/3);
-            height: min(calc(100vw - 40px) * 3/4, calc(100vh - 280px));
-        }}
-        
-        .matching-grid.grid-4x4 {{
-            grid-template-columns: repeat(4, 1fr);
-            aspect-ratio: 1;
-            width: min(100%, calc(100vh - 280px));
-            height: min(calc(100vw - 40px), calc(100vh - 280px));
-        }}
-        
-        .matching-grid.grid-4x6 {{
-            grid-template-columns: repeat(6, 1fr);
-            aspect-ratio: 6/4;
-            width: min(100%, calc(100vh - 280px) * 6/4);
-            height: min(calc(100vw - 40px) * 4/6, calc(100vh - 280px));
-        }}
-        
-        .matching-grid.grid-5x6 {{
-            grid-template-columns: repeat(6, 1fr);
-            aspect-ratio: 6/5;
-            width: min(100%, calc(100vh - 280px) * 6/5);
-            height: min(calc(100vw - 40px) * 5/6, calc(100vh - 280px));
-        }}
-        
-        .match-card {{
-            aspect-ratio: 1;
-            background: #ffffff;
-            border: 2px solid #e9ecef;
-            border-radius: 8px;
-            cursor: pointer;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            position: relative;
-            transition: all 0.3s ease;
-            user-select: none;
-            width: 100%;
-            height: 100%;
-            box-sizing: border-box;
-        }}
-        
-        /* Cards automatically size to fill grid cells while maintaining aspect ratio */
-        .match-card {{
-            /* Let the card fill the grid cell */
-            width: 100%;
-            height: 100%;
-            min-width: 0;
-            min-height: 0;
-        }}
-        
-        .match-card:hover {{
-            border-color: #007bff;
-            transform: translateY(-2px);
-            box-shadow: 0 4px 12px rgba(0, 123, 255, 0.2);
-        }}
-        
-        .match-card.flipped {{
-            background: #f8f9fa;
-            border-color: #007bff;
-        }}
-        
-        .match-card.matched {{
-            background: #d4edda;
-            border-color: #28a745;
-            cursor: default;
-            position: relative;
-            opacity: 0.7;
-            filter: grayscale(20%);
-            transform: scale(0.95);
-            transition: all 0.3s ease;
-        }}
-        
-        .match-card.matched:hover {{
-            transform: scale(0.95);
-            box-shadow: none;
-            border-color: #28a745;
-        }}
-        
-        .match-card.matched-player1 {{
-            background: #cce7ff;
-            border-color: #007bff;
-            box-shadow: none;
-            opacity: 0.7;
-            filter: grayscale(20%);
-        }}
-        
-        .match-card.matched-player1:hover {{
-            border-color: #007bff;
-            box-shadow: none;
-        }}
-        
-        .match-card.matched-player1::before {{
-            border-color: #007bff !important;
-            background: linear-gradient(45deg, rgba(0, 123, 255, 0.1), rgba(0, 123, 255, 0.05)) !important;
-        }}
-        
-        .match-card.matched-player1::after {{
-            background: #007bff !important;
-            box-shadow: 0 0 0 1px #007bff, 0 0 8px rgba(0, 123, 255, 0.4) !important;
-        }}
-        
-        .match-card.matched-player2 {{
-            background: #ffe6cc;
-            border-color: #fd7e14;
-            box-shadow: none;
-            opacity: 0.7;
-            filter: grayscale(20%);
-        }}
-        
-        .match-card.matched-player2:hover {{
-            border-color: #fd7e14;
-            box-shadow: none;
-        }}
-        
-        .match-card.matched-player2::before {{
-            border-color: #fd7e14 !important;
-            background: linear-gradient(45deg, rgba(253, 126, 20, 0.1), rgba(253, 126, 20, 0.05)) !important;
-        }}
-        
-        .match-card.matched-player2::after {{
-            background: #fd7e14 !important;
-            box-shadow: 0 0 0 1px #fd7e14, 0 0 8px rgba(253, 126, 20, 0.4) !important;
-        }}
-        
-        .player-badge {{
-            position: absolute;
-            top: -8px;
-            right: -8px;
-            width: 24px;
-            height: 24px;
-            border-radius: 50%;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-size: 12px;
-            font-weight: 700;
-            color: white;
-            border: 2px solid white;
-            box-shadow: 0 2px 4px rgba(0, 0, 0, 0.2);
-            z-index: 20;
-        }}
-        
-        .player-badge.player1 {{
-            background: #007bff;
-        }}
-        
-        .player-badge.player2 {{
-            background: #fd7e14;
-        }}
-        
-        .match-card.matched::after {{
-            content: '';
-            position: absolute;
-            bottom: 3px;
-            left: 3px;
-            width: 12px;
-            height: 12px;
-            background: #28a745;
-            border: 2px solid white;
-            border-radius: 50%;
-            box-shadow: 0 0 0 1px #28a745, 0 0 8px rgba(40, 167, 69, 0.4);
-            pointer-events: none;
-            z-index: 10;
-        }}
-        
-        .match-card.matched::before {{
-            content: '';
-            position: absolute;
-            top: -2px;
-            left: -2px;
-            right: -2px;
-            bottom: -2px;
-            border: 2px solid #28a745;
-            border-radius: 10px;
-            background: linear-gradient(45deg, rgba(40, 167, 69, 0.1), rgba(40, 167, 69, 0.05));
-            pointer-events: none;
-            z-index: 1;
-        }}
-        
-        .match-card.matched .match-card-content {{
-            opacity: 0.6;
-        }}
-        
-        .match-card.invalid-move {{
-            animation: invalidMoveShake 0.6s ease-in-out;
-            border-color: #dc3545 !important;
-        }}
-        
-        @keyframes invalidMoveShake {{
-            0%, 100% {{ transform: translateX(0); }}
-            10%, 30%, 50%, 70%, 90% {{ transform: translateX(-3px); }}
-            20%, 40%, 60%, 80% {{ transform: translateX(3px); }}
-        }}
-        
-        .match-card.valid-choice {{
-            border-color: #28a745 !important;
-            box-shadow: 0 0 8px rgba(40, 167, 69, 0.4);
-            animation: validChoicePulse 2s infinite;
-        }}
-        
-        .match-card.invalid-choice {{
-            opacity: 0.5;
-            cursor: not-allowed;
-        }}
-        
-        .match-card.invalid-choice:hover {{
-            transform: none;
-            box-shadow: none;
-        }}
-        
-        @keyframes validChoicePulse {{
-            0%, 100% {{ box-shadow: 0 0 8px rgba(40, 167, 69, 0.4); }}
-            50% {{ box-shadow: 0 0 12px rgba(40, 167, 69, 0.7); }}
-        }}
-        
-        @keyframes matchedCard {{
-            0% {{ 
-                transform: scale(1) rotate(0deg);
-                opacity: 1;
-            }}
-            50% {{ 
-                transform: scale(1.1) rotate(2deg);
-                opacity: 0.9;
-            }}
-            100% {{ 
-                transform: scale(0.95) rotate(0deg);
-                opacity: 0.7;
-            }}
-        }}
-        
-        .match-card.matched {{
-            animation: matchedCard 0.6s ease-out forwards;
-        }}
-        
-        .match-card-content {{
-            display: none;
-            width: 100%;
-            height: 100%;
-            padding: 8px;
-        }}
-        
-        .match-card.flipped .match-card-content,
-        .match-card.matched .match-card-content {{
-            display: flex;
-            align-items: center;
-            justify-content: center;
-        }}
-        
-        .match-card-number {{
-            font-size: 24px;
-            font-weight: bold;
-            color: #495057;
-        }}
-        
-        .match-card-abacus {{
-            width: 100%;
-            height: 100%;
-        }}
-        
-        .match-card-abacus svg {{
-            width: 100%;
-            height: 100%;
-        }}
-        
-        .match-card-back {{
-            position: absolute;
-            top: 0;
-            left: 0;
-            right: 0;
-            bottom: 0;
-            display: flex;
-            flex-direction: column;
-            align-items: center;
-            justify-content: center;
-            color: white;
-            font-size: 14px;
-            font-weight: 600;
-            gap: 4px;
-            border-radius: 6px;
-            overflow: hidden;
-        }}
-        
-        .match-card-back.abacus-type {{
-            background: linear-gradient(135deg, #6c5ce7, #a29bfe);
-        }}
-        
-        .match-card-back.number-type {{
-            background: linear-gradient(135deg, #00b894, #00cec9);
-        }}
-        
-        .match-card-back.friends-5-type {{
-            background: linear-gradient(135deg, #ff6b6b, #feca57);
-        }}
-        
-        .match-card-back.friends-10-type {{
-            background: linear-gradient(135deg, #667eea, #764ba2);
-        }}
-        
-        .complement-number {{
-            font-size: 1.8rem;
-            font-weight: bold;
-            text-align: center;
-            line-height: 1.2;
-            white-space: pre-line;
-        }}
-        
-        .match-card-back .card-type-icon {{
-            font-size: 40px;
-        }}
-        
-        .match-card.flipped .match-card-back,
-        .match-card.matched .match-card-back {{
-            display: none;
-        }}
-        
-        .matching-instructions {{
-            background: #e3f2fd;
-            border: 1px solid #bbdefb;
-            border-radius: 8px;
-            padding: 15px;
-            margin: 0 0 20px 0;
-            text-align: center;
-        }}
-        
-        .matching-feedback {{
-            background: white;
-            border-radius: 12px;
-            padding: 20px;
-            margin: 20px 0;
-            text-align: center;
-        }}
-        
-        @media (max-width: 768px) {{
-            .matching-grid {{
-                gap: 6px;
-                padding: 8px;
-            }}
-            
-            .matching-grid.grid-3x4 {{
-                width: min(100%, calc(100vh - 260px) * 4/3);
-                height: min(calc(100vw - 30px) * 3/4, calc(100vh - 260px));
-            }}
-            
-            .matching-grid.grid-4x4 {{
-                width: min(100%, calc(100vh - 260px));
-                height: min(calc(100vw - 30px), calc(100vh - 260px));
-            }}
-            
-            .matching-grid.grid-4x6 {{
-                width: min(100%, calc(100vh - 260px) * 6/4);
-                height: min(calc(100vw - 30px) * 4/6, calc(100vh - 260px));
-            }}
-            
-            .matching-grid.grid-5x6 {{
-                width: min(100%, calc(100vh - 260px) * 6/5);
-                height: min(calc(100vw - 30px) * 5/6, calc(100vh - 260px));
-            }}
-            
-            .match-card-number {{
-                font-size: 16px;
-            }}
-            
-            .match-card-back .card-type-icon {{
-                font-size: 28px;
-            }}
-            
-            .matching-header {{
-                padding: 10px 15px;
-                margin: 0 -20px 10px -20px;
-            }}
-            
-            .matching-instructions {{
-                padding: 12px;
-                margin: 0 0 15px 0;
-                font-size: 14px;
-            }}
-            
-            .start-game-btn {{
-                min-height: 60px;
-                padding: 12px 16px;
-            }}
-            
-            .start-game-btn .btn-main {{
-                font-size: 14px;
-            }}
-            
-            .start-game-btn .btn-sub {{
-                font-size: 12px;
-            }}
-        }}
-        
-        @media (max-width: 480px) {{
-            .matching-grid {{
-                gap: 4px;
-                padding: 5px;
-            }}
-            
-            .matching-grid.grid-3x4 {{
-                width: min(100%, calc(100vh - 240px) * 4/3);
-                height: min(calc(100vw - 20px) * 3/4, calc(100vh - 240px));
-            }}
-            
-            .matching-grid.grid-4x4 {{
-                width: min(100%, calc(100vh - 240px));
-                height: min(calc(100vw - 20px), calc(100vh - 240px));
-            }}
-            
-            .matching-grid.grid-4x6 {{
-                width: min(100%, calc(100vh - 240px) * 6/4);
-                height: min(calc(100vw - 20px) * 4/6, calc(100vh - 240px));
-            }}
-            
-            .matching-grid.grid-5x6 {{
-                width: min(100%, calc(100vh - 240px) * 6/5);
-                height: min(calc(100vw - 20px) * 5/6, calc(100vh - 240px));
-            }}
-            
-            .match-card-number {{
-                font-size: 14px;
-            }}
-            
-            .match-card-back .card-type-icon {{
-                font-size: 24px;
-            }}
-            
-            .start-game-btn {{
-                min-height: 50px;
-                padding: 10px 12px;
-            }}
-            
-            .start-game-btn .btn-main {{
-                font-size: 13px;
-            }}
-            
-            .start-game-btn .btn-sub {{
-                font-size: 11px;
-            }}
-            
-            .match-card.matched::after {{
-                width: 10px;
-                height: 10px;
-                bottom: 2px;
-                left: 2px;
-            }}
-        }}
-        
-        /* Modal Styling */
-        .modal {{
-            display: none;
-            position: fixed;
-            z-index: 1000;
-            left: 0;
-            top: 0;
-            width: 100%;
-            height: 100%;
-            background: rgba(0, 0, 0, 0.5);
-            animation: fadeIn 0.3s ease-out;
-        }}
-        
-        .modal.show {{
-            display: flex;
-            align-items: center;
-            justify-content: center;
-        }}
-        
-        .modal-content {{
-            background: white;
-            border-radius: 12px;
-            width: 90%;
-            max-width: 900px;
-            max-height: 90vh;
-            display: flex;
-            flex-direction: column;
-            animation: slideIn 0.3s ease-out;
-            box-shadow: 0 20px 40px rgba(0, 0, 0, 0.3);
-        }}
-        
-        .modal-header {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            padding: 20px 30px;
-            border-bottom: 1px solid #eee;
-            background: linear-gradient(135deg, #f8f9fa, #e9ecef);
-            border-radius: 12px 12px 0 0;
-        }}
-        
-        .modal-header h2 {{
-            margin: 0;
-            color: #333;
-        }}
-        
-        .modal-controls {{
-            display: flex;
-            gap: 10px;
-        }}
-        
-        .fullscreen-btn, .close-btn {{
-            background: none;
-            border: none;
-            font-size: 24px;
-            cursor: pointer;
-            padding: 5px 10px;
-            border-radius: 6px;
-            transition: background 0.2s ease;
-        }}
-        
-        .fullscreen-btn:hover, .close-btn:hover {{
-            background: rgba(0, 0, 0, 0.1);
-        }}
-        
-        .close-btn {{
-            color: #666;
-        }}
-        
-        .close-btn:hover {{
-            color: #333;
-        }}
-        
-        .modal-body {{
-            padding: 30px;
-            flex: 1;
-            overflow-y: auto;
-        }}
-        
-        /* Fullscreen modal styling */
-        .modal.fullscreen {{
-            background: rgba(0, 0, 0, 0.95);
-        }}
-        
-        .modal.fullscreen .modal-content {{
-            width: 100%;
-            height: 100%;
-            max-width: none;
-            max-height: none;
-            border-radius: 0;
-        }}
-        
-        .modal.fullscreen .modal-header {{
-            border-radius: 0;
-        }}
-        
-        /* Animations */
-        @keyframes fadeIn {{
-            from {{ opacity: 0; }}
-            to {{ opacity: 1; }}
-        }}
-        
-        @keyframes slideIn {{
-            from {{ transform: scale(0.9) translateY(-20px); opacity: 0; }}
-            to {{ transform: scale(1) translateY(0); opacity: 1; }}
-        }}
-        
-        /* Speed Complement Race Enhanced UI Styles */
-        .complement-intro {{
-            text-align: center;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 30px;
-            border-radius: 15px;
-            margin-bottom: 30px;
-            position: relative;
-            overflow: hidden;
-        }}
-        
-        .complement-intro::before {{
-            content: '';
-            position: absolute;
-            top: -50%;
-            left: -50%;
-            width: 200%;
-            height: 200%;
-            background: url('data:image/svg+xml,<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 100 100"><circle cx="20" cy="20" r="2" fill="white" opacity="0.1"/><circle cx="80" cy="30" r="1.5" fill="white" opacity="0.1"/><circle cx="60" cy="70" r="1" fill="white" opacity="0.15"/></svg>');
-            animation: float 15s ease-in-out infinite;
-        }}
-        
-        .intro-icon {{
-            font-size: 4rem;
-            margin-bottom: 15px;
-            display: block;
-            filter: drop-shadow(0 4px 8px rgba(0,0,0,0.3));
-        }}
-        
-        .complement-intro h3 {{
-            margin: 0 0 15px 0;
-            font-size: 2rem;
-            font-weight: 700;
-            text-shadow: 0 2px 4px rgba(0,0,0,0.3);
-            position: relative;
-            z-index: 1;
-        }}
-        
-        .intro-description {{
-            font-size: 1.1rem;
-            margin-bottom: 25px;
-            opacity: 0.95;
-            position: relative;
-            z-index: 1;
-            line-height: 1.4;
-        }}
-        
-        .example-demo {{
-            background: rgba(255, 255, 255, 0.15);
-            border-radius: 12px;
-            padding: 20px;
-            backdrop-filter: blur(10px);
-            position: relative;
-            z-index: 1;
-        }}
-        
-        .demo-equation {{
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            gap: 15px;
-            margin-bottom: 10px;
-            font-size: 2rem;
-            font-weight: bold;
-        }}
-        
-        .demo-number {{
-            background: #ff6b6b;
-            color: white;
-            padding: 10px 15px;
-            border-radius: 10px;
-            box-shadow: 0 4px 8px rgba(0,0,0,0.2);
-        }}
-        
-        .demo-answer {{
-            background: #feca57;
-            color: #333;
-            padding: 10px 15px;
-            border-radius: 10px;
-            box-shadow: 0 4px 8px rgba(0,0,0,0.2);
-            animation: pulse 2s infinite;
-        }}
-        
-        .demo-target {{
-            background: #48dbfb;
-            color: white;
-            padding: 10px 15px;
-            border-radius: 10px;
-            box-shadow: 0 4px 8px rgba(0,0,0,0.2);
-        }}
-        
-        .demo-plus, .demo-equals {{
-            color: white;
-            font-weight: bold;
-            text-shadow: 0 2px 4px rgba(0,0,0,0.3);
-        }}
-        
-        .demo-instruction {{
-            font-size: 1.1rem;
-            color: #fff;
-            opacity: 0.9;
-        }}
-        
-        /* Enhanced Game Display */
-        .complement-display {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            border-radius: 20px;
-            padding: 40px;
-            margin-bottom: 30px;
-            color: white;
-            position: relative;
-            overflow: hidden;
-            box-shadow: 0 20px 40px rgba(102, 126, 234, 0.3);
-        }}
-        
-        .complement-display::before {{
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 0;
-            right: 0;
-            bottom: 0;
-            background: url('data:image/svg+xml,<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 100 100"><circle cx="25" cy="25" r="1" fill="white" opacity="0.1"/><circle cx="75" cy="75" r="1" fill="white" opacity="0.1"/></svg>');
-            pointer-events: none;
-        }}
-        
-        .challenge-prompt {{
-            text-align: center;
-            position: relative;
-            z-index: 1;
-            margin-bottom: 30px;
-        }}
-        
-        
-        /* Coal Spilling Animation */
-        @keyframes coalSpill {{
-            0% {{
-                transform: translateY(0px) rotate(0deg);
-                opacity: 1;
-            }}
-            50% {{
-                transform: translateY(40px) translateX(20px) rotate(180deg);
-                opacity: 0.8;
-            }}
-            100% {{
-                transform: translateY(80px) translateX(40px) rotate(360deg);
-                opacity: 0;
-            }}
-        }}
-        
-        .coal-chunk {{
-            color: #2c2c2c;
-            text-shadow: 1px 1px 2px rgba(0, 0, 0, 0.5);
-        }}
-        
-        /* Pressure Alarm Animation */
-        @keyframes pressureAlarm {{
-            0%, 100% {{
-                filter: brightness(1) saturate(1);
-                transform: scale(1);
-            }}
-            25% {{
-                filter: brightness(1.5) saturate(2) hue-rotate(0deg);
-                transform: scale(1.05);
-            }}
-            50% {{
-                filter: brightness(2) saturate(3) hue-rotate(15deg);
-                transform: scale(1.1);
-            }}
-            75% {{
-                filter: brightness(1.5) saturate(2) hue-rotate(-15deg);
-                transform: scale(1.05);
-            }}
-        }}
-        
-        /* Route Completion Celebration */
-        .route-completion-celebration {{
-            position: absolute;
-            top: 0;
-            left: 0;
-            width: 100%;
-            height: 100%;
-            background: rgba(0, 0, 0, 0.8);
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            z-index: 1000;
-            animation: celebrationFadeIn 0.5s ease-out;
-        }}
-        
-        .celebration-content {{
-            background: linear-gradient(135deg, #ffd700, #ffed4e);
-            color: #333;
-            padding: 40px;
-            border-radius: 20px;
-            text-align: center;
-            box-shadow: 0 20px 40px rgba(255, 215, 0, 0.3);
-            animation: celebrationBounce 0.8s ease-out;
-            max-width: 400px;
-        }}
-        
-        .celebration-content h2 {{
-            margin: 0 0 15px 0;
-            font-size: 1.8rem;
-            font-weight: 700;
-        }}
-        
-        .celebration-content p {{
-            margin: 0 0 20px 0;
-            font-size: 1.1rem;
-            font-weight: 600;
-        }}
-        
-        .progress-stats {{
-            display: flex;
-            flex-direction: column;
-            gap: 8px;
-            font-size: 0.95rem;
-            font-weight: 600;
-        }}
-        
-        .progress-stats div {{
-            background: rgba(255, 255, 255, 0.3);
-            padding: 8px 12px;
-            border-radius: 8px;
-        }}
-        
-        @keyframes celebrationFadeIn {{
-            from {{
-                opacity: 0;
-            }}
-            to {{
-                opacity: 1;
-            }}
-        }}
-        
-        @keyframes celebrationBounce {{
-            0% {{
-                transform: scale(0.3) rotate(-10deg);
-                opacity: 0;
-            }}
-            50% {{
-                transform: scale(1.05) rotate(2deg);
-            }}
-            100% {{
-                transform: scale(1) rotate(0deg);
-                opacity: 1;
-            }}
-        }}
-        
-        
-        .equation-visual {{
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            gap: 25px;
-            flex-wrap: wrap;
-        }}
-        
-        .challenge-number-container,
-        .answer-container,
-        .target-container {{
-            text-align: center;
-            position: relative;
-        }}
-        
-        .challenge-number {{
-            font-size: 4rem;
-            font-weight: 700;
-            background: linear-gradient(135deg, #ff6b6b, #feca57);
-            color: white;
-            padding: 20px 25px;
-            border-radius: 20px;
-            box-shadow: 0 10px 25px rgba(255, 107, 107, 0.4);
-            text-shadow: 0 2px 4px rgba(0,0,0,0.3);
-            animation: bounceIn 1s ease-out;
-        }}
-        
-        .answer-display {{
-            font-size: 4rem;
-            font-weight: 700;
-            background: linear-gradient(135deg, #feca57, #ff9ff3);
-            color: white;
-            padding: 20px 25px;
-            border-radius: 20px;
-            box-shadow: 0 10px 25px rgba(254, 202, 87, 0.4);
-            text-shadow: 0 2px 4px rgba(0,0,0,0.3);
-            text-align: center;
-            min-width: 100px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            animation: pulse 2s infinite;
-            transition: all 0.3s ease;
-            user-select: none;
-        }}
-        
-        .answer-display.typing {{
-            animation: none;
-            transform: scale(1.1);
-            box-shadow: 0 0 0 4px rgba(255, 255, 255, 0.3), 0 15px 35px rgba(254, 202, 87, 0.6);
-            background: linear-gradient(135deg, #ff9ff3, #feca57);
-        }}
-        
-        .answer-display.empty {{
-            color: rgba(255, 255, 255, 0.7);
-        }}
-        
-        .target-number {{
-            font-size: 4rem;
-            font-weight: 700;
-            background: linear-gradient(135deg, #48dbfb, #0abde3);
-            color: white;
-            padding: 20px 25px;
-            border-radius: 20px;
-            box-shadow: 0 10px 25px rgba(72, 219, 251, 0.4);
-            text-shadow: 0 2px 4px rgba(0,0,0,0.3);
-        }}
-        
-        .equation-symbol {{
-            font-size: 3rem;
-            font-weight: bold;
-            color: white;
-            text-shadow: 0 2px 4px rgba(0,0,0,0.3);
-        }}
-        
-        .number-label,
-        .answer-label,
-        .target-label {{
-            font-size: 0.9rem;
-            margin-top: 8px;
-            opacity: 0.8;
-            font-weight: 500;
-            text-transform: uppercase;
-            letter-spacing: 1px;
-        }}
-        
-        .answer-arrow {{
-            font-size: 1.5rem;
-            margin-top: 5px;
-            animation: bounce 1s infinite;
-        }}
-        
-        /* Enhanced Timer */
-        .timer-section {{
-            text-align: center;
-            position: relative;
-            z-index: 1;
-        }}
-        
-        .timer-label {{
-            font-size: 1.1rem;
-            margin-bottom: 10px;
-            opacity: 0.9;
-            font-weight: 500;
-        }}
-        
-        .timer-bar {{
-            background: rgba(255, 255, 255, 0.2);
-            height: 12px;
-            border-radius: 25px;
-            overflow: hidden;
-            margin-bottom: 10px;
-            box-shadow: inset 0 2px 4px rgba(0,0,0,0.2);
-        }}
-        
-        .timer-fill {{
-            height: 100%;
-            background: linear-gradient(90deg, #ff6b6b, #feca57, #ff6b6b);
-            border-radius: 25px;
-            transition: width 0.1s linear;
-            box-shadow: 0 0 10px rgba(255, 107, 107, 0.6);
-            animation: shimmer 2s infinite;
-        }}
-        
-        .timer-text {{
-            font-size: 1.3rem;
-            font-weight: bold;
-            text-shadow: 0 2px 4px rgba(0,0,0,0.3);
-        }}
-        
-        /* Race Track Styles */
-        .race-track-section {{
-            margin-top: 25px;
-            padding: 50px 150px 20px 150px;
-            background: rgba(255, 255, 255, 0.1);
-            border-radius: 15px;
-            border: 2px solid rgba(255, 255, 255, 0.2);
-        }}
-        
-        @media (max-width: 768px) {{
-            .race-track-section {{
-                padding: 30px 80px 20px 80px;
-            }}
-        }}
-        
-        @media (max-width: 480px) {{
-            .race-track-section {{
-                padding: 30px 40px 20px 40px;
-            }}
-        }}
-        
-        .race-label {{
-            text-align: center;
-            font-size: 1.2rem;
-            font-weight: bold;
-            margin-bottom: 20px;
-            color: white;
-            text-shadow: 0 2px 4px rgba(0,0,0,0.3);
-        }}
-        
-        .race-track {{
-            position: relative;
-            height: 150px;
-            background: linear-gradient(to right, #4CAF50 0%, #8BC34A 25%, #CDDC39 50%, #FFC107 75%, #FF5722 100%);
-            border-radius: 60px;
-            margin: 0;
-            overflow: visible;
-            box-shadow: inset 0 4px 8px rgba(0,0,0,0.2), 0 4px 12px rgba(0,0,0,0.3);
-        }}
-        
-        .track-background {{
-            position: absolute;
-            top: 0;
-            left: 0;
-            right: 0;
-            bottom: 0;
-            background: repeating-linear-gradient(
-                90deg,
-                transparent 0px,
-                transparent 18px,
-                rgba(255,255,255,0.1) 18px,
-                rgba(255,255,255,0.1) 20px
-            );
-            border-radius: 60px;
-            overflow: hidden;
-        }}
-        
-        .track-line {{
-            position: absolute;
-            top: 0;
-            bottom: 0;
-            width: 3px;
-            background: rgba(255, 255, 255, 0.6);
-            box-shadow: 0 0 6px rgba(255,255,255,0.8);
-        }}
-        
-        .start-line {{ left: 5%; }}
-        .quarter-line {{ left: 25%; opacity: 0.5; }}
-        .half-line {{ left: 50%; }}
-        .three-quarter-line {{ left: 75%; opacity: 0.5; }}
-        .finish-line {{ left: 95%; }}
-        
-        .racer {{
-            position: absolute;
-            width: 50px;
-            height: 50px;
-            background: white;
-            border-radius: 50%;
-            display: flex;
-            flex-direction: column;
-            align-items: center;
-            justify-content: center;
-            transition: left 0.6s ease-out, transform 0.3s ease;
-            cursor: pointer;
-            box-shadow: 0 4px 12px rgba(0,0,0,0.3);
-            left: 2%;
-            z-index: 10;
-        }}
-        
-        .racer:hover {{
-            transform: scale(1.1);
-        }}
-        
-        .player-racer {{
-            top: 10px;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            border: 3px solid #FFD700;
-            z-index: 10;
-        }}
-        
-        .ai-racer {{
-            background: linear-gradient(135deg, #ff6b6b 0%, #feca57 100%);
-            border: 2px solid #ff4757;
-        }}
-        
-        #ai-racer-1 {{
-            top: 35px;
-            z-index: 8;
-        }}
-        
-        #ai-racer-2 {{
-            top: 60px;
-            z-index: 9;
-        }}
-        
-        .racer-character {{
-            font-size: 1.5rem;
-            line-height: 1;
-            animation: bounce 1s infinite alternate;
-        }}
-        
-        .racer-label {{
-            position: absolute;
-            bottom: -25px;
-            left: 50%;
-            transform: translateX(-50%);
-            font-size: 0.75rem;
-            font-weight: bold;
-            color: white;
-            background: rgba(0,0,0,0.7);
-            padding: 2px 6px;
-            border-radius: 8px;
-            white-space: nowrap;
-            text-shadow: none;
-        }}
-        
-        .racer-progress {{
-            position: absolute;
-            top: -20px;
-            left: 50%;
-            transform: translateX(-50%);
-            font-size: 0.7rem;
-            font-weight: bold;
-            color: #FFD700;
-            background: rgba(0,0,0,0.8);
-            padding: 1px 4px;
-            border-radius: 6px;
-            text-shadow: none;
-        }}
-        
-        .finish-zone {{
-            position: absolute;
-            right: 0;
-            top: 0;
-            bottom: 0;
-            width: 60px;
-            display: flex;
-            flex-direction: column;
-            align-items: center;
-            justify-content: center;
-            background: linear-gradient(135deg, #FFD700 0%, #FFA500 100%);
-            border-top-right-radius: 60px;
-            border-bottom-right-radius: 60px;
-            border-top-left-radius: 0;
-            border-bottom-left-radius: 0;
-            z-index: 2;
-        }}
-        
-        .finish-flag {{
-            font-size: 1.5rem;
-            animation: wave 1s infinite ease-in-out;
-        }}
-        
-        .finish-text {{
-            font-size: 0.6rem;
-            font-weight: bold;
-            color: #333;
-            text-shadow: 0 1px 2px rgba(255,255,255,0.8);
-            transform: rotate(-90deg);
-            margin-top: 5px;
-        }}
-        
-        .race-stats {{
-            display: flex;
-            justify-content: center;
-            gap: 30px;
-            margin-top: 15px;
-            color: white;
-        }}
-        
-        .race-stat {{
-            text-align: center;
-            background: rgba(255, 255, 255, 0.1);
-            padding: 8px 15px;
-            border-radius: 15px;
-            border: 1px solid rgba(255, 255, 255, 0.2);
-        }}
-        
-        .race-stat .stat-label {{
-            font-size: 0.85rem;
-            opacity: 0.9;
-            margin-right: 5px;
-        }}
-        
-        /* Race Animations */
-        @keyframes bounce {{
-            0% {{ transform: translateY(0); }}
-            100% {{ transform: translateY(-3px); }}
-        }}
-        
-        @keyframes wave {{
-            0%, 100% {{ transform: rotate(-10deg); }}
-            50% {{ transform: rotate(10deg); }}
-        }}
-        
-        /* Circular Track for Survival Mode */
-        .race-track-section.circular-track {{
-            display: flex;
-            justify-content: center;
-            align-items: center;
-            padding: 40px;
-            /* Prevent container from affecting track shape */
-            flex-shrink: 0;
-        }}
-        
-        /* Infinite Mode Track for Sprint Mode */
-        .race-track-section.infinite-mode {{
-            background: linear-gradient(90deg, #667eea 0%, #764ba2 50%, #667eea 100%);
-            position: relative;
-        }}
-        
-        .race-track-section.infinite-mode::before {{
-            content: '⚡ TIME-BASED CHALLENGE ⚡';
-            position: absolute;
-            top: 10px;
-            left: 50%;
-            transform: translateX(-50%);
-            background: rgba(255, 215, 0, 0.9);
-            color: #333;
-            padding: 8px 16px;
-            border-radius: 20px;
-            font-size: 0.85rem;
-            font-weight: 600;
-            letter-spacing: 1px;
-            z-index: 10;
-        }}
-        
-        .race-track-section.infinite-mode .race-track {{
-            background: linear-gradient(90deg, 
-                transparent 0%, 
-                rgba(255,255,255,0.1) 10%, 
-                rgba(255,255,255,0.2) 50%, 
-                rgba(255,255,255,0.1) 90%, 
-                transparent 100%);
-            border: 2px dashed rgba(255, 215, 0, 0.6);
-        }}
-        
-        /* Steam Train Journey Visualization for Sprint Mode */
-        .race-track-section.steam-journey {{
-            /* Dynamic sky gradient based on time of day with smooth transitions */
-            background: var(--sky-gradient, var(--dawn-gradient));
-            transition: --sky-gradient 3s ease-in-out, background 2s ease-out;
-            padding: 20px;
-            height: 400px;
-            max-height: 400px;
-            position: relative;
-            overflow: hidden;
-        }}
-        
-        
-        /* Underground tunnel visualization */
-        .tunnel-container {{
-            display: flex;
-            justify-content: space-around;
-            align-items: flex-start;
-            padding: 60px 40px 20px;
-            height: 100%;
-            position: relative;
-            max-height: 240px; /* Constrain to fit in container */
-        }}
-        
-        .tunnel-shaft {{
-            width: 80px;
-            background: #4a4a4a;
-            border: 3px solid #333;
-            border-radius: 8px;
-            position: relative;
-            min-height: 50px;
-            transition: height 0.3s ease-out;
-            box-shadow: inset 0 0 20px rgba(0,0,0,0.5);
-        }}
-        
-        .tunnel-shaft::before {{
-            content: '';
-            position: absolute;
-            top: -20px;
-            left: 50%;
-            transform: translateX(-50%);
-            width: 60px;
-            height: 20px;
-            background: #90EE90;
-            border-radius: 50%;
-            border: 2px solid #6B8E23;
-        }}
-        
-        .fox-digger {{
-            position: absolute;
-            bottom: 10px; /* Position inside tunnel, not at the bottom */
-            left: 50%;
-            transform: translateX(-50%);
-            font-size: 2rem;
-            z-index: 5;
-            transition: all 0.3s ease;
-        }}
-        
-        .fox-digger.digging {{
-            animation: foxDigging 0.6s ease-in-out;
-        }}
-        
-        .fox-digger.idle {{
-            animation: foxBreathe 2s ease-in-out infinite;
-        }}
-        
-        /* Active digging animation */
-        @keyframes foxDigging {{
-            0% {{ 
-                transform: translateX(-50%) translateY(0) rotate(0deg);
-            }}
-            20% {{ 
-                transform: translateX(-50%) translateY(-8px) rotate(-10deg) scaleY(0.9);
-            }}
-            40% {{ 
-                transform: translateX(-50%) translateY(8px) rotate(10deg) scaleY(1.1);
-            }}
-            60% {{ 
-                transform: translateX(-50%) translateY(-5px) rotate(-5deg) scaleY(0.95);
-            }}
-            80% {{ 
-                transform: translateX(-50%) translateY(3px) rotate(5deg) scaleY(1.05);
-            }}
-            100% {{ 
-                transform: translateX(-50%) translateY(0) rotate(0deg);
-            }}
-        }}
-        
-        /* Breathing animation when idle */
-        @keyframes foxBreathe {{
-            0%, 100% {{ 
-                transform: translateX(-50%) scale(1);
-            }}
-            50% {{ 
-                transform: translateX(-50%) scale(1.02);
-            }}
-        }}
-        
-        /* Deeper foxes appear smaller (perspective effect) */
-        .tunnel-shaft.depth-deep .fox-digger {{
-            font-size: 1.8rem;
-            bottom: 15px;
-        }}
-        
-        .tunnel-shaft.depth-very-deep .fox-digger {{
-            font-size: 1.6rem;
-            bottom: 20px;
-            animation: foxDigDeep 0.8s ease-in-out;
-        }}
-        
-        @keyframes foxDigDeep {{
-            0% {{ 
-                transform: translateX(-50%) translateY(0) rotate(0deg) scale(1);
-            }}
-            25% {{ 
-                transform: translateX(-50%) translateY(-10px) rotate(-15deg) scale(0.9) scaleY(0.8);
-            }}
-            50% {{ 
-                transform: translateX(-50%) translateY(10px) rotate(15deg) scale(1.1) scaleY(1.2);
-            }}
-            75% {{ 
-                transform: translateX(-50%) translateY(-5px) rotate(-8deg) scale(0.95);
-            }}
-            100% {{ 
-                transform: translateX(-50%) translateY(0) rotate(0deg) scale(1);
-            }}
-        }}
-        
-        .tunnel-depth {{
-            position: absolute;
-            bottom: -25px;
-            left: 50%;
-            transform: translateX(-50%);
-            background: rgba(255, 255, 255, 0.9);
-            color: #333;
-            padding: 4px 8px;
-            border-radius: 12px;
-            font-size: 0.8rem;
-            font-weight: 600;
-            min-width: 40px;
-            text-align: center;
-        }}
-        
-        .tunnel-player .tunnel-depth {{
-            background: rgba(34, 197, 94, 0.9);
-            color: white;
-        }}
-        
-        .tunnel-ai .tunnel-depth {{
-            background: rgba(239, 68, 68, 0.9);
-            color: white;
-        }}
-        
-        /* Dirt particles effect when digging */
-        @keyframes dirtFly {{
-            0% {{
-                opacity: 1;
-                transform: translate(0, 0) scale(1);
-            }}
-            100% {{
-                opacity: 0;
-                transform: translate(var(--fly-x), var(--fly-y)) scale(0.3);
-            }}
-        }}
-        
-        .dirt-particle {{
-            position: absolute;
-            width: 4px;
-            height: 4px;
-            background: #8B4513;
-            border-radius: 50%;
-            animation: dirtFly 0.6s ease-out forwards;
-            pointer-events: none;
-        }}
-        
-        /* Treasure animations */
-        @keyframes treasureFloat {{
-            0% {{
-                opacity: 0;
-                transform: translate(-50%, 0) scale(0);
-            }}
-            20% {{
-                opacity: 1;
-                transform: translate(-50%, -20px) scale(1.2);
-            }}
-            100% {{
-                opacity: 0;
-                transform: translate(-50%, -80px) scale(0.8);
-            }}
-        }}
-        
-        @keyframes treasureSlideIn {{
-            0% {{
-                opacity: 0;
-                transform: translateX(100px);
-            }}
-            20% {{
-                opacity: 1;
-                transform: translateX(0);
-            }}
-            80% {{
-                opacity: 1;
-                transform: translateX(0);
-            }}
-            100% {{
-                opacity: 0;
-                transform: translateX(-100px);
-            }}
-        }}
-        
-        /* Speech bubbles for tunnel mode */
-        .tunnel-speech {{
-            position: absolute;
-            top: -40px;
-            left: 50%;
-            transform: translateX(-50%);
-        }}
-        
-        /* Screen shake animation for deep digging */
-        @keyframes screenShake {{
-            0%, 100% {{ transform: translateX(0); }}
-            25% {{ transform: translateX(-2px); }}
-            75% {{ transform: translateX(2px); }}
-        }}
-        
-        /* Day/Night Cycle CSS Variables */
-        :root {{
-            /* Dawn (0-17%) */
-            --dawn-gradient: linear-gradient(180deg, 
-                #4a5568 0%, #667eea 20%, #f093fb 40%, #f5deb3 60%, #90EE90 80%, #654321 100%);
-            /* Morning (17-33%) */
-            --morning-gradient: linear-gradient(180deg, 
-                #87ceeb 0%, #f0e68c 20%, #90EE90 50%, #8FBC8F 80%, #654321 100%);
-            /* Midday (33-67%) */
-            --midday-gradient: linear-gradient(180deg, 
-                #87ceeb 0%, #87ceeb 30%, #90EE90 60%, #228B22 80%, #654321 100%);
-            /* Afternoon (67-83%) */
-            --afternoon-gradient: linear-gradient(180deg, 
-                #ff7f50 0%, #ffd700 20%, #90EE90 50%, #8B4513 80%, #654321 100%);
-            /* Dusk (83-92%) */
-            --dusk-gradient: linear-gradient(180deg, 
-                #4b0082 0%, #ff6347 30%, #ffa500 50%, #8B4513 70%, #2f4f4f 100%);
-            /* Night (92-100%) */
-            --night-gradient: linear-gradient(180deg, 
-                #191970 0%, #2f4f4f 40%, #1a1a1a 70%, #000000 100%);
-        }}
-        
-        .steam-journey-header {{
-            position: absolute;
-            top: 10px;
-            left: 50%;
-            transform: translateX(-50%);
-            background: rgba(255, 215, 0, 0.95);
-            color: #333;
-            padding: 8px 16px;
-            border-radius: 20px;
-            font-size: 0.9rem;
-            font-weight: 700;
-            letter-spacing: 1px;
-            z-index: 10;
-            box-shadow: 0 4px 12px rgba(0,0,0,0.3);
-            text-align: center;
-        }}
-        
-        .route-progress {{
-            font-size: 0.75rem;
-            font-weight: 600;
-            margin-top: 4px;
-            opacity: 0.8;
-            letter-spacing: 0.5px;
-        }}
-        
-        /* Winding Route Map */
-        .route-map {{
-            position: relative;
-            width: 100%;
-            height: 350px;
-            overflow: hidden;
-        }}
-        
-        .route-path {{
-            position: absolute;
-            width: 800px;
-            height: 600px;
-            top: -100px;
-            left: 50%;
-            transform: translateX(-50%);
-        }}
-        
-        /* SVG path for the winding route */
-        .train-route {{
-            fill: none;
-            stroke: #8B4513;
-            stroke-width: 8;
-            stroke-dasharray: 15, 5;
-            stroke-linecap: round;
-        }}
-        
-        .train-route-bg {{
-            fill: none;
-            stroke: #654321;
-            stroke-width: 12;
-            stroke-linecap: round;
-        }}
-        
-        /* Train locomotive on the route */
-        .train-locomotive {{
-            position: absolute;
-            width: 60px;
-            height: 40px;
-            background: linear-gradient(135deg, #2c3e50, #34495e);
-            border-radius: 8px;
-            border: 2px solid #1a252f;
-            box-shadow: 0 3px 10px rgba(0,0,0,0.4);
-            transition: transform 0.2s ease-out, left 0.1s linear, top 0.1s linear;
-            transform-origin: center center;
-            z-index: 5;
-            /* Start at the beginning of the route */
-            left: 50px;
-            top: 300px;
-            transform: translate(-50%, -50%);
-        }}
-        
-        .train-locomotive::before {{
-            content: '🚂';
-            position: absolute;
-            top: 50%;
-            left: 50%;
-            transform: translate(-50%, -50%) scaleX(-1);
-            font-size: 1.8rem;
-            z-index: 6;
-        }}
-        
-        .train-math-display {{
-            position: absolute;
-            background: rgba(255, 255, 255, 0.95);
-            border: 2px solid #4a90e2;
-            border-radius: 12px;
-            padding: 8px 12px;
-            font-size: 1.2rem;
-            font-weight: bold;
-            color: #333;
-            box-shadow: 0 4px 12px rgba(0,0,0,0.2);
-            z-index: 7;
-            pointer-events: none;
-            white-space: nowrap;
-            transform: translate(-50%, -100%);
-            font-family: 'Arial', sans-serif;
-        }}
-        
-        /* Steam Pressure Instrument Panel */
-        .instrument-panel {{
-            position: absolute;
-            bottom: 20px;
-            left: 20px;
-            z-index: 10;
-        }}
-        
-        .panel-frame {{
-            background: linear-gradient(135deg, #667eea, #764ba2);
-            border: 3px solid #5a67d8;
-            border-radius: 20px;
-            padding: 18px;
-            box-shadow: 
-                0 10px 30px rgba(102, 126, 234, 0.3),
-                inset 0 2px 8px rgba(255, 255, 255, 0.2);
-            position: relative;
-        }}
-        
-        .panel-background {{
-            position: absolute;
-            top: 6px;
-            left: 6px;
-            right: 6px;
-            bottom: 6px;
-            background: linear-gradient(45deg, #667eea, #764ba2);
-            border-radius: 12px;
-            border: 2px solid rgba(255, 255, 255, 0.1);
-        }}
-        
-        .pressure-gauge-container {{
-            position: relative;
-            z-index: 2;
-            text-align: center;
-        }}
-        
-        .pressure-gauge {{
-            display: block;
-            margin: 0 auto 10px auto;
-            filter: drop-shadow(0 2px 4px rgba(0, 0, 0, 0.3));
-        }}
-        
-        .gauge-background {{
-            filter: drop-shadow(0 1px 3px rgba(0, 0, 0, 0.4));
-        }}
-        
-        .gauge-progress {{
-            transition: stroke-dashoffset 0.5s ease-out;
-            filter: drop-shadow(0 0 8px rgba(231, 76, 60, 0.6));
-        }}
-        
-        .pressure-needle {{
-            transition: transform 0.5s ease-out;
-            transform-origin: 100px 100px;
-        }}
-        
-        .gauge-title {{
-            color: #ffffff;
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            font-size: 0.8rem;
-            font-weight: 700;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-            margin-bottom: 5px;
-            text-shadow: 0 2px 4px rgba(0, 0, 0, 0.3);
-        }}
-        
-        .gauge-value {{
-            color: #ffd700;
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            font-size: 0.9rem;
-            font-weight: 800;
-            text-shadow: 0 2px 4px rgba(0, 0, 0, 0.3);
-        }}
-        
-        /* Momentum gauge */
-        .momentum-display {{
-            position: absolute;
-            bottom: 20px;
-            left: 50%;
-            transform: translateX(-50%);
-            width: 200px;
-            z-index: 10;
-        }}
-        
-        .momentum-gauge {{
-            width: 100%;
-            height: 12px;
-            background: rgba(0,0,0,0.3);
-            border-radius: 6px;
-            border: 1px solid #333;
-            overflow: hidden;
-        }}
-        
-        .momentum-bar {{
-            height: 100%;
-            background: linear-gradient(90deg, #e74c3c 0%, #f39c12 30%, #27ae60 100%);
-            transition: width 0.3s ease-out;
-            width: 0%;
-        }}
-        
-        .momentum-label {{
-            text-align: center;
-            color: white;
-            font-size: 0.8rem;
-            font-weight: 600;
-            margin-top: 5px;
-            text-shadow: 1px 1px 2px rgba(0,0,0,0.8);
-        }}
-        
-        /* City stations along the route */
-        .train-station {{
-            position: absolute;
-            width: 20px;
-            height: 20px;
-            background: #8B4513;
-            border: 2px solid #654321;
-            border-radius: 50%;
-            transform: translate(-50%, -50%);
-            z-index: 4;
-        }}
-        
-        .train-station::after {{
-            content: attr(data-city);
-            position: absolute;
-            top: 25px;
-            left: 50%;
-            transform: translateX(-50%);
-            background: rgba(0,0,0,0.7);
-            color: white;
-            padding: 2px 6px;
-            border-radius: 8px;
-            font-size: 0.7rem;
-            white-space: nowrap;
-            font-weight: 600;
-        }}
-        
-        .train-station.active {{
-            background: #ffd700;
-            border-color: #ffb347;
-            animation: stationPulse 1s ease-in-out infinite alternate;
-        }}
-        
-        @keyframes stationPulse {{
-            0% {{ transform: translate(-50%, -50%) scale(1); }}
-            100% {{ transform: translate(-50%, -50%) scale(1.2); }}
-        }}
-        
-        /* Passenger car display */
-        .passenger-car {{
-            position: absolute;
-            bottom: 60px;
-            right: 20px;
-            background: rgba(255,255,255,0.9);
-            border-radius: 10px;
-            padding: 10px;
-            min-width: 150px;
-            box-shadow: 0 4px 12px rgba(0,0,0,0.3);
-        }}
-        
-        .passenger-car h4 {{
-            margin: 0 0 8px 0;
-            font-size: 0.9rem;
-            color: #333;
-        }}
-        
-        .passenger-list {{
-            display: flex;
-            flex-wrap: wrap;
-            gap: 5px;
-        }}
-        
-        .passenger {{
-            background: #667eea;
-            color: white;
-            padding: 2px 6px;
-            border-radius: 12px;
-            font-size: 0.7rem;
-            font-weight: 600;
-        }}
-        
-        .passenger.urgent {{
-            background: #e74c3c;
-            animation: passengerUrgent 1s ease-in-out infinite alternate;
-        }}
-        
-        @keyframes passengerUrgent {{
-            0% {{ opacity: 1; }}
-            100% {{ opacity: 0.6; }}
-        }}
-        
-        /* Coal shoveling animation - enhanced */
-        .coal-shoveler {{
-            position: absolute;
-            bottom: 80px;
-            left: 30px;
-            font-size: 2rem;
-            z-index: 6;
-            transition: all 0.3s ease;
-        }}
-        
-        .coal-shoveler.shoveling {{
-            animation: shoveling 0.8s ease-in-out;
-        }}
-        
-        @keyframes shoveling {{
-            0% {{ transform: rotate(0deg) scale(1); }}
-            20% {{ transform: rotate(-25deg) scale(0.9); }}
-            40% {{ transform: rotate(25deg) scale(1.2); filter: brightness(1.3); }}
-            60% {{ transform: rotate(-15deg) scale(1.1); }}
-            80% {{ transform: rotate(10deg) scale(1.05); }}
-            100% {{ transform: rotate(0deg) scale(1); }}
-        }}
-        
-        /* Coal particles effect */
-        .coal-particle {{
-            position: absolute;
-            background: #2c2c2c;
-            border-radius: 50%;
-            pointer-events: none;
-            z-index: 4;
-        }}
-        
-        @keyframes coalFly {{
-            0% {{
-                transform: translate(0, 0) scale(1);
-                opacity: 1;
-            }}
-            50% {{
-                transform: translate(-20px, -30px) scale(0.8);
-                opacity: 0.8;
-            }}
-            100% {{
-                transform: translate(-40px, -60px) scale(0.3);
-                opacity: 0;
-            }}
-        }}
-        
-        /* Steam puffs from locomotive */
-        .steam-puff {{
-            position: absolute;
-            background: rgba(255, 255, 255, 0.8);
-            border-radius: 50%;
-            pointer-events: none;
-            z-index: 3;
-        }}
-        
-        @keyframes steamRise {{
-            0% {{
-                transform: translate(0, 0) scale(0.5);
-                opacity: 0.9;
-            }}
-            50% {{
-                transform: translate(10px, -40px) scale(1.2);
-                opacity: 0.6;
-            }}
-            100% {{
-                transform: translate(20px, -80px) scale(2);
-                opacity: 0;
-            }}
-        }}
-        
-        /* Momentum bar flash effect */
-        .momentum-boost {{
-            animation: momentumBoost 0.8s ease-out;
-        }}
-        
-        @keyframes momentumBoost {{
-            0% {{ 
-                box-shadow: 0 0 0px rgba(40, 167, 69, 0.6);
-                transform: scale(1);
-            }}
-            30% {{ 
-                box-shadow: 0 0 20px rgba(40, 167, 69, 0.8);
-                transform: scale(1.05);
-            }}
-            100% {{ 
-                box-shadow: 0 0 5px rgba(40, 167, 69, 0.3);
-                transform: scale(1);
-            }}
-        }}
-        
-        /* Steam effects */
-        .steam-effect {{
-            position: absolute;
-            top: 10px;
-            left: 30px;
-            width: 8px;
-            height: 8px;
-            background: rgba(255,255,255,0.8);
-            border-radius: 50%;
-            animation: steamRise 2s ease-out infinite;
-            z-index: 3;
-        }}
-        
-        @keyframes steamRise {{
-            0% {{
-                opacity: 0.8;
-                transform: translateY(0) scale(0.5);
-            }}
-            100% {{
-                opacity: 0;
-                transform: translateY(-60px) scale(2);
-            }}
-        }}
-        
-        /* Geographical landmarks */
-        .landmark {{
-            position: absolute;
-            font-size: 1.5rem;
-            z-index: 2;
-            opacity: 0.7;
-        }}
-        
-        .landmark.mountain {{ font-size: 2rem; }}
-        .landmark.tree {{ font-size: 1.2rem; }}
-        .landmark.bridge {{ font-size: 1.8rem; }}
-        
-        /* Time of day indicator */
-        .time-display {{
-            position: absolute;
-            top: 20px;
-            right: 20px;
-            background: rgba(0,0,0,0.7);
-            color: white;
-            padding: 5px 10px;
-            border-radius: 15px;
-            font-size: 0.8rem;
-            font-weight: 600;
-        }}
-        
-        /* Hide linear track elements when in circular mode */
-        .race-track.circular .track-background,
-        .race-track.circular .track-line {{
-            display: none;
-        }}
-        
-        .race-track.circular {{
-            width: 400px;
-            height: 400px;
-            border-radius: 50%;
-            position: relative;
-            /* Maintain circular aspect ratio */
-            flex-shrink: 0;
-            aspect-ratio: 1 / 1;
-            /* Create donut shape with inner and outer borders */
-            background: 
-                radial-gradient(circle at center, transparent 35%, rgba(34, 197, 94, 0.2) 35%, rgba(34, 197, 94, 0.2) 65%, transparent 65%);
-            border: 6px solid rgba(34, 197, 94, 0.6);
-            box-shadow: 
-                inset 0 0 30px rgba(34, 197, 94, 0.3),
-                0 0 20px rgba(0,0,0,0.3);
-        }}
-        
-        /* Responsive circular track for smaller screens */
-        @media (max-width: 768px) {{
-            .race-track.circular {{
-                width: 300px;
-                height: 300px;
-            }}
-        }}
-        
-        @media (max-width: 480px) {{
-            .race-track.circular {{
-                width: 250px;
-                height: 250px;
-            }}
-        }}
-        
-        /* Inner donut hole */
-        .race-track.circular::before {{
-            content: '';
-            position: absolute;
-            top: 50%;
-            left: 50%;
-            width: 140px;
-            height: 140px;
-            background: rgba(0,0,0,0.1);
-            border: 4px solid rgba(34, 197, 94, 0.4);
-            border-radius: 50%;
-            transform: translate(-50%, -50%);
-            z-index: 1;
-        }}
-        
-        /* Position racers on circular track */
-        .race-track.circular .racer {{
-            position: absolute;
-            width: 40px;
-            height: 40px;
-            transition: all 0.6s ease-out;
-        }}
-        
-        /* Counteract rotation for speech bubbles on circular track */
-        .race-track.circular .racer .speech-bubble {{
-            transform: translateY(-50%) rotate(var(--counter-rotation, 0deg));
-        }}
-        
-        /* Speech Bubbles */
-        .speech-bubble {{
-            position: absolute;
-            top: -45px;
-            left: 60px;
-            transform: translateY(-50%);
-            z-index: 200;
-            opacity: 0;
-            visibility: hidden;
-            transition: all 0.4s ease;
-            pointer-events: none;
-        }}
-        
-        .speech-bubble.visible {{
-            opacity: 1;
-            visibility: visible;
-            animation: bubblePopIn 0.5s cubic-bezier(0.68, -0.55, 0.265, 1.55);
-        }}
-        
-        .bubble-content {{
-            background: white;
-            border-radius: 18px;
-            padding: 8px 12px;
-            min-width: 120px;
-            max-width: 200px;
-            font-size: 0.8rem;
-            font-weight: 600;
-            color: #2c3e50;
-            text-align: center;
-            line-height: 1.2;
-            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.15);
-            border: 2px solid #f0f2f5;
-            position: relative;
-        }}
-        
-        .bubble-content::before {{
-            content: '';
-            position: absolute;
-            top: -2px;
-            left: -2px;
-            right: -2px;
-            bottom: -2px;
-            border-radius: 20px;
-            background: linear-gradient(135deg, #4a90e2, #357abd);
-            z-index: -1;
-        }}
-        
-        .bubble-tail {{
-            position: absolute;
-            top: 50%;
-            left: -8px;
-            transform: translateY(-50%);
-            width: 0;
-            height: 0;
-            border: 8px solid transparent;
-            border-right-color: white;
-            z-index: 1;
-        }}
-        
-        .bubble-tail::before {{
-            content: '';
-            position: absolute;
-            top: -9px;
-            left: 2px;
-            width: 0;
-            height: 0;
-            border: 9px solid transparent;
-            border-right-color: #4a90e2;
-            z-index: -1;
-        }}
-        
-        /* Different bubble styles for different AI personalities */
-        #ai-racer-1 .bubble-content {{
-            background: linear-gradient(135deg, #ff6b6b, #feca57);
-            color: white;
-            border-color: #ff6b6b;
-        }}
-        
-        #ai-racer-1 .speech-bubble {{
-            left: -140px; /* Position behind the racer */
-            top: -10px; /* Align with ai-racer-1 which is at top: 35px */
-        }}
-        
-        #ai-racer-1 .bubble-tail {{
-            border-right-color: #ff6b6b;
-            left: auto;
-            right: -8px; /* Point from the right side */
-            border-right-color: transparent;
-            border-left-color: #ff6b6b;
-        }}
-        
-        #ai-racer-1 .bubble-tail::before {{
-            left: auto;
-            right: 2px;
-            border-right-color: transparent;
-            border-left-color: #ff6b6b;
-        }}
-        
-        #ai-racer-2 .speech-bubble {{
-            top: 15px; /* Align with ai-racer-2 which is at top: 60px */
-        }}
-        
-        #ai-racer-2 .bubble-content {{
-            background: linear-gradient(135deg, #4ecdc4, #44a08d);
-            color: white;  
-            border-color: #4ecdc4;
-        }}
-        
-        #ai-racer-2 .bubble-tail {{
-            border-right-color: #4ecdc4;
-        }}
-        
-        @keyframes bubblePopIn {{
-            0% {{ 
-                opacity: 0; 
-                transform: translateY(-50%) translateX(10px) scale(0.3);
-            }}
-            50% {{ 
-                opacity: 1; 
-                transform: translateY(-50%) translateX(-5px) scale(1.1);
-            }}
-            100% {{ 
-                opacity: 1; 
-                transform: translateY(-50%) translateX(0) scale(1);
-            }}
-        }}
-        
-        /* Player Race Animations */
-        .racer.tripped {{
-            animation: tripAndRecover 1.2s ease-out;
-        }}
-        
-        .racer.moving-backwards {{
-            animation: moveBackwards 0.8s ease-out;
-        }}
-        
-        @keyframes tripAndRecover {{
-            0% {{ transform: rotate(0deg) translateY(0px); }}
-            20% {{ transform: rotate(-15deg) translateY(8px); }}
-            40% {{ transform: rotate(-25deg) translateY(15px); }}
-            60% {{ transform: rotate(-20deg) translateY(12px); }}
-            80% {{ transform: rotate(-5deg) translateY(3px); }}
-            100% {{ transform: rotate(0deg) translateY(0px); }}
-        }}
-        
-        @keyframes moveBackwards {{
-            0% {{ transform: translateX(0px) scale(1); }}
-            30% {{ transform: translateX(-20px) scale(0.9); }}
-            60% {{ transform: translateX(-15px) scale(0.95); }}
-            100% {{ transform: translateX(0px) scale(1); }}
-        }}
-        
-        @keyframes raceFinish {{
-            0% {{ transform: scale(1) rotate(0deg); }}
-            50% {{ transform: scale(1.2) rotate(180deg); }}
-            100% {{ transform: scale(1) rotate(360deg); }}
-        }}
-        
-        .racer.winner {{
-            animation: raceFinish 1s ease-in-out;
-            border-color: #FFD700;
-            box-shadow: 0 0 20px #FFD700;
-        }}
-        
-        .racer.celebrating {{
-            animation: bounce 0.3s infinite alternate;
-        }}
-        
-        /* Special bounce for circular track that preserves rotation */
-        .race-track.circular .racer.celebrating {{
-            animation: circularBounce 0.3s infinite alternate;
-        }}
-        
-        @keyframes circularBounce {{
-            0% {{ 
-                transform: rotate(var(--racer-rotation, 0deg)) scale(1) translateY(0px);
-            }}
-            100% {{ 
-                transform: rotate(var(--racer-rotation, 0deg)) scale(1.1) translateY(-2px);
-            }}
-        }}
-        
-        /* Enhanced Feedback Area */
-        .complement-feedback-area {{
-            text-align: center;
-            background: white;
-            border-radius: 20px;
-            padding: 25px;
-            box-shadow: 0 10px 25px rgba(0,0,0,0.1);
-            margin-bottom: 30px;
-            position: relative;
-        }}
-        
-        .input-hint {{
-            font-size: 1.1rem;
-            color: #666;
-            opacity: 0.8;
-            margin-top: 10px;
-        }}
-        
-        /* Enhanced Game Style Buttons */
-        .style-buttons {{
-            display: flex;
-            flex-direction: column;
-            gap: 15px;
-            margin-top: 15px;
-        }}
-        
-        .game-style-btn {{
-            background: white;
-            border: 2px solid #e9ecef;
-            border-radius: 15px;
-            padding: 20px 25px;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            text-align: left;
-            width: 100%;
-            display: flex;
-            align-items: center;
-            gap: 20px;
-            box-shadow: 0 4px 12px rgba(0,0,0,0.08);
-            position: relative;
-            overflow: hidden;
-        }}
-        
-        .game-style-btn::before {{
-            content: '';
-            position: absolute;
-            top: 0;
-            left: -100%;
-            width: 100%;
-            height: 100%;
-            background: linear-gradient(90deg, transparent, rgba(255,255,255,0.4), transparent);
-            transition: left 0.6s;
-        }}
-        
-        .game-style-btn:hover {{
-            border-color: #667eea;
-            transform: translateY(-2px);
-            box-shadow: 0 8px 25px rgba(102, 126, 234, 0.15);
-        }}
-        
-        .game-style-btn:hover::before {{
-            left: 100%;
-        }}
-        
-        .game-style-btn.active {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            border-color: #667eea;
-            color: white;
-            box-shadow: 0 8px 25px rgba(102, 126, 234, 0.3);
-        }}
-        
-        .game-style-btn.active:hover {{
-            transform: translateY(-3px);
-            box-shadow: 0 12px 35px rgba(102, 126, 234, 0.4);
-        }}
-        
-        .game-style-btn.active::before {{
-            background: linear-gradient(90deg, transparent, rgba(255,255,255,0.2), transparent);
-        }}
-        
-        .style-icon {{
-            font-size: 2.5rem;
-            line-height: 1;
-            filter: drop-shadow(0 2px 4px rgba(0,0,0,0.1));
-            flex-shrink: 0;
-        }}
-        
-        .game-style-btn.active .style-icon {{
-            filter: drop-shadow(0 2px 4px rgba(0,0,0,0.3));
-        }}
-        
-        .style-content {{
-            flex: 1;
-        }}
-        
-        .style-title {{
-            font-size: 1.3rem;
-            font-weight: 700;
-            margin-bottom: 5px;
-            color: #333;
-        }}
-        
-        .game-style-btn.active .style-title {{
-            color: white;
-        }}
-        
-        .style-description {{
-            font-size: 0.95rem;
-            color: #666;
-            line-height: 1.4;
-            opacity: 0.9;
-        }}
-        
-        .game-style-btn.active .style-description {{
-            color: rgba(255, 255, 255, 0.9);
-        }}
-        
-        /* Hover effects for individual styles */
-        .game-style-btn[data-style="practice"]:not(.active):hover {{
-            border-color: #28a745;
-            box-shadow: 0 8px 25px rgba(40, 167, 69, 0.15);
-        }}
-        
-        .game-style-btn[data-style="sprint"]:not(.active):hover {{
-            border-color: #ffc107;
-            box-shadow: 0 8px 25px rgba(255, 193, 7, 0.15);
-        }}
-        
-        .game-style-btn[data-style="survival"]:not(.active):hover {{
-            border-color: #dc3545;
-            box-shadow: 0 8px 25px rgba(220, 53, 69, 0.15);
-        }}
-        
-        /* Enhanced Feedback */
-        .input-feedback {{
-            margin-top: 15px;
-            font-size: 1.2rem;
-            font-weight: 600;
-            min-height: 30px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            transition: all 0.3s ease;
-        }}
-        
-        .input-feedback.correct {{
-            color: #28a745;
-            animation: success 0.6s ease-out;
-        }}
-        
-        .input-feedback.incorrect {{
-            color: #dc3545;
-            animation: shake 0.6s ease-out;
-        }}
-        
-        .input-feedback.timeout {{
-            color: #ffc107;
-            animation: fadeIn 0.5s ease-out;
-        }}
-        
-        /* Adaptive Difficulty Feedback */
-        .adaptive-feedback {{
-            margin-top: 10px;
-            font-size: 0.95rem;
-            font-weight: 500;
-            min-height: 20px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            transition: all 0.4s ease;
-            opacity: 0.8;
-        }}
-        
-        .adaptive-feedback.learning {{
-            color: #17a2b8;
-            background: rgba(23, 162, 184, 0.1);
-            border-radius: 15px;
-            padding: 8px 16px;
-        }}
-        
-        .adaptive-feedback.struggling {{
-            color: #dc3545;
-            background: rgba(220, 53, 69, 0.1);
-            border-radius: 15px;
-            padding: 8px 16px;
-        }}
-        
-        .adaptive-feedback.mastered {{
-            color: #28a745;
-            background: rgba(40, 167, 69, 0.1);
-            border-radius: 15px;
-            padding: 8px 16px;
-        }}
-        
-        .adaptive-feedback.adapted {{
-            color: #6f42c1;
-            background: rgba(111, 66, 193, 0.1);
-            border-radius: 15px;
-            padding: 8px 16px;
-            animation: adaptivePulse 1s ease-out;
-        }}
-        
-        @keyframes adaptivePulse {{
-            0% {{ transform: scale(1); opacity: 0; }}
-            50% {{ transform: scale(1.05); opacity: 1; }}
-            100% {{ transform: scale(1); opacity: 0.8; }}
-        }}
-        
-        /* Animations */
-        @keyframes pulse {{
-            0%, 100% {{ transform: scale(1); }}
-            50% {{ transform: scale(1.05); }}
-        }}
-        
-        @keyframes glow {{
-            0% {{ box-shadow: 0 0 5px rgba(255, 255, 255, 0.5); }}
-            100% {{ box-shadow: 0 0 20px rgba(255, 255, 255, 0.8), 0 0 30px rgba(255, 255, 255, 0.6); }}
-        }}
-        
-        @keyframes bounceIn {{
-            0% {{ transform: scale(0.3) rotate(-10deg); opacity: 0; }}
-            50% {{ transform: scale(1.1) rotate(5deg); }}
-            100% {{ transform: scale(1) rotate(0deg); opacity: 1; }}
-        }}
-        
-        @keyframes bounce {{
-            0%, 100% {{ transform: translateY(0); }}
-            50% {{ transform: translateY(-10px); }}
-        }}
-        
-        @keyframes shimmer {{
-            0% {{ background-position: -200px 0; }}
-            100% {{ background-position: 200px 0; }}
-        }}
-        
-        /* Lapping Celebration Animations */
-        @keyframes lapCelebrationBounce {{
-            0% {{
-                transform: translateX(-50%) scale(0);
-                opacity: 0;
-                rotation: -10deg;
-            }}
-            30% {{
-                transform: translateX(-50%) scale(1.2);
-                opacity: 1;
-                rotation: 5deg;
-            }}
-            60% {{
-                transform: translateX(-50%) scale(0.95);
-                rotation: -2deg;
-            }}
-            100% {{
-                transform: translateX(-50%) scale(1);
-                opacity: 1;
-                rotation: 0deg;
-            }}
-        }}
-        
-        .lapping-celebration {{
-            animation: lappingPulse 1.5s ease-in-out;
-            transform-origin: center;
-        }}
-        
-        @keyframes lappingPulse {{
-            0%, 100% {{ transform: scale(1) rotate(0deg); }}
-            25% {{ transform: scale(1.3) rotate(-5deg); box-shadow: 0 0 25px #ffd700; }}
-            50% {{ transform: scale(1.1) rotate(5deg); box-shadow: 0 0 35px #ffd700; }}
-            75% {{ transform: scale(1.2) rotate(-3deg); box-shadow: 0 0 20px #ffd700; }}
-        }}
-        
-        /* Race Countdown */
-        .race-countdown {{
-            position: fixed;
-            top: 0;
-            left: 0;
-            width: 100vw;
-            height: 100vh;
-            background: rgba(0, 0, 0, 0.8);
-            display: none;
-            justify-content: center;
-            align-items: center;
-            z-index: 10000;
-            backdrop-filter: blur(5px);
-        }}
-        
-        .countdown-display {{
-            text-align: center;
-            color: white;
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-        }}
-        
-        .countdown-number {{
-            font-size: 15rem;
-            font-weight: 900;
-            line-height: 1;
-            text-shadow: 0 0 50px rgba(255, 255, 255, 0.5);
-            margin-bottom: 20px;
-            animation: countdownPulse 1s ease-out;
-        }}
-        
-        .countdown-text {{
-            font-size: 2rem;
-            font-weight: 600;
-            margin-bottom: 40px;
-            opacity: 0.9;
-        }}
-        
-        .countdown-go {{
-            font-size: 20rem;
-            font-weight: 900;
-            background: linear-gradient(135deg, #ff6b6b, #feca57, #48dbfb, #ff9ff3);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-            text-shadow: 0 0 50px rgba(255, 255, 255, 0.8);
-            animation: goAnimation 1s ease-out;
-        }}
-        
-        @keyframes countdownPulse {{
-            0% {{ 
-                transform: scale(0.5);
-                opacity: 0;
-            }}
-            20% {{ 
-                transform: scale(1.2);
-                opacity: 1;
-            }}
-            100% {{ 
-                transform: scale(1);
-                opacity: 1;
-            }}
-        }}
-        
-        @keyframes goAnimation {{
-            0% {{ 
-                transform: scale(0.3) rotate(-10deg);
-                opacity: 0;
-            }}
-            50% {{ 
-                transform: scale(1.2) rotate(5deg);
-                opacity: 1;
-            }}
-            100% {{ 
-                transform: scale(1) rotate(0deg);
-                opacity: 1;
-            }}
-        }}
+try:
+    import rcssmin
+except ImportError:
+    rcssmin = None
+
+
+
+# XML declaration and DOCTYPE at the start of an SVG file, which can't
+# appear inside inline HTML
+SVG_PROLOG_RE = re.compile(rb'\A\s*(?:<\?xml[^>]*\?>\s*)?(?:<!DOCTYPE[^>]*>\s*)?')
+
+# Threads used to read generated card SVGs back from disk
+SVG_READ_WORKERS = 8
+
+# Write buffer for the HTML page as it is streamed to disk
+HTML_WRITE_BUFFER = 1 << 20
+
+# Rendered card SVGs, reused across runs by generate_web_flashcards
+SVG_CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'soroban' / 'svg'
+
+# Scratch space for Typst's card SVGs, which are read back once and
+# discarded; tmpfs avoids disk writes where the system provides it
+SVG_SCRATCH_DIR = '/dev/shm' if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK) else None
+
+# Templates a card SVG is rendered from, for cache invalidation
+SVG_TEMPLATES = ('single-card-input.typ', 'single-card.typ', 'flashcards.typ')
+
+# Opening <span> tag for each palette color, so place-value numerals
+# don't format a style attribute per digit
+PALETTE_SPAN_OPENERS = {
+    name: tuple(f'<span style="color: {color};">' for color in colors)
+    for name, colors in COLOR_PALETTES.items()
+}
+
+# Markup for one flashcard in the web deck, as a bytes %-format taking
+# (number, index, SVG bytes, numeral HTML bytes); one format and one
+# write per card, with no template parsing in the loop
+CARD_HTML_TEMPLATE = b'''
+        <div class="flashcard" data-number="%d">
+            <div class="card-number">#%d</div>
+            <div class="abacus-container">
+                %b
+            </div>
+            <div class="numeral">%b</div>
+        </div>'''
+
+# Shown in place of a card whose SVG is missing
+ERROR_CARD_SVG = b'<svg width="300" height="200"><text x="150" y="100" text-anchor="middle" font-size="48">Error</text></svg>'
+
+
+def get_colored_numeral_html(number, config):
+    """Generate HTML for numeral with appropriate coloring based on configuration."""
+    # For web display, colored numerals are implied by any non-monochrome
+    # scheme, so the colored_numerals flag never changes the result
+    return _colored_numeral_html(
+        number,
+        config.get('color_scheme', 'monochrome'),
+        config.get('color_palette', 'default'),
+    )
+
+
+def _place_value_html(number, palette_name):
+    # Color each digit by its place value (right-to-left: rightmost is ones)
+    span_openers = PALETTE_SPAN_OPENERS.get(palette_name, PALETTE_SPAN_OPENERS['default'])
+    digits = str(number)
+    last = len(digits) - 1  # rightmost digit is place 0 (ones)
+    return ''.join(
+        span_openers[(last - i) % len(span_openers)] + digit + '</span>'
+        for i, digit in enumerate(digits)
+    )
+
+
+def _heaven_earth_html(number, palette_name):
+    # Use orange (heaven bead color)
+    return f'<span style="color: #F18F01;">{number}</span>'
+
+
+def _alternating_html(number, palette_name):
+    # For alternating, use blue for simplicity in web display
+    return f'<span style="color: #1E88E5;">{number}</span>'
+
+
+# Numeral HTML builders per color scheme; monochrome and unknown schemes
+# render the plain number
+_NUMERAL_HTML_HANDLERS = {
+    'place-value': _place_value_html,
+    'heaven-earth': _heaven_earth_html,
+    'alternating': _alternating_html,
+}
+
+
+@lru_cache(maxsize=8192)
+def _colored_numeral_html(number, color_scheme, palette_name):
+    """Numeral HTML for one number, memoized across cards and decks."""
+    handler = _NUMERAL_HTML_HANDLERS.get(color_scheme)
+    return handler(number, palette_name) if handler else str(number)
+
+
+def get_numeral_color(number, config):
+    """Get single color for numeral (kept for backwards compatibility with tests).""" 
+    # As above, any non-monochrome scheme implies colored numerals. The
+    # color depends only on the digit count, so that is the cache key
+    return _numeral_color(
+        config.get('color_scheme', 'monochrome'),
+        config.get('color_palette', 'default'),
+        len(str(number)),
+    )
+
+
+def _place_value_color(palette_name, digit_count):
+    # For single color (used by tests), return highest place value color
+    place_value_colors = COLOR_PALETTES.get(palette_name, COLOR_PALETTES['default'])
+    place_idx = digit_count - 1  # Most significant digit place
+    return place_value_colors[place_idx % len(place_value_colors)]
+
+
+# Single numeral color per color scheme; monochrome and unknown schemes use #333
+_NUMERAL_COLOR_HANDLERS = {
+    'place-value': _place_value_color,
+    'heaven-earth': lambda palette_name, digit_count: "#F18F01",
+    'alternating': lambda palette_name, digit_count: "#1E88E5",
+}
+
+
+@lru_cache(maxsize=256)
+def _numeral_color(color_scheme, palette_name, digit_count):
+    """Single numeral color for a numeral with digit_count digits, memoized."""
+    handler = _NUMERAL_COLOR_HANDLERS.get(color_scheme)
+    return handler(palette_name, digit_count) if handler else "#333"
+
+
+def read_svg_bytes(path):
+    """Read an SVG file as bytes, dropping its prolog in one regex pass."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    return SVG_PROLOG_RE.sub(b'', data, count=1).rstrip()
+
+
+def svg_cache_keys(numbers, web_config):
+    """Hash each card's number with its Typst inputs and template mtimes
+    
+    Only the settings passed to the card template are part of the key, so
+    decks that differ in range, order or page layout share cached cards.
+    A cached SVG is reused only while those settings and the templates it
+    was rendered from are unchanged. The shared part of the key is
+    serialized once per deck rather than once per card.
+    """
+    mtimes = [os.path.getmtime(TEMPLATES_DIR / name) for name in SVG_TEMPLATES]
+    settings = json.dumps([single_card_input_args(web_config), mtimes])
+    return [hashlib.sha256(f'{number}|{settings}'.encode('utf-8')).hexdigest() for number in numbers]
+
+
+def generate_card_svgs(numbers, config, cache_dir=None, as_bytes=False):
+    """Generate SVG content for each flashcard using existing Typst pipeline.
+    
+    With renderer set to 'fast' in config, fronts are drawn by svg_builder
+    instead. With cache_dir, cards rendered by an earlier run with the same
+    settings are read from the cache, and only the rest go through Typst.
+    With as_bytes, the SVGs are returned as UTF-8 bytes exactly as read,
+    ready to be written into the page without a decode and re-encode.
+    """
+    svgs = render_card_svgs(numbers, config, cache_dir)
+    if as_bytes:
+        return svgs
+    return {number: svg.decode('utf-8', 'replace') for number, svg in svgs.items()}
+
+
+def render_card_svgs(numbers, config, cache_dir):
+    """Render or load each card's front SVG as bytes; see generate_card_svgs."""
+    try:
+        from .generate import generate_cards_direct
+    except ImportError:
+        # Fallback for when running tests directly
+        from generate import generate_cards_direct
+    
+    # Configure for web-optimized SVGs
+    web_config = {
+        **config,
+        'card_width': '1.5in',  # Much smaller card = larger abacus relative to viewBox
+        'card_height': '1.5in',
+        'transparent': True,  # Transparent background for web
+        'scale_factor': 1.0   # Full size for web (was 0.8 - too small)
+    }
+    
+    # The fast renderer draws card fronts in Python, skipping Typst and
+    # the cache entirely
+    if config.get('renderer', 'typst') == 'fast':
+        return {number: render_soroban_svg(number, web_config).encode('utf-8') for number in numbers}
+    
+    card_data = {}
+    cache_paths = {}
+    if cache_dir is not None:
+        cache_dir = Path(cache_dir)
+        cache_prefix = os.path.join(cache_dir, '')
+        missing = []
+        for number, key in zip(numbers, svg_cache_keys(numbers, web_config)):
+            cache_path = f'{cache_prefix}{key}.svg'
+            try:
+                with open(cache_path, 'rb') as f:
+                    card_data[number] = f.read()
+            except OSError:
+                cache_paths[number] = cache_path
+                missing.append(number)
+        numbers = missing
+        if not numbers:
+            return card_data
+    
+    # Create temporary directory for SVG generation
+    with tempfile.TemporaryDirectory(dir=SVG_SCRATCH_DIR) as tmpdir:
+        tmpdir_path = Path(tmpdir)
+        svg_dir = tmpdir_path / 'svg_cards'
         
-        @keyframes rotate {{
-            from {{ transform: rotate(0deg); }}
-            to {{ transform: rotate(360deg); }}
-        }}
+        # Generate SVG files using existing pipeline
+        generated_files = generate_cards_direct(
+            numbers, web_config, svg_dir,
+            format='svg', separate_fronts_backs=True
+        )
         
-        @keyframes success {{
-            0% {{ transform: scale(0.8); opacity: 0; }}
-            50% {{ transform: scale(1.1); }}
-            100% {{ transform: scale(1); opacity: 1; }}
-        }}
+        # Read SVG contents; one directory scan replaces a stat per card
+        fronts_dir = svg_dir / 'fronts'
+        front_files = {}
+        if fronts_dir.is_dir():
+            front_files = {entry.name: entry.path for entry in os.scandir(fronts_dir)}
         
-        @keyframes shake {{
-            0%, 100% {{ transform: translateX(0); }}
-            25% {{ transform: translateX(-5px); }}
-            75% {{ transform: translateX(5px); }}
-        }}
+        found = []
+        for i, number in enumerate(numbers):
+            front_file = front_files.get(f'card_{i:03d}.svg')
+            if front_file is not None:
+                found.append((number, front_file))
+            else:
+                # Fallback if SVG generation failed
+                card_data[number] = f'<svg width="300" height="200"><text x="150" y="100" text-anchor="middle" font-size="48">{number}</text></svg>'.encode('utf-8')
+        
+        # Reads are I/O-bound, so overlap them on a small thread pool
+        if found:
+            with ThreadPoolExecutor(max_workers=SVG_READ_WORKERS) as pool:
+                svgs = pool.map(read_svg_bytes, [front_file for _, front_file in found])
+                for (number, _), svg in zip(found, svgs):
+                    card_data[number] = svg
+        
+        # Best effort: fallback SVGs are never cached, and an unwritable
+        # cache directory just means the next run renders again
+        if cache_paths and found:
+            try:
+                cache_dir.mkdir(parents=True, exist_ok=True)
+                for number, _ in found:
+                    with open(cache_paths[number], 'wb') as f:
+                        f.write(card_data[number])
+            except OSError:
+                pass
         
-        /* Responsive Design */
-        @media (max-width: 768px) {{
-            .equation-visual {{
-                gap: 15px;
-            }}
-            
-            .challenge-number,
-            .answer-display,
-            .target-number {{
-                font-size: 2.5rem;
-                padding: 15px 20px;
-            }}
-            
-            .answer-display {{
-                min-width: 80px;
-            }}
-            
-            .equation-symbol {{
-                font-size: 2rem;
-            }}
-            
+        return card_data
+
+
+# Print settings that override the deck config for the companion PDF.
+# Read-only so callers can't mutate the shared overrides.
+COMPANION_PDF_CONFIG = MappingProxyType({
+    'cards_per_page': 6,  # Standard 6 cards per page for printing
+    'show_cut_marks': True,  # Always show cut marks for printing
+    'show_registration': True,  # Always show registration marks
+    'paper_size': 'us-letter',  # Standard paper size
+    'orientation': 'portrait',  # Standard orientation
+    'margins': MappingProxyType({'top': '0.5in', 'bottom': '0.5in', 'left': '0.5in', 'right': '0.5in'}),
+    'gutter': '5mm'
+})
+
+
+def generate_companion_pdf(numbers, config, output_path):
+    """Generate a PDF version alongside the web flashcards for print functionality."""
+    
+    # Ensure output_path is a Path object
+    output_path = Path(output_path)
+    
+    # Use PDF-optimized config
+    pdf_config = {**config, **COMPANION_PDF_CONFIG}
+    
+    # Compile the input-driven template; only sys.inputs change per call,
+    # so no Typst source is generated or written
+    template_path = TEMPLATES_DIR / 'flashcards-input.typ'
+    input_args = []
+    for key, value in flashcards_typst_inputs(numbers, pdf_config).items():
+        input_args.extend(['--input', f'{key}={value}'])
+    
+    # Set up font path
+    font_args = []
+    if HAS_FONTS:
+        font_args = ['--font-path', str(FONTS_DIR)]
+    
+    # Compile with Typst - use absolute paths to ensure correct location
+    result = subprocess.run(
+        ['typst', 'compile'] + font_args + input_args + [str(template_path), str(output_path.resolve())],
+        capture_output=True,
+        text=True,
+        cwd=str(PROJECT_ROOT)
+    )
+    
+    if result.returncode != 0:
+        raise RuntimeError(f"Typst compilation failed: {result.stderr}")
+    
+    # Linearize PDF for web delivery
+    try:
+        linearized_path = output_path.with_name(f"{output_path.stem}_linearized.pdf")
+        result = subprocess.run(
+            ['qpdf', '--linearize', str(output_path), str(linearized_path)],
+            capture_output=True,
+            text=True
+        )
+        if result.returncode == 0:
+            linearized_path.replace(output_path)  # Replace original with linearized
+    except FileNotFoundError:
+        pass  # qpdf not available, skip linearization
+
+
+# Key examples for tutorial
+TUTORIAL_NUMBERS = (0, 1, 3, 5, 7, 9, 23, 67, 158, 456)
+
+# Arithmetic step examples
+ARITHMETIC_NUMBERS = (23, 27, 37, 47, 55, 75, 89, 85, 92, 84, 21)
+
+
+def generate_tutorial_svgs(config):
+    """Generate SVG content for tutorial examples."""
+    tutorial_svgs = generate_card_svgs(list(TUTORIAL_NUMBERS), config)
+    return tutorial_svgs
+
+def generate_arithmetic_svgs(config):
+    """Generate SVG content for arithmetic examples."""
+    arithmetic_svgs = generate_card_svgs(list(ARITHMETIC_NUMBERS), config)
+    return arithmetic_svgs
+
+# Page template for generate_web_flashcards, in str.format syntax
+WEB_HTML_TEMPLATE = r'''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Soroban Flashcards</title>
+    <style>
+        /* Per-deck settings read by the stylesheet below */
+        :root {{
+            --font-family: {font_family};
+            --font-size: {font_size};
+            --numeral-color: {numeral_color};
         }}
-        
     </style>
+{stylesheet}
 </head>
 <body>
     <div class="container">
@@ -7118,7 +1058,7 @@ def generate_web_flashcards(numbers, config, output_path):
         <div id="quiz-modal" class="modal">
             <div class="modal-content">
                 <div class="modal-header">
-                    <h2>Speed Memory Quiz</h2>
+                    <h2 class="modal-title">Speed Memory Quiz</h2>
                     <div class="modal-controls">
                         <button id="quiz-fullscreen-btn" class="fullscreen-btn" title="Toggle Fullscreen">⛶</button>
                         <button id="close-quiz-modal" class="close-btn">&times;</button>
@@ -7151,7 +1091,7 @@ def generate_web_flashcards(numbers, config, output_path):
             </div>
 
             <!-- Quiz Game Area (hidden initially) -->
-            <div id="quiz-game" class="quiz-game" style="display: none;">
+            <div id="quiz-game" class="quiz-game" hidden>
                 <div class="quiz-header">
                     <div class="quiz-progress">
                         <div class="progress-bar">
@@ -7239,7 +1179,7 @@ def generate_web_flashcards(numbers, config, output_path):
         <div id="sorting-modal" class="modal">
             <div class="modal-content">
                 <div class="modal-header">
-                    <h2>Card Sorting Challenge</h2>
+                    <h2 class="modal-title">Card Sorting Challenge</h2>
                     <div class="modal-controls">
                         <button id="sorting-fullscreen-btn" class="fullscreen-btn" title="Toggle Fullscreen">⛶</button>
                         <button id="close-sorting-modal" class="close-btn">&times;</button>
@@ -7293,14 +1233,14 @@ def generate_web_flashcards(numbers, config, output_path):
                 
                 <div class="sorting-game-layout">
                     <div class="available-cards-section">
-                        <h4>Available Cards</h4>
+                        <h4 class="sorting-heading">Available Cards</h4>
                         <div id="sorting-area" class="sorting-area">
                             <!-- Available cards will be shown here -->
                         </div>
                     </div>
                     
                     <div class="sorting-slots-section">
-                        <h4>Sorting Positions (Smallest → Largest)</h4>
+                        <h4 class="sorting-heading">Sorting Positions (Smallest → Largest)</h4>
                         <div id="position-slots" class="position-slots">
                             <!-- Position slots will be created here -->
                         </div>
@@ -7336,7 +1276,7 @@ def generate_web_flashcards(numbers, config, output_path):
         <div id="matching-modal" class="modal">
             <div class="modal-content">
                 <div class="modal-header">
-                    <h2>Matching Pairs Challenge</h2>
+                    <h2 class="modal-title">Matching Pairs Challenge</h2>
                     <div class="modal-controls">
                         <button id="matching-fullscreen-btn" class="fullscreen-btn" title="Toggle Fullscreen">⛶</button>
                         <button id="close-matching-modal" class="close-btn">&times;</button>
@@ -7477,7 +1417,7 @@ def generate_web_flashcards(numbers, config, output_path):
         <div id="complement-modal" class="modal">
             <div class="modal-content">
                 <div class="modal-header">
-                    <h2>Speed Complement Race</h2>
+                    <h2 class="modal-title">Speed Complement Race</h2>
                     <div class="modal-controls">
                         <button id="complement-fullscreen-btn" class="fullscreen-btn" title="Toggle Fullscreen">⛶</button>
                         <button id="close-complement-modal" class="close-btn">&times;</button>
@@ -8133,7 +2073,7 @@ def generate_web_flashcards(numbers, config, output_path):
             
             // Show quiz game section within modal
             this.hideQuizSections();
-            document.getElementById('quiz-game').style.display = 'block';
+            document.getElementById('quiz-game').hidden = false;
             document.getElementById('total-cards').textContent = this.quizCards.length;
             
             // Start with the first card
@@ -8493,7 +2433,7 @@ def generate_web_flashcards(numbers, config, output_path):
         
         parseAnswers(input) {{
             // Parse comma or space separated numbers
-            return input.split(/[,\\s]+/)
+            return input.split(/[,\s]+/)
                        .map(s => s.trim())
                        .filter(s => s.length > 0)
                        .map(s => parseInt(s))
@@ -8648,7 +2588,7 @@ def generate_web_flashcards(numbers, config, output_path):
         }}
         
         hideQuizSections() {{
-            document.getElementById('quiz-game').style.display = 'none';
+            document.getElementById('quiz-game').hidden = true;
             document.getElementById('quiz-input').style.display = 'none';
             document.getElementById('quiz-results').style.display = 'none';
         }}
@@ -12014,8 +5954,8 @@ def generate_web_flashcards(numbers, config, output_path):
                 '🔥 Pressure rising! Questions getting faster!',
                 '⚡ Heat turned up! Can you handle it?',
                 '🌪️ Intensity increasing! Stay focused!',
-                '🚀 Speed boost activated! Don\\'t crack!',
-                '💥 Maximum pressure! You\\'re in the zone!'
+                '🚀 Speed boost activated! Don\'t crack!',
+                '💥 Maximum pressure! You\'re in the zone!'
             ];
             
             const message = level < messages.length ? messages[level - 1] : messages[messages.length - 1];
@@ -12173,7 +6113,7 @@ def generate_web_flashcards(numbers, config, output_path):
                 title = 'GOLD MEDAL - RACE WINNER!';
                 
                 if (results.accuracy >= 90) {{
-                    feedback = 'PERFECT VICTORY! You won with outstanding accuracy. You\\'re a true complement champion!';
+                    feedback = 'PERFECT VICTORY! You won with outstanding accuracy. You\'re a true complement champion!';
                 }} else if (results.accuracy >= 75) {{
                     feedback = 'RACE WINNER! Great job beating the AI racers. Your speed gave you the edge!';
                 }} else {{
@@ -12190,7 +6130,7 @@ def generate_web_flashcards(numbers, config, output_path):
                 }} else if (results.accuracy >= 70) {{
                     feedback = 'Good race! Work on speed to beat those AI racers next time.';
                 }} else {{
-                    feedback = 'The AI won this round, but you\\'re improving! Focus on accuracy first, then speed.';
+                    feedback = 'The AI won this round, but you\'re improving! Focus on accuracy first, then speed.';
                 }}
             }} else {{
                 // For sprint/survival modes - determine position based on who's ahead at end
@@ -15058,13 +8998,119 @@ def generate_web_flashcards(numbers, config, output_path):
     <div id="particle-container" class="particle-container"></div>
 </body>
 </html>'''
+
+# Stylesheets shared by every page; kept as plain CSS on disk and read
+# once at import. The games stylesheet holds the modal and game rules,
+# which aren't needed to draw the page before a game is opened.
+STATIC_DIR = Path(__file__).parent / 'static'
+STYLESHEET_NAME = 'flashcards.css'
+GAMES_STYLESHEET_NAME = 'flashcards-games.css'
+FLASHCARDS_CSS = (STATIC_DIR / STYLESHEET_NAME).read_text(encoding='utf-8')
+GAMES_CSS = (STATIC_DIR / GAMES_STYLESHEET_NAME).read_text(encoding='utf-8')
+
+
+def minify_css(css):
+    """Minify css with rcssmin when it is installed."""
+    return rcssmin.cssmin(css) if rcssmin is not None else css
+
+
+# By default both stylesheets are inlined, in order, so each page is
+# self-contained. With inline_css off, pages link copies written next to
+# them instead, which browsers cache across pages and reloads; the games
+# stylesheet is preloaded so it doesn't block the first render.
+INLINE_STYLESHEET = f'    <style>\n{FLASHCARDS_CSS}{GAMES_CSS}    </style>'
+LINKED_STYLESHEET = f'''    <link rel="stylesheet" href="{STYLESHEET_NAME}">
+    <link rel="preload" href="{GAMES_STYLESHEET_NAME}" as="style" onload="this.onload=null;this.rel='stylesheet'">
+    <noscript><link rel="stylesheet" href="{GAMES_STYLESHEET_NAME}"></noscript>'''
+
+
+def template_parts(template):
+    """Parse a str.format template into (literal bytes, field) pairs."""
+    return tuple(
+        (literal.encode('utf-8'), field)
+        for literal, field, _, _ in string.Formatter().parse(template)
+    )
+
+
+# The page template is parsed and encoded once at import, so rendering
+# only interleaves values instead of rescanning every brace or
+# re-encoding the static markup
+WEB_HTML_PARTS = template_parts(WEB_HTML_TEMPLATE)
+
+
+def write_template(write, parts, values):
+    """Write pre-parsed template parts with the given field values.
+    
+    write takes bytes. Bytes values are written as they are and other
+    values are encoded from their str form. A callable value is called
+    with write, so large fields can be streamed in pieces instead of
+    being built as one string first.
+    """
+    for literal, field in parts:
+        write(literal)
+        if field is not None:
+            value = values[field]
+            if isinstance(value, bytes):
+                write(value)
+            elif callable(value):
+                value(write)
+            else:
+                write(str(value).encode('utf-8'))
+
+
+# Shown in the deck's settings summary
+COLOR_SCHEME_DESCRIPTIONS = {
+    'monochrome': 'All beads are the same color',
+    'place-value': 'Each place value (ones, tens, hundreds) has a different color',
+    'heaven-earth': 'Heaven beads (5-value) and earth beads (1-value) have different colors',
+    'alternating': 'Columns alternate between two colors'
+}
+
+# CSS units accepted on font_size; a bare number is taken as px
+FONT_SIZE_UNITS = ('px', 'pt', 'em', 'rem', '%')
+
+
+def generate_web_flashcards(numbers, config, output_path):
+    """Generate HTML file with flashcard layout."""
+    
+    # Generate SVG content for the cards and the tutorial and arithmetic
+    # examples together, so a number shared between them renders only once
+    unique_numbers = list(dict.fromkeys([*numbers, *TUTORIAL_NUMBERS, *ARITHMETIC_NUMBERS]))
+    print(f"Generating SVG content for {len(numbers)} cards and tutorial examples...")
+    card_svgs = generate_card_svgs(unique_numbers, config, cache_dir=SVG_CACHE_DIR, as_bytes=True)
+    tutorial_svgs = arithmetic_svgs = card_svgs
+    
+    def write_cards(write):
+        """Write each card's markup as it is rendered."""
+        for index, number in enumerate(numbers, 1):
+            svg = card_svgs.get(number, ERROR_CARD_SVG)
+            if not isinstance(svg, bytes):
+                svg = svg.encode('utf-8')
+            write(CARD_HTML_TEMPLATE % (
+                number, index, svg,
+                get_colored_numeral_html(number, config).encode('utf-8'),
+            ))
+    
+    color_scheme_description = COLOR_SCHEME_DESCRIPTIONS.get(
+        config.get('color_scheme', 'monochrome'),
+        'Monochrome color scheme'
+    )
+    
+    # Format font size for CSS
+    font_size = config.get('font_size', '48pt')
+    if not font_size.endswith(FONT_SIZE_UNITS):
+        font_size = font_size + 'px'  # Add px if no unit specified
+    
     
-    # Fill template
-    html_content = html_template.format(
+    inline_css = config.get('inline_css', True)
+    
+    # Template values; cards are streamed rather than formatted up front
+    values = dict(
+        stylesheet=INLINE_STYLESHEET if inline_css else LINKED_STYLESHEET,
         font_family=config.get('font_family', 'DejaVu Sans').replace('"', ''),
         font_size=font_size,
         numeral_color=get_numeral_color(numbers[0] if numbers else 0, config),
-        cards_html=''.join(cards_html),
+        cards_html=write_cards,
         color_scheme_description=color_scheme_description,
         bead_shape=config.get('bead_shape', 'diamond').capitalize(),
         card_count=len(numbers),
@@ -15095,9 +9141,15 @@ def generate_web_flashcards(numbers, config, output_path):
         arithmetic_svg_21=arithmetic_svgs.get(21, '<svg><text>Error</text></svg>')
     )
     
-    # Write HTML file
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    if not inline_css:
+        output_dir = Path(output_path).parent
+        (output_dir / STYLESHEET_NAME).write_text(minify_css(FLASHCARDS_CSS), encoding='utf-8')
+        (output_dir / GAMES_STYLESHEET_NAME).write_text(minify_css(GAMES_CSS), encoding='utf-8')
+    
+    # Stream the page to disk fragment by fragment, so the full HTML is
+    # never held in memory; the large buffer batches the small writes
+    with open(output_path, 'wb', buffering=HTML_WRITE_BUFFER) as f:
+        write_template(f.write, WEB_HTML_PARTS, values)
     
     print(f"Generated web flashcards: {output_path}")
     
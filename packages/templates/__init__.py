@@ -23,6 +23,7 @@ Example:
     ...     template_content = f.read()
 """
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Final
 
@@ -74,6 +75,7 @@ Example:
     >>> subprocess.run(cmd, check=True)
 """
 
+@lru_cache(maxsize=None)
 def get_template_path(filename: str) -> str:
     """Get the absolute path to a template file.
 
@@ -89,6 +91,11 @@ def get_template_path(filename: str) -> str:
     Raises:
         FileNotFoundError: If the requested template file doesn't exist
 
+    Note:
+        Existence is only checked the first time a template is found; later
+        lookups for the same filename are served from an in-memory cache.
+        Missing templates raise every time and are never cached.
+
     Example:
         >>> from soroban_templates import get_template_path
         >>> path = get_template_path('flashcards.typ')
@@ -100,6 +107,7 @@ def get_template_path(filename: str) -> str:
         raise FileNotFoundError(f"Template file '{filename}' not found in {_TEMPLATES_DIR}")
     return str(template_path)
 
+@lru_cache(maxsize=1)
 def verify_templates() -> bool:
     """Verify that all expected template files exist and are readable.
 
@@ -107,6 +115,9 @@ def verify_templates() -> bool:
     exist and contain expected content. Useful for debugging installation
     or deployment issues.
 
+    The templates are only read on the first successful call; the result
+    is cached for the lifetime of the process. Failures are not cached.
+
     Returns:
         True if all templates are verified successfully
 
@@ -65,8 +65,8 @@ def main():
     print("\n📄 Example 4: Loading Template Content")
     print("=====================================")
     if flashcards_exists:
-        with open(FLASHCARDS_TEMPLATE, 'r', encoding='utf-8') as f:
-            content = f.read()
+        # Read the whole template in one call
+        content = Path(FLASHCARDS_TEMPLATE).read_bytes().decode('utf-8')
 
         lines = content.splitlines()
         print(f"Template loaded: {len(lines)} lines, {len(content)} characters")
@@ -0,0 +1,98 @@
+// Input-based wrapper for single-card.typ
+// This template accepts parameters via Typst's --input system so the same
+// source can be compiled for every card with only number/side changing.
+// Passing "numbers" (comma-separated) instead renders every card in one
+// document, each as a front page followed by a back page
+
+#import "single-card.typ": generate-single-card
+
+// Parse input parameters with defaults
+#let number = if "number" in sys.inputs {
+  int(sys.inputs.number)
+} else { 0 }
+
+#let side = if "side" in sys.inputs {
+  sys.inputs.side
+} else { "front" }
+
+#let bead-shape = if "bead_shape" in sys.inputs {
+  sys.inputs.bead_shape
+} else { "diamond" }
+
+#let color-scheme = if "color_scheme" in sys.inputs {
+  sys.inputs.color_scheme
+} else { "monochrome" }
+
+#let color-palette = if "color_palette" in sys.inputs {
+  sys.inputs.color_palette
+} else { "default" }
+
+#let colored-numerals = if "colored_numerals" in sys.inputs {
+  sys.inputs.colored_numerals == "true"
+} else { false }
+
+#let hide-inactive-beads = if "hide_inactive_beads" in sys.inputs {
+  sys.inputs.hide_inactive_beads == "true"
+} else { false }
+
+#let show-empty-columns = if "show_empty_columns" in sys.inputs {
+  sys.inputs.show_empty_columns == "true"
+} else { false }
+
+#let columns = if "columns" in sys.inputs {
+  if sys.inputs.columns == "auto" { auto } else { int(sys.inputs.columns) }
+} else { auto }
+
+#let transparent = if "transparent" in sys.inputs {
+  sys.inputs.transparent == "true"
+} else { false }
+
+#let width = if "card_width" in sys.inputs {
+  eval(sys.inputs.card_width)
+} else { 3.5in }
+
+#let height = if "card_height" in sys.inputs {
+  eval(sys.inputs.card_height)
+} else { 2.5in }
+
+#let font-size = if "font_size" in sys.inputs {
+  eval(sys.inputs.font_size)
+} else { 48pt }
+
+#let font-family = if "font_family" in sys.inputs {
+  sys.inputs.font_family
+} else { "DejaVu Sans" }
+
+#let scale-factor = if "scale_factor" in sys.inputs {
+  float(sys.inputs.scale_factor)
+} else { 1.0 }
+
+// Call the single card function with parsed parameters
+#let card(number, side) = generate-single-card(
+  number,
+  side: side,
+  bead-shape: bead-shape,
+  color-scheme: color-scheme,
+  color-palette: color-palette,
+  colored-numerals: colored-numerals,
+  hide-inactive-beads: hide-inactive-beads,
+  show-empty-columns: show-empty-columns,
+  columns: columns,
+  transparent: transparent,
+  width: width,
+  height: height,
+  font-size: font-size,
+  font-family: font-family,
+  scale-factor: scale-factor
+)
+
+#if "numbers" in sys.inputs {
+  for n in sys.inputs.numbers.split(",").map(s => int(s.trim())) {
+    for s in ("front", "back") {
+      pagebreak(weak: true)
+      card(n, s)
+    }
+  }
+} else {
+  card(number, side)
+}
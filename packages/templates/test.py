@@ -7,6 +7,8 @@ Tests Python interface and file integrity
 
 import sys
 import os
+import stat
+from functools import lru_cache
 from pathlib import Path
 from typing import Callable, Any
 
@@ -21,6 +23,12 @@ from __init__ import (
     verify_templates
 )
 
+# Read each template at most once and share the text across tests;
+# decoding doubles as the UTF-8 check
+@lru_cache(maxsize=None)
+def _template_text(path: str) -> str:
+    return Path(path).read_bytes().decode('utf-8')
+
 # Test framework
 class TestRunner:
     def __init__(self):
@@ -33,28 +41,27 @@ class TestRunner:
         self.tests.append((name, test_func))
 
     def assert_true(self, condition: bool, message: str):
-        """Assert that condition is true"""
+        """Assert that condition is true; output is only printed on failure"""
         self.test_count += 1
         if condition:
             self.passed_tests += 1
-            print(f"  ✅ {message}")
         else:
             print(f"  ❌ {message}")
             raise AssertionError(f"Assertion failed: {message}")
 
     def assert_equal(self, actual: Any, expected: Any, message: str):
         """Assert that two values are equal"""
-        self.assert_true(
-            actual == expected,
-            f"{message} (expected: {expected}, got: {actual})"
-        )
+        if actual == expected:
+            self.assert_true(True, message)
+        else:
+            self.assert_true(False, f"{message} (expected: {expected}, got: {actual})")
 
     def assert_contains(self, content: str, substring: str, message: str):
         """Assert that content contains substring"""
-        self.assert_true(
-            substring in content,
-            f"{message} (should contain: {substring})"
-        )
+        if substring in content:
+            self.assert_true(True, message)
+        else:
+            self.assert_true(False, f"{message} (should contain: {substring})")
 
     def run_tests(self):
         """Execute all registered tests"""
@@ -63,9 +70,10 @@ class TestRunner:
 
         for name, test_func in self.tests:
             print(f"🔍 {name}")
+            passed_before = self.passed_tests
             try:
                 test_func()
-                print("")
+                print(f"  ✅ {self.passed_tests - passed_before} assertions passed\n")
             except Exception as error:
                 print(f"  💥 Test failed: {error}\n")
                 sys.exit(1)
@@ -95,32 +103,29 @@ runner.test("Package Structure Validation", test_package_structure)
 
 # Test: File Existence and Properties
 def test_file_existence():
-    runner.assert_true(os.path.exists(FLASHCARDS_TEMPLATE),
+    runner.assert_true(Path(FLASHCARDS_TEMPLATE).exists(),
                       "flashcards.typ file should exist")
-    runner.assert_true(os.path.exists(SINGLE_CARD_TEMPLATE),
+    runner.assert_true(Path(SINGLE_CARD_TEMPLATE).exists(),
                       "single-card.typ file should exist")
 
-    flashcards_path = Path(FLASHCARDS_TEMPLATE)
-    single_card_path = Path(SINGLE_CARD_TEMPLATE)
-
-    runner.assert_true(flashcards_path.is_file(),
+    # One stat per file covers both the type and size checks
+    flashcards_stat = Path(FLASHCARDS_TEMPLATE).stat()
+    single_card_stat = Path(SINGLE_CARD_TEMPLATE).stat()
+    runner.assert_true(stat.S_ISREG(flashcards_stat.st_mode),
                       "flashcards.typ should be a file")
-    runner.assert_true(single_card_path.is_file(),
+    runner.assert_true(stat.S_ISREG(single_card_stat.st_mode),
                       "single-card.typ should be a file")
-    runner.assert_true(flashcards_path.stat().st_size > 1000,
+    runner.assert_true(flashcards_stat.st_size > 1000,
                       "flashcards.typ should be substantial (>1KB)")
-    runner.assert_true(single_card_path.stat().st_size > 1000,
+    runner.assert_true(single_card_stat.st_size > 1000,
                       "single-card.typ should be substantial (>1KB)")
 
 runner.test("Template File Existence", test_file_existence)
 
 # Test: Template Content Validation
 def test_template_content():
-    with open(FLASHCARDS_TEMPLATE, 'r', encoding='utf-8') as f:
-        flashcards_content = f.read()
-
-    with open(SINGLE_CARD_TEMPLATE, 'r', encoding='utf-8') as f:
-        single_card_content = f.read()
+    flashcards_content = _template_text(FLASHCARDS_TEMPLATE)
+    single_card_content = _template_text(SINGLE_CARD_TEMPLATE)
 
     runner.assert_contains(flashcards_content, 'draw-soroban',
                           "flashcards.typ should contain draw-soroban function")
@@ -184,6 +189,8 @@ def test_template_verification():
     # Should pass without errors
     result = verify_templates()
     runner.assert_equal(result, True, "verify_templates should return True for valid templates")
+    runner.assert_equal(verify_templates(), True,
+                       "verify_templates should return the cached result on repeat calls")
 
     # Test that it actually checks content
     runner.assert_true(callable(verify_templates),
@@ -200,8 +207,8 @@ def test_file_access():
                       "single-card.typ should have read permissions")
 
     # Test file size is reasonable
-    flashcards_size = os.path.getsize(FLASHCARDS_TEMPLATE)
-    single_card_size = os.path.getsize(SINGLE_CARD_TEMPLATE)
+    flashcards_size = Path(FLASHCARDS_TEMPLATE).stat().st_size
+    single_card_size = Path(SINGLE_CARD_TEMPLATE).stat().st_size
 
     runner.assert_true(1000 < flashcards_size < 100000,
                       f"flashcards.typ should have reasonable size (1KB-100KB), got {flashcards_size} bytes")
@@ -212,13 +219,9 @@ runner.test("File Access and Permissions", test_file_access)
 
 # Test: Encoding and Character Set
 def test_encoding():
-    # Test UTF-8 encoding
-    with open(FLASHCARDS_TEMPLATE, 'r', encoding='utf-8') as f:
-        flashcards_content = f.read()
-
-    with open(SINGLE_CARD_TEMPLATE, 'r', encoding='utf-8') as f:
-        single_card_content = f.read()
-
+    # Test UTF-8 encoding (decoding raises UnicodeDecodeError otherwise)
+    flashcards_content = _template_text(FLASHCARDS_TEMPLATE)
+    single_card_content = _template_text(SINGLE_CARD_TEMPLATE)
     runner.assert_true(isinstance(flashcards_content, str),
                       "flashcards.typ should decode as valid UTF-8")
     runner.assert_true(isinstance(single_card_content, str),
@@ -2,11 +2,14 @@
 
 import pytest
 import json
+import os
 import yaml
 import tempfile
 from pathlib import Path
 
-from generate import load_config, parse_range
+import random
+
+from generate import load_config, parse_range, number_range, shuffle_numbers
 
 
 class TestConfigLoading:
@@ -42,6 +45,45 @@ class TestConfigLoading:
         loaded = load_config(str(config_file))
         assert loaded == config_data
     
+    def test_yaml_config_sidecar_cache(self, temp_dir):
+        """Test that parsed YAML is cached and refreshed when the file changes."""
+        config_file = temp_dir / 'test.yaml'
+        with open(config_file, 'w') as f:
+            yaml.dump({'range': '0-9'}, f)
+        
+        assert load_config(str(config_file)) == {'range': '0-9'}
+        cache_file = temp_dir / 'test.yaml.cache.json'
+        assert cache_file.exists()
+        assert load_config(str(config_file)) == {'range': '0-9'}
+        
+        # Rewriting the YAML with a new mtime invalidates the sidecar
+        with open(config_file, 'w') as f:
+            yaml.dump({'range': '0-99'}, f)
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert load_config(str(config_file)) == {'range': '0-99'}
+    
+    def test_yaml_config_sidecar_skips_non_json_configs(self, temp_dir):
+        """Test that configs altered by a JSON round trip are not cached."""
+        config_file = temp_dir / 'test.yaml'
+        config_file.write_text('1: one\ncreated: 2024-01-02\n')
+        
+        config = load_config(str(config_file))
+        assert 1 in config
+        assert not (temp_dir / 'test.yaml.cache.json').exists()
+        assert load_config(str(config_file)) == config
+    
+    def test_yaml_config_sidecar_checks_size(self, temp_dir):
+        """Test that an edit keeping the same mtime still invalidates the sidecar."""
+        config_file = temp_dir / 'test.yaml'
+        config_file.write_text('range: 0-9\n')
+        stat = config_file.stat()
+        assert load_config(str(config_file)) == {'range': '0-9'}
+        
+        config_file.write_text('range: 0-999\n')
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert load_config(str(config_file)) == {'range': '0-999'}
+    
     def test_load_nonexistent_config(self):
         """Test handling of nonexistent config files."""
         with pytest.raises(FileNotFoundError):
@@ -101,6 +143,16 @@ class TestRangeParsing:
         result = parse_range('10-5')
         assert result == []
     
+    def test_parse_malformed_lists(self):
+        """Test that malformed lists are rejected rather than partially parsed."""
+        for bad in ['', '1,2,', '3-4-5', '1;2', '5-']:
+            with pytest.raises(ValueError):
+                parse_range(bad)
+    
+    def test_parse_whitespace(self):
+        """Test that whitespace around items and dashes is allowed."""
+        assert parse_range(' 1, 5 - 7 ,10 ') == [1, 5, 6, 7, 10]
+    
     def test_parse_large_range(self):
         """Test parsing large ranges."""
         result = parse_range('0-100', step=25)
@@ -114,6 +166,75 @@ class TestRangeParsing:
         assert result == expected
 
 
+class TestNumberRange:
+    """Test lazy range parsing used by the API."""
+    
+    def test_contiguous_range_is_lazy(self):
+        """Test that a single range returns a range object matching parse_range."""
+        result = number_range('0-100', step=5)
+        assert isinstance(result, range)
+        assert list(result) == parse_range('0-100', step=5)
+        assert list(result[:3]) == [0, 5, 10]
+    
+    def test_lists_fall_back_to_parse_range(self):
+        """Test that comma lists and single numbers return plain lists."""
+        assert number_range('1,5-7,10') == [1, 5, 6, 7, 10]
+        assert number_range('42') == [42]
+    
+    def test_matches_parse_range_validation(self):
+        """Test that the lazy path accepts and rejects the same strings as parse_range."""
+        assert number_range(' 5 - 7 ') == range(5, 8)
+        for bad in ['5-', '3-4-5', '1-5,', '+5-7', '1_0-20']:
+            with pytest.raises(ValueError):
+                number_range(bad)
+
+
+class TestShuffleNumbers:
+    """Test shuffling of parsed number lists."""
+    
+    def test_shuffle_contiguous_range(self):
+        """Test that contiguous ranges are sampled as a permutation."""
+        random.seed(42)
+        numbers = parse_range('0-99')
+        result = shuffle_numbers(numbers, '0-99')
+        assert sorted(result) == list(range(100))
+    
+    def test_shuffle_range_with_step(self):
+        """Test that the step is respected when sampling from a range."""
+        random.seed(42)
+        numbers = parse_range('0-20', step=5)
+        result = shuffle_numbers(numbers, '0-20', step=5)
+        assert sorted(result) == [0, 5, 10, 15, 20]
+    
+    def test_shuffle_range_with_whitespace(self):
+        """Test that ranges parse_range accepts with spaces are sampled too."""
+        numbers = parse_range(' 0 - 20 ')
+        result = shuffle_numbers(numbers, ' 0 - 20 ', rng=random.Random(1))
+        assert sorted(result) == list(range(21))
+    
+    def test_shuffle_comma_list(self):
+        """Test that comma-separated lists are shuffled in place."""
+        random.seed(42)
+        numbers = parse_range('1,5-7,10')
+        result = shuffle_numbers(numbers, '1,5-7,10')
+        assert sorted(result) == [1, 5, 6, 7, 10]
+    
+    def test_shuffle_is_deterministic_with_seed(self):
+        """Test that seeding produces the same order across runs."""
+        random.seed(7)
+        first = shuffle_numbers(parse_range('0-50'), '0-50')
+        random.seed(7)
+        second = shuffle_numbers(parse_range('0-50'), '0-50')
+        assert first == second
+    
+    def test_shuffle_with_local_generator(self):
+        """Test that a Random instance gives the same order for the same seed."""
+        first = shuffle_numbers(parse_range('0-50'), '0-50', rng=random.Random(3))
+        second = shuffle_numbers(parse_range('0-50'), '0-50', rng=random.Random(3))
+        assert first == second
+        assert sorted(first) == list(range(51))
+
+
 class TestConfigIntegration:
     """Integration tests for configuration handling."""
     
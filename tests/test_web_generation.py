@@ -9,7 +9,7 @@ from unittest.mock import patch, MagicMock
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
-from web_generator import generate_web_flashcards, get_numeral_color, generate_card_svgs
+from web_generator import generate_web_flashcards, get_numeral_color, generate_card_svgs, svg_cache_keys
 
 
 class TestWebGeneration:
@@ -92,7 +92,49 @@ class TestWebGeneration:
             assert len(result) == 2
             assert '<svg width="300" height="200"' in result[1]
             assert 'font-size="48"' in result[1]  # Fallback SVG
-    
+
+    @patch('generate.generate_cards_direct')
+    def test_generate_card_svgs_cache(self, mock_generate_cards_direct, sample_config, temp_dir):
+        """Test that cached SVGs are reused and only new cards are rendered."""
+        cache_dir = temp_dir / 'cache'
+        fronts_dir = temp_dir / 'svg_cards' / 'fronts'
+        fronts_dir.mkdir(parents=True)
+        (fronts_dir / 'card_000.svg').write_text('<svg><text>1</text></svg>')
+
+        with patch('tempfile.TemporaryDirectory') as mock_tempdir:
+            mock_tempdir.return_value.__enter__.return_value = str(temp_dir)
+
+            first = generate_card_svgs([1, 2], sample_config, cache_dir=cache_dir)
+            assert '<text>1</text>' in first[1]
+            assert 'font-size="48"' in first[2]  # Fallback SVG is not cached
+            assert len(list(cache_dir.iterdir())) == 1
+
+            mock_generate_cards_direct.reset_mock()
+            second = generate_card_svgs([1, 2], sample_config, cache_dir=cache_dir)
+            assert second[1] == first[1]
+            mock_generate_cards_direct.assert_called_once()
+            assert mock_generate_cards_direct.call_args[0][0] == [2]
+
+    @patch('generate.generate_cards_direct')
+    def test_generate_card_svgs_fast_renderer(self, mock_generate_cards_direct, sample_config):
+        """Test that the fast renderer draws fronts without invoking Typst."""
+        config = {**sample_config, 'renderer': 'fast', 'bead_shape': 'circle'}
+        result = generate_card_svgs([7, 42], config)
+        
+        mock_generate_cards_direct.assert_not_called()
+        assert result[7].startswith('<svg')
+        # One heaven and four earth beads per column
+        assert result[7].count('<circle') == 5
+        assert result[42].count('<circle') == 10
+        assert generate_card_svgs([7], config, as_bytes=True)[7] == result[7].encode('utf-8')
+
+    def test_svg_cache_keys_ignore_deck_settings(self, sample_config):
+        """Test that only card template inputs affect the SVG cache key."""
+        key = svg_cache_keys([5], sample_config)[0]
+        assert svg_cache_keys([5], {**sample_config, 'range': '0-99', 'shuffle': True})[0] == key
+        assert svg_cache_keys([5], {**sample_config, 'bead_shape': 'square'})[0] != key
+        assert svg_cache_keys([6], sample_config)[0] != key
+
     def test_generate_web_flashcards_structure(self, temp_dir, sample_config):
         """Test web flashcards HTML structure."""
         numbers = [7, 23]
@@ -174,6 +216,23 @@ class TestWebGeneration:
             assert 'Cards:</strong> 0' in content
             assert 'Range:</strong> 0' in content
     
+    def test_generate_web_flashcards_external_css(self, temp_dir, sample_config):
+        """Test that the stylesheet can be linked instead of inlined."""
+        output_file = temp_dir / 'linked.html'
+        
+        with patch('web_generator.generate_card_svgs') as mock_svg_gen:
+            mock_svg_gen.return_value = {3: '<svg><rect></rect></svg>'}
+            
+            generate_web_flashcards([3], {**sample_config, 'inline_css': False}, output_file)
+            content = output_file.read_text()
+            
+            assert '<link rel="stylesheet" href="flashcards.css">' in content
+            stylesheet = (temp_dir / 'flashcards.css').read_text()
+            assert '.abacus-container' in stylesheet
+            assert stylesheet not in content
+            assert 'href="flashcards-games.css" as="style"' in content
+            assert '.modal-content' in (temp_dir / 'flashcards-games.css').read_text()
+    
     def test_web_flashcards_responsive_design(self, temp_dir, sample_config):
         """Test that responsive CSS is included."""
         numbers = [1]